@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+from typing import Protocol
+import zlib
+
+import zstandard
+
+from app.core.http_metrics import ASGIApp, Message, Receive, Scope, Send
+
+# ─────────────────────────────────────────────────────────────
+# 응답 압축 (순수 ASGI 미들웨어)
+# - Accept-Encoding에 따라 zstd(더 빠름) → gzip 순으로 선택
+# - 단일 본문: min_size 미만이면 그대로, 이상이면 통째로 압축(Content-Length 재계산)
+# - 스트리밍 본문(StreamingResponse/SSE): 청크마다 압축 후 flush → 첫 바이트 지연 없음
+# - 이미 압축된 콘텐츠(이미지/동영상/압축 파일)나 Content-Encoding이 있는 응답은 건너뜀
+# ─────────────────────────────────────────────────────────────
+_INCOMPRESSIBLE_PREFIXES = (b"image/", b"video/", b"audio/", b"font/woff")
+_INCOMPRESSIBLE_TYPES = frozenset(
+    {
+        b"application/zip",
+        b"application/gzip",
+        b"application/x-gzip",
+        b"application/zstd",
+        b"application/x-7z-compressed",
+        b"application/x-bzip2",
+        b"application/pdf",
+        b"application/octet-stream",
+    }
+)
+
+
+class _Encoder(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+    def flush(self) -> bytes: ...
+    def finish(self) -> bytes: ...
+
+
+class _GzipEncoder:
+    def __init__(self, level: int) -> None:
+        # wbits 16+15: gzip 헤더/트레일러
+        self._z = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._z.compress(data)
+
+    def flush(self) -> bytes:
+        # 지금까지 받은 데이터를 바이트 경계까지 내보냄(스트림은 계속)
+        return self._z.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._z.flush(zlib.Z_FINISH)
+
+
+class _ZstdEncoder:
+    def __init__(self, level: int) -> None:
+        self._z = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._z.compress(data)
+
+    def flush(self) -> bytes:
+        return self._z.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._z.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+def _accepted(accept_encoding: bytes) -> set[bytes]:
+    out = set()
+    for part in accept_encoding.lower().split(b","):
+        token, _, params = part.partition(b";")
+        params = params.replace(b" ", b"")
+        if params.startswith(b"q="):
+            try:
+                if float(params[2:]) == 0:
+                    continue
+            except ValueError:
+                continue
+        out.add(token.strip())
+    return out
+
+
+def _is_compressible(content_type: bytes) -> bool:
+    ct = content_type.split(b";", 1)[0].strip().lower()
+    if ct == b"image/svg+xml":
+        return True
+    return ct not in _INCOMPRESSIBLE_TYPES and not ct.startswith(_INCOMPRESSIBLE_PREFIXES)
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        min_size: int,
+        gzip_level: int,
+        zstd_level: int,
+    ) -> None:
+        self.app = app
+        self.min_size = min_size
+        self.gzip_level = gzip_level
+        self.zstd_level = zstd_level
+
+    def _choose(self, scope: Scope) -> bytes | None:
+        for name, value in scope["headers"]:
+            if name == b"accept-encoding":
+                accepted = _accepted(value)
+                if b"zstd" in accepted:
+                    return b"zstd"
+                if b"gzip" in accepted:
+                    return b"gzip"
+                return None
+        return None
+
+    def _encoder(self, coding: bytes) -> _Encoder:
+        if coding == b"zstd":
+            return _ZstdEncoder(self.zstd_level)
+        return _GzipEncoder(self.gzip_level)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        coding = self._choose(scope) if scope["type"] == "http" else None
+        if coding is None:
+            await self.app(scope, receive, send)
+            return
+        await self.app(scope, receive, _CompressingSend(self, coding, send))
+
+    def _should_compress(
+        self, status: int, headers: list[tuple[bytes, bytes]], body: bytes, more_body: bool
+    ) -> bool:
+        if status < 200 or status in (204, 304):
+            return False
+        content_length: int | None = None
+        for name, value in headers:
+            if name == b"content-encoding":
+                return False
+            if name == b"content-type" and not _is_compressible(value):
+                return False
+            if name == b"content-length":
+                content_length = int(value)
+        if not more_body:
+            return len(body) >= self.min_size
+        # 스트리밍: 길이를 모르면 압축, 알려진 길이가 작으면 그대로
+        return content_length is None or content_length >= self.min_size
+
+
+class _CompressingSend:
+    """
+    응답 1건의 send 래퍼: 시작 메시지를 첫 본문까지 보류했다가 압축 여부를 결정.
+    압축하지 않기로 하면 이후 메시지는 그대로 통과.
+    """
+
+    def __init__(self, middleware: CompressionMiddleware, coding: bytes, send: Send) -> None:
+        self.middleware = middleware
+        self.coding = coding
+        self.send = send
+        self.start: Message | None = None
+        self.encoder: _Encoder | None = None
+        self.passthrough = False
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+        elif self.passthrough:
+            await self.send(message)
+        elif message["type"] != "http.response.body":
+            # pathsend 등 본문 외 메시지: 압축하지 않고 그대로 전달
+            await self._pass_through(message)
+        elif self.encoder is None:
+            await self._first_body(message)
+        else:
+            await self._next_body(message)
+
+    async def _pass_through(self, message: Message) -> None:
+        if self.encoder is None and self.start is not None:
+            self.passthrough = True
+            await self.send(self.start)
+        await self.send(message)
+
+    async def _first_body(self, message: Message) -> None:
+        assert self.start is not None
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+        headers = self.start.get("headers", [])
+        if not self.middleware._should_compress(self.start["status"], headers, body, more_body):
+            await self._pass_through(message)
+            return
+
+        self.encoder = self.middleware._encoder(self.coding)
+        if not more_body:
+            # 단일 본문: 통째로 압축
+            data = self.encoder.compress(body) + self.encoder.finish()
+            self.start["headers"] = _rewrite_headers(headers, self.coding, len(data))
+            await self.send(self.start)
+            await self.send({"type": "http.response.body", "body": data})
+            return
+        self.start["headers"] = _rewrite_headers(headers, self.coding, None)
+        await self.send(self.start)
+        await self._next_body(message)
+
+    async def _next_body(self, message: Message) -> None:
+        # 스트리밍: 청크마다 압축 후 flush(마지막 청크는 스트림 종료)
+        assert self.encoder is not None
+        more_body: bool = message.get("more_body", False)
+        data = self.encoder.compress(message.get("body", b""))
+        data += self.encoder.flush() if more_body else self.encoder.finish()
+        if data or not more_body:
+            await self.send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+
+def _rewrite_headers(
+    headers: list[tuple[bytes, bytes]], coding: bytes, length: int | None
+) -> list[tuple[bytes, bytes]]:
+    out: list[tuple[bytes, bytes]] = []
+    vary: list[bytes] = []
+    for name, value in headers:
+        if name == b"content-length":
+            continue
+        if name == b"vary":
+            vary.append(value)
+            continue
+        if name == b"etag" and not value.startswith(b"W/"):
+            # 본문 바이트가 달라지므로 강한 검증자는 약한 검증자로
+            value = b"W/" + value
+        out.append((name, value))
+    out.append((b"content-encoding", coding))
+    out.append((b"vary", b", ".join([*vary, b"Accept-Encoding"])))
+    if length is not None:
+        out.append((b"content-length", str(length).encode("latin-1")))
+    return out
@@ -2,9 +2,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import os
+from typing import Any
 
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
+from tortoise.backends.base.config_generator import expand_db_url
 
 
 # ─────────────────────────────────────────────────────────────
@@ -30,7 +32,8 @@ def _getenv_float(name: str, default: float) -> float:
 # (선택) Tortoise ORM 설정: 사용한다면 import 해서 쓰고,
 # 사용하지 않으면 이 블록은 무시해도 됨.
 # ─────────────────────────────────────────────────────────────
-TORTOISE_ORM = {
+# connections.default는 settings 로드 후 tortoise_connection()으로 채움(풀 설정 포함)
+TORTOISE_ORM: dict[str, Any] = {
     "connections": {
         "default": os.getenv("TORTOISE_DSN"),
     },
@@ -85,6 +88,7 @@ class Settings(BaseSettings):
     """
     모든 설정은 .env에서만 읽는다.
     - 기본값 없음(필수): 누락 시 ValidationError
+      (단, 성능 튜닝 값은 운영 기본값을 둔다)
     - 초과 키 forbid, 대소문자 구분
     """
 
@@ -117,6 +121,9 @@ class Settings(BaseSettings):
             return [item.strip() for item in s.split(",") if item.strip()]
         return v
 
+    # 프리플라이트 결과 캐시 시간(Access-Control-Max-Age)
+    CORS_MAX_AGE_SEC: int = Field(86_400, alias="CORS_MAX_AGE_SEC", ge=0)
+
     # ─ Security (JWT) ─
     JWT_SECRET: str = Field(..., alias="JWT_SECRET")
     JWT_ALGORITHM: str = Field(..., alias="JWT_ALGORITHM")
@@ -131,6 +138,25 @@ class Settings(BaseSettings):
     DB_PORT: int = Field(..., alias="DB_PORT")
     DB_NAME: str = Field(..., alias="DB_NAME")
     TORTOISE_DSN: str = Field(..., alias="TORTOISE_DSN")
+    # 읽기 전용 복제본(미설정 시 모든 읽기는 primary)
+    TORTOISE_REPLICA_DSN: str | None = Field(None, alias="TORTOISE_REPLICA_DSN")
+
+    # ─ DB 연결 풀(Tortoise / 지연 생성 SQLAlchemy 공통) ─
+    DB_POOL_MIN_SIZE: int = Field(1, alias="DB_POOL_MIN_SIZE", ge=0)
+    DB_POOL_MAX_SIZE: int = Field(10, alias="DB_POOL_MAX_SIZE", ge=1)
+    # MySQL wait_timeout보다 짧게: 서버가 끊은 유휴 연결을 재사용하지 않도록
+    DB_POOL_RECYCLE_SEC: int = Field(1800, alias="DB_POOL_RECYCLE_SEC", ge=-1)
+    DB_CONNECT_TIMEOUT_SEC: float = Field(5.0, alias="DB_CONNECT_TIMEOUT_SEC", gt=0)
+    # 풀이 가득 찼을 때 연결을 기다리는 최대 시간(초과 시 타임아웃 카운트 후 예외)
+    DB_POOL_ACQUIRE_TIMEOUT_SEC: float = Field(10.0, alias="DB_POOL_ACQUIRE_TIMEOUT_SEC", gt=0)
+
+    # ─ DB 기동 ─
+    # 연결 재시도 횟수, 지수 백오프(base·2^(n-1), 상한 max) + jitter
+    DB_CONNECT_RETRY: int = Field(10, alias="DB_CONNECT_RETRY", ge=1)
+    DB_CONNECT_BACKOFF_BASE_SEC: float = Field(0.5, alias="DB_CONNECT_BACKOFF_BASE_SEC", gt=0)
+    DB_CONNECT_BACKOFF_MAX_SEC: float = Field(15.0, alias="DB_CONNECT_BACKOFF_MAX_SEC", gt=0)
+    # 기동 시 스키마 생성(로컬/테스트 전용, 운영 이미지는 기동 전 aerich upgrade로 migrations/ 적용)
+    DB_GENERATE_SCHEMAS: bool = Field(False, alias="DB_GENERATE_SCHEMAS")
 
     @property
     def database_url(self) -> str:
@@ -158,6 +184,99 @@ class Settings(BaseSettings):
     AI_MAX_TOKENS: int = Field(..., alias="AI_MAX_TOKENS")
     AI_TEMPERATURE: float = Field(..., alias="AI_TEMPERATURE")
 
+    # ─ Password hashing (bcrypt 워커 풀) ─
+    # 워커 수(동시에 실행되는 해시/검증 수), 대기열 상한(초과 시 503)
+    PASSWORD_HASH_WORKERS: int = Field(4, alias="PASSWORD_HASH_WORKERS", ge=1)
+    PASSWORD_HASH_MAX_QUEUE: int = Field(64, alias="PASSWORD_HASH_MAX_QUEUE", ge=0)
+    # bcrypt 비용: 고정값(0이면 시작 시 목표 검증 시간에 맞춰 보정)
+    PASSWORD_BCRYPT_ROUNDS: int = Field(0, alias="PASSWORD_BCRYPT_ROUNDS", ge=0, le=31)
+    PASSWORD_HASH_TARGET_MS: float = Field(250.0, alias="PASSWORD_HASH_TARGET_MS", gt=0)
+    # 일괄 가입용 해시 프로세스 수(0이면 CPU 수)
+    BULK_HASH_PROCESSES: int = Field(0, alias="BULK_HASH_PROCESSES", ge=0)
+
+    # ─ 사용자 일괄 가입(스트리밍 CSV/NDJSON) ─
+    # 청크 단위로 검증/중복검사/해시/INSERT, 오류 보고는 상한까지만 보관
+    USER_IMPORT_CHUNK_SIZE: int = Field(500, alias="USER_IMPORT_CHUNK_SIZE", ge=1)
+    USER_IMPORT_MAX_ERRORS: int = Field(1000, alias="USER_IMPORT_MAX_ERRORS", ge=0)
+    # 내보내기 1회 조회(키셋 청크) 행 수
+    USER_EXPORT_CHUNK_SIZE: int = Field(1000, alias="USER_EXPORT_CHUNK_SIZE", ge=1)
+
+    # ─ 인증 사용자 캐시(get_current_user) ─
+    USER_CACHE_SIZE: int = Field(10_000, alias="USER_CACHE_SIZE", ge=0)
+    USER_CACHE_TTL_SEC: float = Field(30.0, alias="USER_CACHE_TTL_SEC", ge=0)
+    USER_CACHE_NEGATIVE_TTL_SEC: float = Field(5.0, alias="USER_CACHE_NEGATIVE_TTL_SEC", ge=0)
+
+    # ─ 목록 total 캐시(쿼리 형태 → COUNT) / 전체 사용자 수 정확 카운터 재동기화 주기 ─
+    COUNT_CACHE_SIZE: int = Field(1024, alias="COUNT_CACHE_SIZE", ge=0)
+    COUNT_CACHE_TTL_SEC: float = Field(30.0, alias="COUNT_CACHE_TTL_SEC", ge=0)
+    USER_COUNT_RESYNC_SEC: float = Field(300.0, alias="USER_COUNT_RESYNC_SEC", gt=0)
+
+    # ─ 검증 완료 JWT 캐시(토큰 다이제스트 → 클레임, 항목은 토큰 exp에 만료) ─
+    TOKEN_CACHE_SIZE: int = Field(50_000, alias="TOKEN_CACHE_SIZE", ge=0)
+
+    # ─ 로그인 세션/리프레시 행 write-behind(기본 비활성) ─
+    #   버퍼가 프로세스 메모리에 있어 워커 1개(SERVER_WORKERS=1)에서만 사용 가능:
+    #   다른 워커로 간 리프레시 요청은 아직 기록되지 않은 행을 찾지 못함
+    AUTH_WRITE_BEHIND: bool = Field(False, alias="AUTH_WRITE_BEHIND")
+    AUTH_WRITE_BEHIND_MAX_ROWS: int = Field(200, alias="AUTH_WRITE_BEHIND_MAX_ROWS", ge=1)
+    AUTH_WRITE_BEHIND_INTERVAL_SEC: float = Field(0.5, alias="AUTH_WRITE_BEHIND_INTERVAL_SEC", gt=0)
+
+    # ─ 철회 JTI 동기화 주기(다른 워커의 로그아웃 반영 지연 상한) ─
+    REVOCATION_SYNC_INTERVAL_SEC: float = Field(5.0, alias="REVOCATION_SYNC_INTERVAL_SEC", gt=0)
+
+    # ─ API 키 인증(X-API-Key): 키 해시 캐시, last_used_at 일괄 기록 주기 ─
+    APIKEY_CACHE_SIZE: int = Field(10_000, alias="APIKEY_CACHE_SIZE", ge=0)
+    APIKEY_CACHE_TTL_SEC: float = Field(60.0, alias="APIKEY_CACHE_TTL_SEC", ge=0)
+    APIKEY_TOUCH_INTERVAL_SEC: float = Field(30.0, alias="APIKEY_TOUCH_INTERVAL_SEC", gt=0)
+
+    # ─ 만료 세션/리프레시 토큰 정리(백그라운드, PK 순 소배치 삭제) ─
+    PURGE_ENABLED: bool = Field(True, alias="PURGE_ENABLED")
+    PURGE_INTERVAL_SEC: float = Field(300.0, alias="PURGE_INTERVAL_SEC", gt=0)
+    PURGE_BATCH_SIZE: int = Field(500, alias="PURGE_BATCH_SIZE", ge=1)
+    PURGE_BATCH_PAUSE_SEC: float = Field(0.2, alias="PURGE_BATCH_PAUSE_SEC", ge=0)
+    PURGE_MAX_BATCHES_PER_RUN: int = Field(200, alias="PURGE_MAX_BATCHES_PER_RUN", ge=1)
+    # 철회된 리프레시 토큰은 재사용 탐지를 위해 이 기간 동안 보관
+    PURGE_REVOKED_RETENTION_HOURS: float = Field(168.0, alias="PURGE_REVOKED_RETENTION_HOURS", ge=0)
+
+    # ─ 로그인 스로틀링(토큰 버킷: 분당 충전량 / 버스트) ─
+    LOGIN_THROTTLE_ENABLED: bool = Field(True, alias="LOGIN_THROTTLE_ENABLED")
+    LOGIN_THROTTLE_MAX_KEYS: int = Field(100_000, alias="LOGIN_THROTTLE_MAX_KEYS", ge=1)
+    LOGIN_RATE_PER_IP_PER_MIN: float = Field(30.0, alias="LOGIN_RATE_PER_IP_PER_MIN", gt=0)
+    LOGIN_BURST_PER_IP: int = Field(10, alias="LOGIN_BURST_PER_IP", ge=1)
+    LOGIN_RATE_PER_USER_PER_MIN: float = Field(10.0, alias="LOGIN_RATE_PER_USER_PER_MIN", gt=0)
+    LOGIN_BURST_PER_USER: int = Field(5, alias="LOGIN_BURST_PER_USER", ge=1)
+
+    # ─ 운영 서버(python -m app.server) ─
+    # 워커 수(0이면 컨테이너 CPU 할당량 기준), 워커당 요청 상한(+jitter, 0이면 교체 안 함)
+    SERVER_WORKERS: int = Field(0, alias="SERVER_WORKERS", ge=0)
+    SERVER_MAX_REQUESTS: int = Field(10_000, alias="SERVER_MAX_REQUESTS", ge=0)
+    SERVER_MAX_REQUESTS_JITTER: int = Field(1_000, alias="SERVER_MAX_REQUESTS_JITTER", ge=0)
+    SERVER_BACKLOG: int = Field(2048, alias="SERVER_BACKLOG", ge=1)
+    # 로드밸런서 유휴 타임아웃(ALB 기본 60초)보다 길면 LB가 끊긴 연결을 재사용할 수 있음
+    SERVER_KEEPALIVE_SEC: int = Field(5, alias="SERVER_KEEPALIVE_SEC", ge=1)
+    # 워커당 동시 연결 상한(초과 시 503, 0이면 무제한)
+    SERVER_LIMIT_CONCURRENCY: int = Field(0, alias="SERVER_LIMIT_CONCURRENCY", ge=0)
+    SERVER_GRACEFUL_TIMEOUT_SEC: int = Field(30, alias="SERVER_GRACEFUL_TIMEOUT_SEC", ge=1)
+    SERVER_FORWARDED_ALLOW_IPS: str = Field("127.0.0.1", alias="SERVER_FORWARDED_ALLOW_IPS")
+    SERVER_ACCESS_LOG: bool = Field(False, alias="SERVER_ACCESS_LOG")
+
+    # ─ 메트릭 멀티 워커 집계: 워커별 값 파일 디렉터리(비우면 프로세스 단위), 기록 주기 ─
+    #   python -m app.server는 미설정 시 임시 디렉터리를 만들어 워커에 전달
+    METRICS_MULTIPROC_DIR: str = Field("", alias="METRICS_MULTIPROC_DIR")
+    METRICS_FLUSH_INTERVAL_SEC: float = Field(1.0, alias="METRICS_FLUSH_INTERVAL_SEC", gt=0)
+
+    # ─ 응답 압축(gzip, perf extra 설치 시 zstd 우선) ─
+    COMPRESSION_ENABLED: bool = Field(True, alias="COMPRESSION_ENABLED")
+    # 이보다 작은 단일 본문은 압축하지 않음(헤더/CPU 비용이 이득보다 큼)
+    COMPRESSION_MIN_SIZE: int = Field(1024, alias="COMPRESSION_MIN_SIZE", ge=0)
+    COMPRESSION_GZIP_LEVEL: int = Field(5, alias="COMPRESSION_GZIP_LEVEL", ge=1, le=9)
+    COMPRESSION_ZSTD_LEVEL: int = Field(3, alias="COMPRESSION_ZSTD_LEVEL", ge=1, le=22)
+
+    # ─ 준비 상태 점검(/health/ready): 결과 캐시 시간, DB 핑 타임아웃, 작업 연속 실패 허용치 ─
+    READINESS_CACHE_TTL_SEC: float = Field(2.0, alias="READINESS_CACHE_TTL_SEC", ge=0)
+    READINESS_DB_TIMEOUT_SEC: float = Field(1.0, alias="READINESS_DB_TIMEOUT_SEC", gt=0)
+    READINESS_MAX_TASK_FAILURES: int = Field(3, alias="READINESS_MAX_TASK_FAILURES", ge=1)
+
 
 def load_settings() -> Settings:
     # BaseSettings는 런타임에 .env로 채워지지만, mypy는 인자 미제공을 오류로 본다.
@@ -166,3 +285,27 @@ def load_settings() -> Settings:
 
 
 settings: Settings = load_settings()
+
+
+def tortoise_connection(dsn: str) -> str | dict[str, Any]:
+    """
+    MySQL DSN이면 풀 설정(Settings)을 얹고 계측 엔진(app.core.db_backend)으로 교체.
+    그 외 백엔드(SQLite 등)는 DSN 그대로 사용.
+    """
+    if not dsn.startswith("mysql://"):
+        return dsn
+    conn = expand_db_url(dsn)
+    conn["engine"] = "app.core.db_backend"
+    conn["credentials"].update(
+        minsize=settings.DB_POOL_MIN_SIZE,
+        maxsize=settings.DB_POOL_MAX_SIZE,
+        pool_recycle=settings.DB_POOL_RECYCLE_SEC,
+        connect_timeout=settings.DB_CONNECT_TIMEOUT_SEC,
+    )
+    return conn
+
+
+TORTOISE_ORM["connections"]["default"] = tortoise_connection(settings.TORTOISE_DSN)
+if settings.TORTOISE_REPLICA_DSN:
+    # 라우팅: app.core.db_routing.read_db
+    TORTOISE_ORM["connections"]["replica"] = tortoise_connection(settings.TORTOISE_REPLICA_DSN)
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+
+from app.core.http_metrics import ASGIApp, Message, Receive, Scope, Send
+
+# ─────────────────────────────────────────────────────────────
+# CORS 단일 계층 (순수 ASGI 미들웨어)
+# - 허용 Origin은 frozenset으로 미리 계산(요청당 O(1) 조회)
+# - Origin 헤더가 없는 요청(서버 간 호출/헬스체크)은 아무 작업 없이 통과
+# - 자격 증명(쿠키) 허용: Access-Control-Allow-Origin은 항상 요청 Origin을 그대로 반환
+# - 프리플라이트 응답에 Access-Control-Max-Age → 브라우저가 결과를 캐시해 재요청 감소
+#   (브라우저별 상한이 있음: Chromium 2시간, Firefox 24시간)
+# ─────────────────────────────────────────────────────────────
+ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+
+
+class CORSMiddleware:
+    def __init__(self, app: ASGIApp, *, allow_origins: Iterable[str], max_age: int) -> None:
+        self.app = app
+        origins = {o.rstrip("/") for o in allow_origins}
+        self.allow_all = "*" in origins
+        self.origins = frozenset(o.encode("latin-1") for o in origins - {"*"})
+        # 프리플라이트 공통 헤더(Origin/요청 헤더만 요청마다 추가)
+        self._preflight_headers: list[tuple[bytes, bytes]] = [
+            (b"access-control-allow-methods", ALLOW_METHODS),
+            (b"access-control-allow-credentials", b"true"),
+            (b"access-control-max-age", str(max_age).encode("latin-1")),
+            (b"vary", b"Origin"),
+            (b"content-length", b"0"),
+        ]
+
+    def is_allowed(self, origin: bytes) -> bool:
+        return self.allow_all or origin in self.origins
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = request_method = request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+        elif scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight(origin, request_headers, send)
+        elif self.is_allowed(origin):
+            await self.app(scope, receive, self._with_cors_headers(origin, send))
+        else:
+            await self.app(scope, receive, send)
+
+    @staticmethod
+    def _with_cors_headers(origin: bytes, send: Send) -> Send:
+        """응답 시작 메시지에 CORS 헤더를 붙이는 send"""
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = [(k, v) for k, v in message.get("headers", ()) if k != b"vary"]
+                vary = [v for k, v in message.get("headers", ()) if k == b"vary"]
+                headers += [
+                    (b"access-control-allow-origin", origin),
+                    (b"access-control-allow-credentials", b"true"),
+                    (b"vary", b", ".join([*vary, b"Origin"])),
+                ]
+                message["headers"] = headers
+            await send(message)
+
+        return send_with_cors
+
+    async def _preflight(self, origin: bytes, request_headers: bytes | None, send: Send) -> None:
+        if not self.is_allowed(origin):
+            body = b"Disallowed CORS origin"
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 400,
+                    "headers": [
+                        (b"content-type", b"text/plain; charset=utf-8"),
+                        (b"content-length", str(len(body)).encode("latin-1")),
+                        (b"vary", b"Origin"),
+                    ],
+                }
+            )
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        headers = [(b"access-control-allow-origin", origin), *self._preflight_headers]
+        if request_headers:
+            # allow_headers=["*"]와 동일: 요청한 헤더를 그대로 허용
+            headers.append((b"access-control-allow-headers", request_headers))
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": b""})
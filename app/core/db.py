@@ -1,19 +1,142 @@
-from collections.abc import AsyncGenerator
+from __future__ import annotations
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import asyncio
+from collections.abc import AsyncGenerator, Awaitable
+import time
+from typing import TYPE_CHECKING, Any, Protocol
 
+from app.core import metrics
 from app.core.config import settings
 
-mysql_dsn = (
-    "mysql+aiomysql://"
-    f"{settings.DB_USER}:{settings.DB_PASSWORD}"
-    f"@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}"
-    "?charset=utf8mb4"
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+# ─────────────────────────────────────────────────────────────
+# DB 연결 풀 단일 계층
+# - 기본 경로는 Tortoise(MySQL 풀 크기/recycle/타임아웃은 Settings → TORTOISE_ORM)
+# - 풀 획득을 계측: 대기 시간, 대기 중 요청 수, 획득 타임아웃 횟수
+# - SQLAlchemy 엔진은 실제로 쓰는 코드가 있을 때만 지연 생성(같은 풀 설정 적용)
+# ─────────────────────────────────────────────────────────────
+POOL_ACQUIRE_WAIT = metrics.summary(
+    "db_pool_acquire_wait_seconds", "Time spent waiting for a pooled DB connection"
+)
+POOL_ACQUIRE_TIMEOUTS = metrics.counter(
+    "db_pool_acquire_timeouts_total", "Pooled DB connection acquisitions that timed out"
 )
-engine = create_async_engine(mysql_dsn, pool_pre_ping=True)
-AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False, autoflush=False)
+
+
+class DriverPool(Protocol):
+    size: int
+    freesize: int
+    maxsize: int
+
+    def acquire(self) -> Awaitable[object]: ...
+
+
+class InstrumentedPool:
+    """드라이버 풀(aiomysql/asyncmy) 프록시: acquire만 계측하고 나머지는 위임"""
+
+    def __init__(self, name: str, pool: DriverPool, *, acquire_timeout: float) -> None:
+        self.name = name
+        self._pool = pool
+        self.acquire_timeout = acquire_timeout
+        self.waiting = 0
+        _pools[name] = self
+
+    async def acquire(self) -> object:
+        started = time.perf_counter()
+        self.waiting += 1
+        try:
+            return await asyncio.wait_for(self._pool.acquire(), timeout=self.acquire_timeout)
+        except TimeoutError:
+            POOL_ACQUIRE_TIMEOUTS.inc()
+            raise
+        finally:
+            self.waiting -= 1
+            POOL_ACQUIRE_WAIT.observe(time.perf_counter() - started)
+
+    def __getattr__(self, item: str) -> object:
+        return getattr(self._pool, item)
+
+    def stats(self) -> dict[str, int]:
+        size = int(self._pool.size)
+        idle = int(self._pool.freesize)
+        return {
+            "size": size,
+            "in_use": size - idle,
+            "idle": idle,
+            "max_size": int(self._pool.maxsize),
+            "waiting": self.waiting,
+        }
+
+
+_pools: dict[str, InstrumentedPool] = {}
+
+
+async def warm_up_pools() -> None:
+    """
+    설정된 모든 연결(primary/replica)에서 SELECT 1.
+    드라이버 풀이 생성되며 DB_POOL_MIN_SIZE개 연결을 미리 열고, 연결성도 함께 확인.
+    """
+    from tortoise import connections
+
+    await asyncio.gather(*(conn.execute_query("SELECT 1") for conn in connections.all()))
+
+
+def pool_stats() -> dict[str, Any]:
+    """오토스케일링/헬스체크용 풀 상태 스냅샷"""
+    wait = POOL_ACQUIRE_WAIT.snapshot()
+    out: dict[str, Any] = {
+        "pools": {name: p.stats() for name, p in _pools.items()},
+        "acquire_wait_seconds": wait,
+        "acquire_timeouts": POOL_ACQUIRE_TIMEOUTS.value,
+    }
+    if _engine is not None:
+        pool = _engine.pool
+        out["sqlalchemy"] = {
+            "size": pool.size(),  # type: ignore[attr-defined]
+            "checked_out": pool.checkedout(),  # type: ignore[attr-defined]
+            "idle": pool.checkedin(),  # type: ignore[attr-defined]
+            "overflow": pool.overflow(),  # type: ignore[attr-defined]
+        }
+    return out
+
+
+# ─────────────────────────────────────────────────────────────
+# (선택) SQLAlchemy — 지연 생성
+# ─────────────────────────────────────────────────────────────
+_engine: AsyncEngine | None = None
+_sessionmaker: async_sessionmaker[AsyncSession] | None = None
+
+
+def get_engine() -> AsyncEngine:
+    global _engine, _sessionmaker
+    if _engine is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        _engine = create_async_engine(
+            settings.database_url,
+            pool_pre_ping=True,
+            pool_size=settings.DB_POOL_MAX_SIZE,
+            max_overflow=0,
+            pool_recycle=settings.DB_POOL_RECYCLE_SEC,
+            pool_timeout=settings.DB_POOL_ACQUIRE_TIMEOUT_SEC,
+            connect_args={"connect_timeout": settings.DB_CONNECT_TIMEOUT_SEC},
+        )
+        _sessionmaker = async_sessionmaker(_engine, expire_on_commit=False, autoflush=False)
+    return _engine
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
-    async with AsyncSessionLocal() as session:
+    get_engine()
+    assert _sessionmaker is not None
+    async with _sessionmaker() as session:
         yield session
+
+
+async def dispose_engine() -> None:
+    global _engine, _sessionmaker
+    if _engine is not None:
+        await _engine.dispose()
+        _engine = None
+        _sessionmaker = None
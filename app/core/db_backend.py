@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import time
+
+from tortoise.backends.base.client import (
+    NestedTransactionContext,
+    TransactionContext,
+    TransactionContextPooled,
+)
+from tortoise.backends.mysql.client import MySQLClient, TransactionWrapper
+
+from app.core.config import settings
+from app.core.db import InstrumentedPool
+from app.core.http_metrics import record_db_query
+
+# ─────────────────────────────────────────────────────────────
+# Tortoise MySQL 엔진(TORTOISE_ORM의 "engine"으로 지정)
+# - 기본 MySQLClient와 동일하되, 생성된 풀을 InstrumentedPool로 감싸
+#   연결 획득 대기/타임아웃을 계측한다(app.core.db.pool_stats)
+# - 모든 문장 실행(execute_*)의 소요 시간을 기록(요청별 DB 쿼리 수/시간).
+#   트랜잭션도 같은 계측을 거치도록 TransactionWrapper도 교체
+# ─────────────────────────────────────────────────────────────
+
+
+QueryResult = tuple[int, list[dict]]  # (영향 행 수, 행 목록)
+
+
+class QueryTimingMixin:
+    # execute_query_dict는 내부에서 execute_query를 호출하므로 따로 감싸지 않음
+    async def execute_insert(self, query: str, values: list) -> int:
+        started = time.perf_counter()
+        try:
+            row_id: int = await super().execute_insert(query, values)  # type: ignore[misc]
+            return row_id
+        finally:
+            record_db_query(time.perf_counter() - started)
+
+    async def execute_many(self, query: str, values: list) -> None:
+        started = time.perf_counter()
+        try:
+            await super().execute_many(query, values)  # type: ignore[misc]
+        finally:
+            record_db_query(time.perf_counter() - started)
+
+    async def execute_query(self, query: str, values: list | None = None) -> QueryResult:
+        started = time.perf_counter()
+        try:
+            result: QueryResult = await super().execute_query(query, values)  # type: ignore[misc]
+            return result
+        finally:
+            record_db_query(time.perf_counter() - started)
+
+    async def execute_script(self, query: str) -> None:
+        started = time.perf_counter()
+        try:
+            await super().execute_script(query)  # type: ignore[misc]
+        finally:
+            record_db_query(time.perf_counter() - started)
+
+
+class InstrumentedTransactionWrapper(QueryTimingMixin, TransactionWrapper):
+    def _in_transaction(self) -> TransactionContext:
+        return NestedTransactionContext(InstrumentedTransactionWrapper(self))
+
+
+class InstrumentedMySQLClient(QueryTimingMixin, MySQLClient):
+    async def create_connection(self, with_db: bool) -> None:
+        await super().create_connection(with_db)
+        if self._pool is not None and not isinstance(self._pool, InstrumentedPool):
+            self._pool = InstrumentedPool(
+                self.connection_name,
+                self._pool,
+                acquire_timeout=settings.DB_POOL_ACQUIRE_TIMEOUT_SEC,
+            )
+
+    def _in_transaction(self) -> TransactionContext:
+        return TransactionContextPooled(InstrumentedTransactionWrapper(self), self._pool_init_lock)
+
+
+client_class = InstrumentedMySQLClient
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from tortoise import connections
+from tortoise.backends.base.client import BaseDBAsyncClient, TransactionalDBClient
+
+# ─────────────────────────────────────────────────────────────
+# 읽기/쓰기 분리 라우팅
+# - 쓰기: 항상 primary("default")
+# - 읽기: replica 연결이 설정돼 있으면 replica, 단 아래 경우는 primary
+#   · 같은 요청(태스크 컨텍스트)에서 이미 쓰기를 했음(read-your-writes)
+#   · force_primary() 블록 안이거나 호출 시 primary=True
+# - replica 미설정 시 모든 읽기는 primary(동작 변화 없음)
+# - 트랜잭션 안에서는 connections.get("default")가 트랜잭션 연결을 돌려준다
+# ─────────────────────────────────────────────────────────────
+PRIMARY = "default"
+REPLICA = "replica"
+
+# 요청마다 새 태스크 컨텍스트에서 시작하므로 요청 간에는 공유되지 않음
+_wrote: ContextVar[bool] = ContextVar("db_wrote", default=False)
+_forced: ContextVar[bool] = ContextVar("db_force_primary", default=False)
+
+
+def mark_write() -> None:
+    """이후 이 요청의 읽기는 primary로(복제 지연으로 방금 쓴 값을 못 읽는 문제 방지)"""
+    _wrote.set(True)
+
+
+@contextmanager
+def force_primary() -> Iterator[None]:
+    token = _forced.set(True)
+    try:
+        yield
+    finally:
+        _forced.reset(token)
+
+
+def has_replica() -> bool:
+    return REPLICA in connections.db_config
+
+
+def read_db(*, primary: bool = False) -> BaseDBAsyncClient:
+    conn = connections.get(PRIMARY)
+    if isinstance(conn, TransactionalDBClient):  # 진행 중인 트랜잭션
+        return conn
+    if primary or _forced.get() or _wrote.get() or not has_replica():
+        return conn
+    return connections.get(REPLICA)
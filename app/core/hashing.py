@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import multiprocessing
+import os
+import time
+from typing import TypeVar
+
+from app.core import metrics
+from app.core.config import settings
+from app.shared.errors import service_unavailable
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# ─────────────────────────────────────────────────────────────
+# bcrypt 전용 워커 풀
+# - bcrypt는 C 구현에서 GIL을 풀기 때문에 스레드 풀로도 이벤트 루프가 막히지 않음
+# - 진행 중 + 대기 중 작업 수가 상한을 넘으면 큐에 쌓지 않고 즉시 503
+# ─────────────────────────────────────────────────────────────
+HASH_QUEUE_WAIT = metrics.summary(
+    "password_hash_queue_wait_seconds", "Time a hash job waited for a worker"
+)
+HASH_DURATION = metrics.summary("password_hash_seconds", "Time spent inside bcrypt")
+HASH_REJECTED = metrics.counter(
+    "password_hash_rejected_total", "Hash jobs rejected because the queue was full"
+)
+
+
+class PasswordHashPool:
+    def __init__(self, *, workers: int, max_queue: int) -> None:
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending = 0  # 이벤트 루프 스레드에서만 변경
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="pwhash"
+            )
+        return self._executor
+
+    @staticmethod
+    def _timed(submitted: float, fn: Callable[..., T], *args: object) -> T:
+        started = time.perf_counter()
+        HASH_QUEUE_WAIT.observe(started - submitted)
+        try:
+            return fn(*args)
+        finally:
+            HASH_DURATION.observe(time.perf_counter() - started)
+
+    async def run(self, fn: Callable[..., T], *args: object) -> T:
+        """fn(*args)를 워커 풀에서 실행. 포화 상태면 503으로 즉시 실패."""
+        if self._pending >= self.workers + self.max_queue:
+            HASH_REJECTED.inc()
+            service_unavailable("password hashing is busy, retry shortly")
+
+        loop = asyncio.get_running_loop()
+        self._pending += 1
+        try:
+            return await loop.run_in_executor(
+                self._get_executor(), self._timed, time.perf_counter(), fn, *args
+            )
+        finally:
+            self._pending -= 1
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+hash_pool = PasswordHashPool(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+)
+
+
+# ─────────────────────────────────────────────────────────────
+# 대량 작업용 프로세스 풀(일괄 가입 등)
+# - 로그인/가입용 hash_pool과 분리해 대량 해시가 대화형 요청을 굶기지 않게 함
+# - 입력을 프로세스 수만큼 조각내 병렬 실행, 결과 순서는 입력 순서 유지
+# - spawn 컨텍스트: 실행 중인 이벤트 루프/스레드를 fork로 복제하지 않음
+# ─────────────────────────────────────────────────────────────
+class BulkProcessPool:
+    def __init__(self, *, processes: int) -> None:
+        self.processes = processes or os.cpu_count() or 1
+        self._executor: ProcessPoolExecutor | None = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.processes,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    async def map_chunks(
+        self, fn: Callable[..., list[R]], items: list[T], *args: object
+    ) -> list[R]:
+        """fn(조각, *args) → 조각 결과 리스트. 모든 조각 결과를 입력 순서대로 이어 붙여 반환."""
+        if not items:
+            return []
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        size = -(-len(items) // self.processes)  # 올림 나눗셈
+        parts = await asyncio.gather(
+            *(
+                loop.run_in_executor(executor, fn, items[i : i + size], *args)
+                for i in range(0, len(items), size)
+            )
+        )
+        return [r for part in parts for r in part]
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+bulk_pool = BulkProcessPool(processes=settings.BULK_HASH_PROCESSES)
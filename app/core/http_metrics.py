@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable, MutableMapping
+from contextvars import ContextVar
+import time
+from typing import Any
+
+from app.core import metrics
+
+Scope = MutableMapping[str, Any]
+Message = MutableMapping[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+# ─────────────────────────────────────────────────────────────
+# 요청 단위 HTTP/DB 메트릭 (순수 ASGI 미들웨어)
+# - 라우트 템플릿(/user/{username})·메서드·상태 코드별 지연 히스토그램
+# - 요청마다 DB 쿼리 수/시간을 ContextVar로 모아 라우트별 카운터에 합산
+#   (쿼리 기록은 Tortoise 클라이언트 훅: app.core.db_backend)
+# - 매칭되지 않은 경로는 "unmatched" 하나로 묶어 레이블 수 폭증 방지
+# ─────────────────────────────────────────────────────────────
+HTTP_LATENCY = metrics.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    labelnames=("method", "route", "status"),
+)
+HTTP_IN_FLIGHT = metrics.gauge("http_requests_in_flight", "HTTP requests being served")
+REQUEST_DB_QUERIES = metrics.counter_vec(
+    "http_request_db_queries_total", "DB queries issued while serving a route",
+    labelnames=("method", "route"),
+)  # fmt: skip
+REQUEST_DB_SECONDS = metrics.counter_vec(
+    "http_request_db_seconds_total", "Time spent in DB queries while serving a route",
+    labelnames=("method", "route"),
+)  # fmt: skip
+DB_QUERY_LATENCY = metrics.histogram("db_query_duration_seconds", "Latency of one DB statement")
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+class QueryStats:
+    __slots__ = ("count", "seconds")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.seconds = 0.0
+
+
+_request_queries: ContextVar[QueryStats | None] = ContextVar("request_queries", default=None)
+
+
+def record_db_query(elapsed: float) -> None:
+    """DB 문장 1회 실행 기록(요청 안이면 해당 요청 합계에도 반영)"""
+    DB_QUERY_LATENCY.observe(elapsed)
+    stats = _request_queries.get()
+    if stats is not None:
+        stats.count += 1
+        stats.seconds += elapsed
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        # 이벤트 루프에서만 증감 → 락 있는 Gauge 대신 정수, 출력 시점에 읽음
+        self.in_flight = 0
+        HTTP_IN_FLIGHT.set_function(lambda: self.in_flight)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500  # 응답 시작 전에 예외로 끝나면 500으로 집계
+        stats = QueryStats()
+        token = _request_queries.set(stats)
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        self.in_flight += 1
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.in_flight -= 1
+            _request_queries.reset(token)
+            # 라우터가 매칭 시 scope["route"]를 채움(FastAPI APIRoute/Starlette Route)
+            method = scope["method"]
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            HTTP_LATENCY.observe(elapsed, (method, route, str(status)))
+            if stats.count:
+                REQUEST_DB_QUERIES.inc((method, route), stats.count)
+                REQUEST_DB_SECONDS.inc((method, route), stats.seconds)
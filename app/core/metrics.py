@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Sequence
+import math
+import threading
+
+# ─────────────────────────────────────────────────────────────
+# 프로세스 내 경량 메트릭 레지스트리
+# - 외부 의존성 없이 카운터/게이지/요약(count/sum/max)/고정 버킷 히스토그램 제공
+# - 워커 스레드(예: bcrypt 풀)에서도 기록하므로 락으로 보호
+# - render_prometheus()로 Prometheus 텍스트 포맷 출력(/metrics, 멀티 워커 합산은 metrics_multiproc)
+# ─────────────────────────────────────────────────────────────
+
+
+class Counter:
+    def __init__(self, name: str, help_text: str) -> None:
+        self.name = name
+        self.help = help_text
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def snapshot(self) -> dict[str, float]:
+        return {"value": self._value}
+
+
+class Summary:
+    """관측값의 개수/합계/최댓값(초 단위 지연 등)"""
+
+    def __init__(self, name: str, help_text: str) -> None:
+        self.name = name
+        self.help = help_text
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        with self._lock:
+            self.count += 1
+            self.sum += value
+            if value > self.max:
+                self.max = value
+
+    def snapshot(self) -> dict[str, float]:
+        with self._lock:
+            return {"count": self.count, "sum": self.sum, "max": self.max}
+
+
+class Gauge:
+    """현재 값(진행 중 요청 수 등), set_function을 주면 출력 시점에 계산"""
+
+    def __init__(self, name: str, help_text: str) -> None:
+        self.name = name
+        self.help = help_text
+        self._value = 0.0
+        self._fn: Callable[[], float] | None = None
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value -= amount
+
+    def set_function(self, fn: Callable[[], float]) -> None:
+        self._fn = fn
+
+    @property
+    def value(self) -> float:
+        return float(self._fn()) if self._fn is not None else self._value
+
+    def snapshot(self) -> dict[str, float]:
+        return {"value": self.value}
+
+
+# 지연(초) 기본 버킷: 1ms ~ 10s
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)  # fmt: skip
+
+
+class Histogram:
+    """
+    고정 버킷 히스토그램(레이블 조합별).
+    요청 경로에서 매번 기록하므로 락 없이 이벤트 루프 스레드에서만 기록/조회하는 전제
+    (관측 1회 = 이진 탐색 + 리스트 원소 2개 갱신, 누적 합은 출력 시 계산)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        *,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 레이블 값 → [버킷별 개수..., +Inf 개수, 합계]
+        self._series: dict[tuple[str, ...], list[float]] = {}
+
+    def observe(self, value: float, labels: tuple[str, ...] = ()) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * (len(self.buckets) + 2)
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def series(self) -> dict[tuple[str, ...], tuple[list[int], float]]:
+        return {k: ([int(n) for n in v[:-1]], float(v[-1])) for k, v in list(self._series.items())}
+
+    def add_series(self, labels: tuple[str, ...], counts: Sequence[int], total: float) -> None:
+        """다른 프로세스에서 모은 버킷 개수/합계를 더함(멀티 워커 집계용)"""
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * (len(self.buckets) + 2)
+        for i, n in enumerate(counts):
+            series[i] += n
+        series[-1] += total
+
+    def snapshot(self) -> dict[str, float]:
+        out = {"count": 0.0, "sum": 0.0}
+        for counts, total in self.series().values():
+            out["count"] += sum(counts)
+            out["sum"] += total
+        return out
+
+
+class CounterVec:
+    """레이블 조합별 카운터(Histogram과 같이 이벤트 루프 스레드에서만 기록)"""
+
+    def __init__(self, name: str, help_text: str, *, labelnames: Sequence[str]) -> None:
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, labels: tuple[str, ...], amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def series(self) -> dict[tuple[str, ...], float]:
+        return dict(self._values)
+
+    def snapshot(self) -> dict[str, float]:
+        return {"value": sum(self.series().values())}
+
+
+Metric = Counter | Gauge | Summary | Histogram | CounterVec
+
+_registry: dict[str, Metric] = {}
+_registry_lock = threading.Lock()
+
+
+def counter(name: str, help_text: str = "") -> Counter:
+    """이름으로 카운터를 조회/생성(모듈 재임포트에도 동일 객체 유지)"""
+    with _registry_lock:
+        m = _registry.get(name)
+        if m is None:
+            m = _registry[name] = Counter(name, help_text)
+    if not isinstance(m, Counter):
+        raise TypeError(f"metric {name!r} is not a counter")
+    return m
+
+
+def summary(name: str, help_text: str = "") -> Summary:
+    with _registry_lock:
+        m = _registry.get(name)
+        if m is None:
+            m = _registry[name] = Summary(name, help_text)
+    if not isinstance(m, Summary):
+        raise TypeError(f"metric {name!r} is not a summary")
+    return m
+
+
+def gauge(name: str, help_text: str = "") -> Gauge:
+    with _registry_lock:
+        m = _registry.get(name)
+        if m is None:
+            m = _registry[name] = Gauge(name, help_text)
+    if not isinstance(m, Gauge):
+        raise TypeError(f"metric {name!r} is not a gauge")
+    return m
+
+
+def histogram(
+    name: str,
+    help_text: str = "",
+    *,
+    labelnames: Sequence[str] = (),
+    buckets: Sequence[float] = LATENCY_BUCKETS,
+) -> Histogram:
+    with _registry_lock:
+        m = _registry.get(name)
+        if m is None:
+            m = _registry[name] = Histogram(name, help_text, labelnames=labelnames, buckets=buckets)
+    if not isinstance(m, Histogram):
+        raise TypeError(f"metric {name!r} is not a histogram")
+    return m
+
+
+def counter_vec(name: str, help_text: str = "", *, labelnames: Sequence[str]) -> CounterVec:
+    with _registry_lock:
+        m = _registry.get(name)
+        if m is None:
+            m = _registry[name] = CounterVec(name, help_text, labelnames=labelnames)
+    if not isinstance(m, CounterVec):
+        raise TypeError(f"metric {name!r} is not a counter vector")
+    return m
+
+
+def registered() -> list[Metric]:
+    with _registry_lock:
+        return list(_registry.values())
+
+
+def snapshot() -> dict[str, dict[str, float]]:
+    """등록된 모든 메트릭의 현재 값"""
+    return {m.name: m.snapshot() for m in registered()}
+
+
+# ─────────────────────────────────────────────────────────────
+# Prometheus 텍스트 포맷(0.0.4)
+# ─────────────────────────────────────────────────────────────
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values, strict=True)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _num(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def render_prometheus() -> str:
+    """이 프로세스에 등록된 메트릭"""
+    return render(registered())
+
+
+def render(metrics: Iterable[Metric]) -> str:
+    lines: list[str] = []
+    for m in sorted(metrics, key=lambda m: m.name):
+        if m.help:
+            lines.append(f"# HELP {m.name} {_escape(m.help)}")
+        if isinstance(m, Counter):
+            lines += [f"# TYPE {m.name} counter", f"{m.name} {_num(m.value)}"]
+        elif isinstance(m, Gauge):
+            lines += [f"# TYPE {m.name} gauge", f"{m.name} {_num(m.value)}"]
+        elif isinstance(m, Summary):
+            snap = m.snapshot()
+            lines += [
+                f"# TYPE {m.name} summary",
+                f"{m.name}_count {_num(snap['count'])}",
+                f"{m.name}_sum {_num(snap['sum'])}",
+                # summary 계열에는 _count/_sum(+quantile)만 허용 → 최댓값은 별도 gauge
+                f"# HELP {m.name}_max Maximum observed value of {m.name}",
+                f"# TYPE {m.name}_max gauge",
+                f"{m.name}_max {_num(snap['max'])}",
+            ]
+        elif isinstance(m, CounterVec):
+            lines.append(f"# TYPE {m.name} counter")
+            for values, total in sorted(m.series().items()):
+                lines.append(f"{m.name}{_labels(m.labelnames, values)} {_num(total)}")
+        else:
+            lines.append(f"# TYPE {m.name} histogram")
+            for values, (counts, total) in sorted(m.series().items()):
+                cumulative = 0
+                for bound, n in zip((*m.buckets, math.inf), counts, strict=True):
+                    cumulative += n
+                    le = _labels(m.labelnames, values, f'le="{_num(bound)}"')
+                    lines.append(f"{m.name}_bucket{le} {cumulative}")
+                lab = _labels(m.labelnames, values)
+                lines.append(f"{m.name}_count{lab} {cumulative}")
+                lines.append(f"{m.name}_sum{lab} {_num(total)}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import time
+from typing import Any
+
+import orjson
+
+from app.core import metrics
+from app.core.config import settings
+from app.core.tasks import PeriodicTask
+
+# ─────────────────────────────────────────────────────────────
+# 멀티 워커 메트릭 집계(METRICS_MULTIPROC_DIR 설정 시)
+# - 워커마다 자기 레지스트리 값을 <dir>/<pid>-<기동 시각>.json으로 주기적으로 기록(임시 파일 → rename)
+# - /metrics는 자기 값을 먼저 기록한 뒤 모든 워커 파일을 합쳐 출력
+#   → 어느 워커가 스크레이프를 받아도 같은 합계, 파일 값은 늘기만 하므로 카운터 단조 증가
+# - 카운터/히스토그램/요약은 종료(교체)된 워커 파일도 합산(요청 상한 교체로 값이 줄지 않음)
+# - 게이지는 살아 있는 워커 것만 합산(정상 종료 시 alive=false, 강제 종료는 pid로 판정)
+# - 다른 워커 값은 최대 METRICS_FLUSH_INTERVAL_SEC만큼 늦음
+# ─────────────────────────────────────────────────────────────
+
+
+def _state(m: metrics.Metric) -> dict[str, Any]:
+    base: dict[str, Any] = {"name": m.name, "help": m.help}
+    if isinstance(m, metrics.Counter):
+        return base | {"type": "counter", "value": m.value}
+    if isinstance(m, metrics.Gauge):
+        return base | {"type": "gauge", "value": m.value}
+    if isinstance(m, metrics.Summary):
+        return base | {"type": "summary", **m.snapshot()}
+    if isinstance(m, metrics.CounterVec):
+        series = [[list(k), v] for k, v in m.series().items()]
+        return base | {"type": "counter_vec", "labelnames": m.labelnames, "series": series}
+    series = [[list(k), counts, total] for k, (counts, total) in m.series().items()]
+    return base | {
+        "type": "histogram",
+        "labelnames": m.labelnames,
+        "buckets": m.buckets,
+        "series": series,
+    }
+
+
+# 교체된 워커의 pid가 재사용돼도 이전 워커 파일(누적 값)을 덮어쓰지 않도록 기동 시각 포함
+_STARTED_NS = time.time_ns()
+
+
+def write_process_file(directory: str, *, alive: bool = True) -> None:
+    """이 프로세스의 메트릭 값을 기록(읽는 쪽이 반쯤 쓴 파일을 보지 않도록 rename)"""
+    path = Path(directory) / f"{os.getpid()}-{_STARTED_NS}.json"
+    tmp = path.with_suffix(".tmp")
+    payload = {
+        "pid": os.getpid(),
+        "alive": alive,
+        "metrics": [_state(m) for m in metrics.registered()],
+    }
+    tmp.write_bytes(orjson.dumps(payload))
+    os.replace(tmp, path)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _new(state: dict[str, Any]) -> metrics.Metric:
+    name, help_text, kind = state["name"], state["help"], state["type"]
+    if kind == "counter":
+        return metrics.Counter(name, help_text)
+    if kind == "gauge":
+        return metrics.Gauge(name, help_text)
+    if kind == "summary":
+        return metrics.Summary(name, help_text)
+    if kind == "counter_vec":
+        return metrics.CounterVec(name, help_text, labelnames=state["labelnames"])
+    return metrics.Histogram(
+        name, help_text, labelnames=state["labelnames"], buckets=state["buckets"]
+    )
+
+
+def _add(m: metrics.Metric, state: dict[str, Any]) -> None:
+    if isinstance(m, metrics.Counter | metrics.Gauge):
+        m.inc(state["value"])
+    elif isinstance(m, metrics.Summary):
+        m.count += state["count"]
+        m.sum += state["sum"]
+        m.max = max(m.max, state["max"])
+    elif isinstance(m, metrics.CounterVec):
+        for labels, value in state["series"]:
+            m.inc(tuple(labels), value)
+    else:
+        for labels, counts, total in state["series"]:
+            m.add_series(tuple(labels), counts, total)
+
+
+def _merge(merged: dict[str, metrics.Metric], state: dict[str, Any], *, live: bool) -> None:
+    if state["type"] == "gauge" and not live:
+        return
+    m = merged.get(state["name"])
+    if m is None:
+        m = merged[state["name"]] = _new(state)
+    _add(m, state)
+
+
+def collect(directory: str) -> list[metrics.Metric]:
+    """모든 워커 파일을 합친 메트릭(같은 이름은 타입별 규칙으로 합산)"""
+    merged: dict[str, metrics.Metric] = {}
+    for path in Path(directory).glob("*.json"):
+        try:
+            data = orjson.loads(path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            continue  # 기록 직후 교체된 파일 등은 다음 스크레이프에서 반영
+        live = bool(data["alive"]) and _pid_alive(int(data["pid"]))
+        for state in data["metrics"]:
+            _merge(merged, state, live=live)
+    return list(merged.values())
+
+
+def render(directory: str) -> str:
+    write_process_file(directory)
+    return metrics.render(collect(directory))
+
+
+def render_all() -> str:
+    """/metrics 본문: 멀티 워커면 전체 워커 합계, 아니면 이 프로세스 값"""
+    if settings.METRICS_MULTIPROC_DIR:
+        return render(settings.METRICS_MULTIPROC_DIR)
+    return metrics.render_prometheus()
+
+
+async def _flush() -> None:
+    write_process_file(settings.METRICS_MULTIPROC_DIR)
+
+
+metrics_flush = PeriodicTask(
+    "metrics-multiproc-flush",
+    interval=settings.METRICS_FLUSH_INTERVAL_SEC,
+    fn=_flush,
+)
+
+
+def start() -> None:
+    if settings.METRICS_MULTIPROC_DIR:
+        write_process_file(settings.METRICS_MULTIPROC_DIR)
+        metrics_flush.start()
+
+
+async def stop() -> None:
+    await metrics_flush.stop()
+    if settings.METRICS_MULTIPROC_DIR:
+        # 누적 값은 남기고 게이지는 이후 합산에서 제외
+        write_process_file(settings.METRICS_MULTIPROC_DIR, alive=False)
+
+
+def reset_directory(directory: str) -> None:
+    """런처 기동 시 이전 실행의 워커 파일 제거(재시작 후 값이 이전 실행과 섞이지 않도록)"""
+    Path(directory).mkdir(parents=True, exist_ok=True)
+    for path in Path(directory).iterdir():
+        if path.suffix in (".json", ".tmp"):
+            path.unlink(missing_ok=True)
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable
+import math
+import time
+from typing import Protocol
+
+from app.core import metrics
+
+# ─────────────────────────────────────────────────────────────
+# 토큰 버킷 레이트리밋
+# - 백엔드는 Protocol로 분리: 지금은 프로세스 내 메모리, 추후 Redis 등 공유 저장소로 교체
+# - 메모리 백엔드는 키 수 상한 + LRU 제거(제거된 버킷은 가득 찬 상태로 다시 시작)
+# ─────────────────────────────────────────────────────────────
+THROTTLED = metrics.counter("ratelimit_throttled_total", "Requests rejected by a rate limit")
+
+
+class RateLimitBackend(Protocol):
+    async def consume(self, key: str, *, rate: float, burst: int) -> float:
+        """
+        key 버킷에서 토큰 1개를 소비.
+        - 허용되면 0.0, 거부되면 다음 토큰까지 남은 초를 반환
+        - rate: 초당 충전량, burst: 버킷 용량
+        """
+        ...
+
+
+class InMemoryTokenBucket:
+    def __init__(self, *, max_keys: int, clock: Callable[[], float] = time.monotonic) -> None:
+        self.max_keys = max_keys
+        self._clock = clock
+        # key → (남은 토큰, 마지막 갱신 시각)
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    async def consume(self, key: str, *, rate: float, burst: int) -> float:
+        now = self._clock()
+        tokens, updated = self._buckets.get(key, (float(burst), now))
+        tokens = min(float(burst), tokens + (now - updated) * rate)
+
+        if tokens >= 1.0:
+            tokens -= 1.0
+            wait = 0.0
+        else:
+            wait = (1.0 - tokens) / rate
+
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        while len(self._buckets) > self.max_keys:
+            self._buckets.popitem(last=False)
+        return wait
+
+
+def retry_after_seconds(wait: float) -> int:
+    # Retry-After는 정수 초, 최소 1
+    return max(1, math.ceil(wait))
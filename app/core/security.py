@@ -1,20 +1,104 @@
+from __future__ import annotations
+
 from datetime import UTC, datetime, timedelta
+import functools
 import hashlib
+import time
+from typing import TYPE_CHECKING
 
 import jwt
-from passlib.context import CryptContext
 
 from .config import settings
+from .hashing import bulk_pool, hash_pool
+
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
+
+
+@functools.cache
+def get_pwd_context() -> CryptContext:
+    """
+    앱 전체에서 공유하는 단일 해시 컨텍스트(rounds는 시작 시 보정/고정값으로 갱신).
+    passlib 임포트는 첫 사용 시점으로 미룸(app.main 임포트 시간 단축).
+    """
+    from passlib.context import CryptContext
+
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+
+# 보정 탐색 범위(10 미만은 보안상 허용하지 않음)
+_MIN_BCRYPT_ROUNDS = 10
+_MAX_BCRYPT_ROUNDS = 16
+
+
+async def hash_password(pw: str) -> str:
+    return await hash_pool.run(get_pwd_context().hash, pw)
+
+
+async def verify_password(pw: str, hashed: str) -> bool:
+    return await hash_pool.run(get_pwd_context().verify, pw, hashed)
+
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+def _hash_batch(passwords: list[str], rounds: int) -> list[str]:
+    # 자식 프로세스에서 실행(부모의 보정 rounds를 인자로 전달)
+    from passlib.hash import bcrypt as bcrypt_handler
 
+    handler = bcrypt_handler.using(rounds=rounds)
+    return [handler.hash(pw) for pw in passwords]
 
-def hash_password(pw: str) -> str:
-    return pwd_context.hash(pw)
 
+async def hash_passwords(passwords: list[str]) -> list[str]:
+    """대량 해시(일괄 가입용): 프로세스 풀에서 병렬 계산, 입력 순서 유지"""
+    rounds = get_pwd_context().handler("bcrypt").default_rounds
+    return await bulk_pool.map_chunks(_hash_batch, passwords, rounds)
 
-def verify_password(pw: str, hashed: str) -> bool:
-    return pwd_context.verify(pw, hashed)
+
+def password_needs_rehash(hashed: str) -> bool:
+    # 해시 문자열의 rounds만 확인(bcrypt 연산 없음)
+    return get_pwd_context().needs_update(hashed)
+
+
+def calibrate_bcrypt_rounds(target_ms: float) -> int:
+    """
+    이 하드웨어에서 검증 1회가 target_ms 이내인 가장 높은 bcrypt rounds.
+    rounds +1마다 비용이 2배이므로 다음 단계가 목표를 넘을 것으로 보이면 중단.
+    """
+    from passlib.hash import bcrypt as bcrypt_handler
+
+    best = _MIN_BCRYPT_ROUNDS
+    for rounds in range(_MIN_BCRYPT_ROUNDS, _MAX_BCRYPT_ROUNDS + 1):
+        sample = bcrypt_handler.using(rounds=rounds).hash("calibration")
+        started = time.perf_counter()
+        bcrypt_handler.verify("calibration", sample)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        if elapsed_ms > target_ms:
+            break
+        best = rounds
+        if elapsed_ms * 2 > target_ms:
+            break
+    return best
+
+
+def apply_bcrypt_rounds(rounds: int) -> None:
+    """
+    새 해시의 rounds를 설정. ±1 범위를 벗어난 기존 해시는 needs_update → 로그인 시 재해시.
+    (장비 간 보정값이 1 차이 나도 재해시가 반복되지 않도록 여유를 둔다)
+    """
+    get_pwd_context().update(
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=max(4, rounds - 1),
+        bcrypt__max_rounds=rounds + 1,
+    )
+
+
+async def configure_password_hashing() -> int:
+    """설정값(PASSWORD_BCRYPT_ROUNDS)이 있으면 그대로, 없으면 워커 풀에서 보정"""
+    rounds = settings.PASSWORD_BCRYPT_ROUNDS or await hash_pool.run(
+        calibrate_bcrypt_rounds, settings.PASSWORD_HASH_TARGET_MS
+    )
+    apply_bcrypt_rounds(rounds)
+    print(f"🔐 bcrypt rounds = {rounds}")
+    return rounds
 
 
 def create_access_token(sub: str, minutes: int | None = None) -> str:
@@ -31,3 +115,8 @@ def decode_token(token: str):
 
 def hash_refresh_token(raw: str) -> str:
     return hashlib.sha256((settings.JWT_REFRESH_HASH_PEPPER + raw).encode("utf-8")).hexdigest()
+
+
+def hash_api_key(raw: str) -> str:
+    # api_keys.key_hash(SHA-256 hex 64자)와 같은 형식
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
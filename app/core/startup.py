@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+import random
+import time
+
+from app.core import metrics
+
+# ─────────────────────────────────────────────────────────────
+# 기동 단계 계측 + DB 연결 재시도 백오프
+# - 단계별 소요 시간을 기록해 기동 로그/벤치마크(scripts/bench_startup)에서 사용
+# - 재시도는 지수 백오프 + full jitter: 동시에 뜬 컨테이너들이 같은 박자로
+#   DB를 두드리지 않도록 대기 시간을 [0, min(cap, base·2^(n-1))]에서 무작위 선택
+# ─────────────────────────────────────────────────────────────
+STARTUP_PHASE = metrics.summary("startup_phase_seconds", "Wall time of one startup phase")
+
+
+class StartupState:
+    def __init__(self) -> None:
+        self.phases: dict[str, float] = {}
+        self.db_ready = False
+        self.completed = False
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            # 재시도로 같은 단계가 반복되면 누적
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed
+            STARTUP_PHASE.observe(elapsed)
+
+    def summary(self) -> str:
+        return ", ".join(f"{k} {v * 1000:.0f}ms" for k, v in self.phases.items())
+
+
+startup = StartupState()
+
+
+def backoff_delay(
+    attempt: int,
+    *,
+    base: float,
+    cap: float,
+    rng: Callable[[], float] = random.random,
+) -> float:
+    """attempt(1부터)번째 실패 후 대기 시간(full jitter)"""
+    # int ** int는 타입상 Any(음수 지수면 float) → 2.0으로 float 고정
+    return rng() * min(cap, base * 2.0 ** (attempt - 1))
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Coroutine
+import contextlib
+import time
+from typing import Any
+
+# ─────────────────────────────────────────────────────────────
+# 주기 실행 백그라운드 작업(lifespan에서 start/stop)
+# - interval마다 fn 실행, trigger()로 앞당겨 깨울 수 있음
+# - 실패해도 루프는 유지하고 연속 실패 횟수/마지막 오류를 기록(헬스체크용)
+# ─────────────────────────────────────────────────────────────
+
+
+class PeriodicTask:
+    def __init__(
+        self,
+        name: str,
+        *,
+        interval: float,
+        fn: Callable[[], Awaitable[object]],
+    ) -> None:
+        self.name = name
+        self.interval = interval
+        self._fn = fn
+        self._task: asyncio.Task[None] | None = None
+        self._wakeup: asyncio.Event | None = None
+        self.last_success_at: float | None = None  # time.monotonic()
+        self.last_error: str | None = None
+        self.consecutive_failures = 0
+        _registry[name] = self
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def crashed(self) -> bool:
+        # start() 이후 루프 자체가 끝남(stop()은 _task를 비우므로 구분됨)
+        return self._task is not None and self._task.done()
+
+    def trigger(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def run_once(self) -> None:
+        try:
+            await self._fn()
+        except Exception as e:
+            self.consecutive_failures += 1
+            self.last_error = repr(e)
+            print(f"⚠️ 백그라운드 작업 {self.name} 실패: {e!r}")
+        else:
+            self.consecutive_failures = 0
+            self.last_error = None
+            self.last_success_at = time.monotonic()
+
+    async def _run(self, wakeup: asyncio.Event) -> None:
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(wakeup.wait(), timeout=self.interval)
+            wakeup.clear()
+            await self.run_once()
+
+    def start(self) -> None:
+        if not self.running:
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run(self._wakeup), name=self.name)
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+            self._wakeup = None
+
+
+_registry: dict[str, PeriodicTask] = {}
+
+
+def all_tasks() -> list[PeriodicTask]:
+    return list(_registry.values())
+
+
+# ─────────────────────────────────────────────────────────────
+# 일회성 백그라운드 작업(fire-and-forget)
+# - 참조를 보관해 GC로 사라지지 않게 하고, 예외는 로그로 남김
+# - 종료 시 drain_spawned()로 진행 중 작업을 기다림
+# ─────────────────────────────────────────────────────────────
+_spawned: set[asyncio.Task[Any]] = set()
+
+
+def _on_spawned_done(task: asyncio.Task[Any]) -> None:
+    _spawned.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        print(f"⚠️ 백그라운드 작업 {task.get_name()} 실패: {task.exception()!r}")
+
+
+def spawn(coro: Coroutine[Any, Any, object], *, name: str) -> asyncio.Task[Any]:
+    task = asyncio.create_task(coro, name=name)
+    _spawned.add(task)
+    task.add_done_callback(_on_spawned_done)
+    return task
+
+
+async def drain_spawned(timeout: float = 5.0) -> None:
+    if _spawned:
+        await asyncio.wait(list(_spawned), timeout=timeout)
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import UTC, datetime
+import uuid
+
+from app.core import metrics
+from app.core.config import settings
+from app.core.tasks import PeriodicTask
+from app.features.auth.repository import AuthRepository
+from app.features.users.cache import cache_key, on_invalidate
+from app.features.users.models import User
+from app.shared.utils.cache import TTLCache
+
+# ─────────────────────────────────────────────────────────────
+# API 키(X-API-Key) 인증 지원
+# - 키 해시 → (키 ID, 소유자, 스코프) 캐시(TTL, 음성 캐시 포함)
+# - 철회 시 캐시에서 즉시 제거, 소유자 변경(비활성화 등) 시 그 소유자의 키도 제거
+# - 스코프: 라우트별 require_scope로 확인(JWT 사용자는 역할 검사만 적용)
+# - last_used_at은 요청마다 쓰지 않고 모아서 주기적으로 UPDATE 1회
+# ─────────────────────────────────────────────────────────────
+TOUCHED_KEYS = metrics.counter("apikey_last_used_flushed_total", "last_used_at rows updated")
+
+# 스코프(ApiKey.scopes에 저장)
+SCOPE_USERS_READ = "users:read"  # 단일 사용자 조회
+SCOPE_USERS_WRITE = "users:write"  # 사용자 수정
+SCOPE_USERS_ADMIN = "users:admin"  # 목록/가져오기/내보내기(소유자가 admin이어야 함)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
+
+@dataclass(frozen=True)
+class ApiKeyPrincipal:
+    key_id: uuid.UUID
+    user: User
+    scopes: tuple[str, ...]
+    expires_at: datetime | None
+
+    def is_expired(self) -> bool:
+        return self.expires_at is not None and self.expires_at <= _utcnow()
+
+
+apikey_cache: TTLCache[str, ApiKeyPrincipal | None] = TTLCache(
+    maxsize=settings.APIKEY_CACHE_SIZE,
+    ttl=settings.APIKEY_CACHE_TTL_SEC,
+    name="apikey_cache",
+)
+
+
+def _forget_owner(user_key: str) -> None:
+    apikey_cache.pop_where(lambda p: p is not None and cache_key(p.user.id) == user_key)
+
+
+on_invalidate(_forget_owner)
+
+# 잘못된 키 반복 시도가 매번 DB로 가지 않도록 짧게 음성 캐시
+_NEGATIVE_TTL_SEC = 5.0
+
+# 마지막 사용 이후 아직 기록하지 않은 키 ID
+_touched: set[uuid.UUID] = set()
+
+
+async def resolve_api_key(key_hash: str) -> ApiKeyPrincipal | None:
+    hit, principal = apikey_cache.lookup(key_hash)
+    if not hit:
+        api = await AuthRepository.get_active_apikey(key_hash)
+        principal = (
+            ApiKeyPrincipal(
+                key_id=api.id,
+                user=api.user,
+                scopes=tuple(api.scopes or ()),
+                expires_at=api.expires_at,
+            )
+            if api
+            else None
+        )
+        apikey_cache.set(key_hash, principal, ttl=None if principal else _NEGATIVE_TTL_SEC)
+
+    if principal is None:
+        return None
+    if principal.is_expired():
+        apikey_cache.pop(key_hash)
+        return None
+
+    _touched.add(principal.key_id)
+    return principal
+
+
+async def revoke_api_key(key_hash: str) -> bool:
+    revoked = await AuthRepository.revoke_apikey(key_hash)
+    apikey_cache.pop(key_hash)
+    return revoked > 0
+
+
+async def flush_last_used() -> int:
+    if not _touched:
+        return 0
+    key_ids = list(_touched)
+    _touched.clear()
+    try:
+        updated = await AuthRepository.touch_apikeys(key_ids, _utcnow())
+    except Exception:
+        # 다음 주기에 재시도
+        _touched.update(key_ids)
+        raise
+    TOUCHED_KEYS.inc(updated)
+    return updated
+
+
+apikey_touch_flush = PeriodicTask(
+    "apikey-last-used-flush",
+    interval=settings.APIKEY_TOUCH_INTERVAL_SEC,
+    fn=flush_last_used,
+)
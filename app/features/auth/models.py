@@ -51,6 +51,8 @@ class Session(models.Model):
         table = "session"
         # jti 유일 제약(중복 방지)
         unique_together = (("jti",),)
+        # 철회 JTI 증분 동기화(revoked_at 워터마크) / 만료 행 정리용
+        indexes = (("revoked_at",), ("expires_at",))
 
 
 # ---------- API Key ----------
@@ -141,8 +143,10 @@ class RefreshToken(models.Model):
     class Meta:
         # 테이블명
         table = "refresh_tokens"
-        # 조회 최적화 인덱스(활성 토큰 스캔/가족 철회 최적화)
+        # 조회 최적화 인덱스(활성 토큰 스캔/가족 철회 최적화, 만료/철회 행 정리)
         indexes = (
             ("user_id", "is_active"),
             ("family_id", "is_active"),
+            ("expires_at",),
+            ("revoked_at",),
         )
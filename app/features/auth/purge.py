@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
+import time
+
+from app.core import metrics
+from app.core.config import settings
+from app.core.tasks import PeriodicTask
+from app.features.auth.repository import AuthRepository
+
+# ─────────────────────────────────────────────────────────────
+# 만료 세션 / 만료·장기 철회 리프레시 토큰 정리
+# - PK 순 소배치 DELETE(각각 autocommit) → 긴 잠금 없이 /auth/refresh와 공존
+# - 배치 사이 휴지(PURGE_BATCH_PAUSE_SEC), 1회 실행당 배치 수 상한으로 속도 제한
+# - 철회되었지만 아직 만료 전인 세션은 철회 JTI 동기화에 필요하므로 남겨둔다
+# ─────────────────────────────────────────────────────────────
+PURGED_SESSIONS = metrics.counter("auth_purged_sessions_total", "Expired session rows deleted")
+PURGED_REFRESH = metrics.counter(
+    "auth_purged_refresh_tokens_total", "Expired/revoked refresh token rows deleted"
+)
+PURGE_DURATION = metrics.summary("auth_purge_seconds", "Wall time of one purge run")
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
+
+async def _drain(
+    delete_batch: Callable[[], Awaitable[int]],
+    *,
+    batch_size: int,
+    max_batches: int,
+    pause: float,
+) -> int:
+    total = 0
+    for _ in range(max_batches):
+        deleted = await delete_batch()
+        total += deleted
+        if deleted < batch_size:
+            break
+        if pause:
+            await asyncio.sleep(pause)
+    return total
+
+
+async def purge_expired_auth_rows() -> tuple[int, int]:
+    """1회 정리 실행 → (삭제한 세션 수, 삭제한 리프레시 토큰 수)"""
+    started = time.perf_counter()
+    now = _utcnow()
+    batch = settings.PURGE_BATCH_SIZE
+    revoked_before = now - timedelta(hours=settings.PURGE_REVOKED_RETENTION_HOURS)
+
+    try:
+        sessions = await _drain(
+            lambda: AuthRepository.purge_sessions_batch(expired_before=now, limit=batch),
+            batch_size=batch,
+            max_batches=settings.PURGE_MAX_BATCHES_PER_RUN,
+            pause=settings.PURGE_BATCH_PAUSE_SEC,
+        )
+        PURGED_SESSIONS.inc(sessions)
+
+        refresh = await _drain(
+            lambda: AuthRepository.purge_refresh_tokens_batch(
+                expired_before=now, revoked_before=revoked_before, limit=batch
+            ),
+            batch_size=batch,
+            max_batches=settings.PURGE_MAX_BATCHES_PER_RUN,
+            pause=settings.PURGE_BATCH_PAUSE_SEC,
+        )
+        PURGED_REFRESH.inc(refresh)
+    finally:
+        PURGE_DURATION.observe(time.perf_counter() - started)
+
+    if sessions or refresh:
+        elapsed = time.perf_counter() - started
+        print(f"🧹 만료 인증 행 정리: session {sessions}, refresh {refresh} ({elapsed:.2f}s)")
+    return sessions, refresh
+
+
+auth_purge = PeriodicTask(
+    "auth-token-purge",
+    interval=settings.PURGE_INTERVAL_SEC,
+    fn=purge_expired_auth_rows,
+)
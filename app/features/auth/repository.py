@@ -4,7 +4,13 @@ from __future__ import annotations
 from datetime import UTC, datetime
 import uuid
 
+from tortoise.expressions import Q
+from tortoise.transactions import in_transaction
+
+from app.core.config import settings
+from app.core.db_routing import PRIMARY
 from app.features.auth.models import ApiKey, RefreshToken, Session
+from app.features.auth.write_behind import write_behind
 from app.features.users.models import User
 from app.features.users.repository import UsersRepository
 
@@ -37,7 +43,7 @@ class AuthRepository:
         ip: str | None,
         ua: str | None,
     ) -> str:
-        await Session.create(
+        row = Session(
             user_id=user_uuid,
             jti=jti,
             ip_address=ip,
@@ -46,14 +52,22 @@ class AuthRepository:
             revoked_at=None,
             is_active=True,
         )
+        if settings.AUTH_WRITE_BEHIND:
+            row.created_at = _utcnow()
+            await write_behind.add_session(row)
+        else:
+            await row.save(force_create=True)
         return jti
 
     @staticmethod
     async def revoke_session_by_jti(jti: str) -> None:
+        if write_behind.has_session(jti):
+            await write_behind.flush()
         await Session.filter(jti=jti, revoked_at=None).update(is_active=False, revoked_at=_utcnow())
 
     @staticmethod
-    async def get_apikey_owner(key_hash: str) -> User | None:
+    async def get_active_apikey(key_hash: str) -> ApiKey | None:
+        """철회/만료되지 않았고 소유자가 활성인 키(소유자 join 포함)"""
         api = await (
             ApiKey.filter(key_hash=key_hash, is_revoked=False).select_related("user").first()
         )
@@ -63,7 +77,23 @@ class AuthRepository:
             return None
         if not api.user.is_active:
             return None
-        return api.user
+        return api
+
+    @classmethod
+    async def get_apikey_owner(cls, key_hash: str) -> User | None:
+        api = await cls.get_active_apikey(key_hash)
+        return api.user if api else None
+
+    @staticmethod
+    async def revoke_apikey(key_hash: str) -> int:
+        return await ApiKey.filter(key_hash=key_hash, is_revoked=False).update(is_revoked=True)
+
+    @staticmethod
+    async def touch_apikeys(key_ids: list[uuid.UUID], used_at: datetime) -> int:
+        """last_used_at 일괄 갱신(UPDATE 1회)"""
+        if not key_ids:
+            return 0
+        return await ApiKey.filter(id__in=key_ids).update(last_used_at=used_at)
 
     # ---------- RefreshToken ----------
     @staticmethod
@@ -77,7 +107,7 @@ class AuthRepository:
         ip: str | None,
         ua: str | None,
     ) -> str:
-        await RefreshToken.create(
+        row = RefreshToken(
             user_id=user_uuid,
             family_id=family_id,
             jti=jti,
@@ -88,10 +118,19 @@ class AuthRepository:
             ip_address=ip,
             user_agent=ua,
         )
+        if settings.AUTH_WRITE_BEHIND:
+            row.created_at = _utcnow()
+            await write_behind.add_refresh(row)
+        else:
+            await row.save(force_create=True)
         return jti
 
     @staticmethod
     async def get_refresh_by_hash(token_hash: str) -> RefreshToken | None:
+        # 아직 기록되지 않은(write-behind) 행을 먼저 확인
+        pending = write_behind.get_refresh(token_hash)
+        if pending is not None:
+            return pending
         return await RefreshToken.filter(token_hash=token_hash).first()
 
     @staticmethod
@@ -104,8 +143,70 @@ class AuthRepository:
             is_active=False, revoked_at=_utcnow()
         )
 
+    @staticmethod
+    async def rotate_refresh_token(
+        *,
+        old_hash: str,
+        user_uuid: str,
+        family_id: uuid.UUID | None,
+        jti: str,
+        token_hash: str,
+        expires_at: datetime,
+        ip: str | None,
+        ua: str | None,
+    ) -> bool:
+        """
+        로테이션을 하나의 트랜잭션으로 처리(compare-and-swap).
+        - 기존 토큰이 아직 활성/미만료일 때만 사용+철회 표시(조건부 UPDATE)
+        - 성공했을 때만 같은 family로 새 행 INSERT
+        - 동시 요청은 행 잠금으로 직렬화되어 단 하나만 True를 받는다
+        """
+        # 버퍼에만 있는 토큰이면 먼저 기록해야 조건부 UPDATE가 행을 찾는다
+        if write_behind.get_refresh(old_hash) is not None:
+            await write_behind.flush()
+
+        now = _utcnow()
+        async with in_transaction(PRIMARY) as conn:
+            claimed = (
+                await RefreshToken.filter(
+                    token_hash=old_hash,
+                    is_active=True,
+                    revoked_at=None,
+                    expires_at__gt=now,
+                )
+                .using_db(conn)
+                .update(is_active=False, revoked_at=now, last_used_at=now)
+            )
+            if claimed != 1:
+                return False
+
+            if family_id is None:
+                # fam 클레임이 없는 이전 발급 토큰만 family를 재조회
+                rows = (
+                    await RefreshToken.filter(token_hash=old_hash)
+                    .using_db(conn)
+                    .values_list("family_id", flat=True)
+                )
+                family_id = uuid.UUID(str(rows[0]))
+
+            await RefreshToken.create(
+                using_db=conn,
+                user_id=user_uuid,
+                family_id=family_id,
+                jti=jti,
+                token_hash=token_hash,
+                is_active=True,
+                expires_at=expires_at,
+                revoked_at=None,
+                ip_address=ip,
+                user_agent=ua,
+            )
+        return True
+
     @staticmethod
     async def revoke_family(family_id: uuid.UUID) -> int:
+        if write_behind.has_family(family_id):
+            await write_behind.flush()
         return await RefreshToken.filter(
             family_id=family_id, revoked_at=None, is_active=True
         ).update(is_active=False, revoked_at=_utcnow())
@@ -117,3 +218,34 @@ class AuthRepository:
         if rt.expires_at <= _utcnow():
             return False
         return True
+
+    # ---------- 정리(만료/철회 행 삭제) ----------
+    @staticmethod
+    async def purge_sessions_batch(*, expired_before: datetime, limit: int) -> int:
+        """만료 세션을 PK 순으로 최대 limit개 삭제(짧은 autocommit DELETE)"""
+        ids = (
+            await Session.filter(expires_at__lt=expired_before)
+            .order_by("id")
+            .limit(limit)
+            .values_list("id", flat=True)
+        )
+        if not ids:
+            return 0
+        return await Session.filter(id__in=ids).delete()
+
+    @staticmethod
+    async def purge_refresh_tokens_batch(
+        *, expired_before: datetime, revoked_before: datetime, limit: int
+    ) -> int:
+        """만료 또는 오래전에 철회된 리프레시 토큰을 PK 순으로 최대 limit개 삭제"""
+        ids = (
+            await RefreshToken.filter(
+                Q(expires_at__lt=expired_before) | Q(revoked_at__lt=revoked_before)
+            )
+            .order_by("id")
+            .limit(limit)
+            .values_list("id", flat=True)
+        )
+        if not ids:
+            return 0
+        return await RefreshToken.filter(id__in=ids).delete()
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+import time
+
+from app.core import metrics
+from app.core.config import settings
+from app.core.tasks import PeriodicTask
+from app.features.auth.models import Session
+
+# ─────────────────────────────────────────────────────────────
+# 철회된 액세스 토큰 JTI 집합(프로세스 내)
+# - 요청당 DB 조회 없이 O(1)로 로그아웃된 토큰을 차단
+# - 시작 시 전량 로드 후 session.revoked_at 워터마크로 증분 동기화
+# - 토큰 만료(expires_at)가 지나면 제거 → 메모리는 "살아있는 철회 수"에 비례
+# ─────────────────────────────────────────────────────────────
+SYNCED_ROWS = metrics.counter("auth_revoked_jti_synced_total", "Revoked JTIs loaded from DB")
+
+# 다른 워커의 시계 오차/늦게 커밋된 철회를 놓치지 않기 위한 워터마크 겹침 구간
+_WATERMARK_OVERLAP = timedelta(seconds=5)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
+
+class RevokedJtiSet:
+    def __init__(self) -> None:
+        self._entries: dict[str, float] = {}  # jti → 만료 epoch(초)
+        self._watermark: datetime | None = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, jti: object) -> bool:
+        if not isinstance(jti, str):
+            return False
+        exp = self._entries.get(jti)
+        if exp is None:
+            return False
+        if exp <= time.time():
+            # 만료된 토큰은 서명 검증 단계에서 이미 거부되므로 더 보관할 필요 없음
+            del self._entries[jti]
+            return False
+        return True
+
+    def add(self, jti: str, expires_at: datetime | float) -> None:
+        exp = expires_at.timestamp() if isinstance(expires_at, datetime) else float(expires_at)
+        if exp > time.time():
+            self._entries[jti] = exp
+
+    def prune(self) -> int:
+        now = time.time()
+        expired = [jti for jti, exp in self._entries.items() if exp <= now]
+        for jti in expired:
+            del self._entries[jti]
+        return len(expired)
+
+    async def sync(self) -> int:
+        """DB의 철회 세션을 반영(최초 1회는 전량, 이후 revoked_at 워터마크 이후만)"""
+        now = _utcnow()
+        qs = Session.filter(revoked_at__isnull=False, expires_at__gt=now)
+        if self._watermark is not None:
+            qs = qs.filter(revoked_at__gte=self._watermark - _WATERMARK_OVERLAP)
+        rows = await qs.values_list("jti", "expires_at", "revoked_at")
+
+        watermark = self._watermark
+        for jti, expires_at, revoked_at in rows:
+            self.add(jti, expires_at)
+            if watermark is None or revoked_at > watermark:
+                watermark = revoked_at
+        self._watermark = watermark or now
+        SYNCED_ROWS.inc(len(rows))
+
+        self.prune()
+        return len(rows)
+
+
+revoked_jtis = RevokedJtiSet()
+revocation_sync = PeriodicTask(
+    "auth-revocation-sync",
+    interval=settings.REVOCATION_SYNC_INTERVAL_SEC,
+    fn=revoked_jtis.sync,
+)
@@ -5,8 +5,10 @@ from __future__ import annotations
 # ──────────────────────────────────────────────────────────────────────────────
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status
 
+from app.core.security import hash_api_key
+from app.features.auth.apikeys import revoke_api_key
 from app.features.auth.schemas import (
     LoginIn,
     MeOut,
@@ -14,8 +16,11 @@ from app.features.auth.schemas import (
     TokenOut,
 )
 from app.features.auth.service import AuthService, get_current_user
-from app.features.auth.tokens import decode_jwt
+from app.features.auth.throttle import login_throttle
 from app.features.users.models import User as UserModel
+from app.features.users.models import UserRole
+from app.shared.etag import etag_matches, make_etag, not_modified, with_etag
+from app.shared.responses import ModelResponse
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -24,18 +29,24 @@ CurUser = Annotated[UserModel, Depends(get_current_user)]
 
 # [POST] /auth/signin — 아이디/비밀번호 로그인 → 액세스·리프레시 발급 및 세션 기록(IP/UA 포함)
 @router.post("/signin", response_model=TokenOut)
-async def login(payload: LoginIn, request: Request) -> TokenOut:
+async def login(payload: LoginIn, request: Request) -> ModelResponse:
     ip = request.client.host if request.client else None
     ua = request.headers.get("user-agent")
+    # 레이트리밋 초과 시 429(DB 조회/bcrypt 이전에 차단)
+    await login_throttle.check(ip=ip, username=payload.username)
     access, refresh, ttl = await AuthService.login_password(payload, ip, ua)
-    return TokenOut(access_token=access, refresh_token=refresh, token_type="Bearer", expires_in=ttl)
+    return ModelResponse(
+        TokenOut(access_token=access, refresh_token=refresh, token_type="Bearer", expires_in=ttl)
+    )
 
 
 # [POST] /auth/refresh — 리프레시 토큰 검증 후 액세스 토큰 재발급
 @router.post("/refresh", response_model=TokenOut)
-async def refresh(payload: RefreshIn) -> TokenOut:
+async def refresh(payload: RefreshIn, request: Request) -> TokenOut:
+    ip = request.client.host if request.client else None
+    ua = request.headers.get("user-agent")
     svc = AuthService()
-    access, new_refresh, ttl = await svc.refresh(refresh_token=payload.refresh_token)
+    access, new_refresh, ttl = await svc.refresh(refresh_token=payload.refresh_token, ip=ip, ua=ua)
     return TokenOut(
         access_token=access, refresh_token=new_refresh, token_type="Bearer", expires_in=ttl
     )
@@ -54,24 +65,26 @@ async def logout(
     return {"status": "ok"}
 
 
-# [POST] /auth/me — Authorization 헤더의 액세스 토큰으로 현재 세션 무효화
-@router.get("/me", response_model=MeOut)
-async def me(
-    authorization: str | None = Header(default=None),
-) -> MeOut:
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="missing bearer token")
-    token = authorization.split(" ", 1)[1]
-
-    payload = decode_jwt(token)
-    user_uuid_val = payload.get("sub")
+# [DELETE] /auth/api-key — X-API-Key로 보낸 키 자체를 철회(유출/교체 시 즉시 폐기)
+@router.delete("/api-key", status_code=status.HTTP_204_NO_CONTENT)
+async def revoke_own_api_key(x_api_key: Annotated[str, Header()]) -> Response:
+    if not await revoke_api_key(hash_api_key(x_api_key)):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="invalid api key")
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
 
-    # 🔒 타입/값 검증: 빈 문자열 또는 비문자열 차단
-    if not isinstance(user_uuid_val, str) or not user_uuid_val:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="invalid token subject",
-        )
 
-    svc = AuthService()
-    return await svc.me(user_uuid=user_uuid_val)
+# [GET] /auth/me — 현재 액세스 토큰의 사용자 정보(If-None-Match 일치 시 304)
+@router.get("/me", response_model=MeOut)
+async def me(current_user: CurUser, request: Request) -> Response:
+    # get_current_user가 검증/철회 확인/캐시 경유 로드까지 처리 → 여기서는 DB 조회 없음
+    # (인증 계층과 같은 지연 상한 USER_CACHE_TTL_SEC, 이 워커의 수정은 캐시 무효화로 즉시 반영)
+    etag = make_etag(current_user.id, current_user.updated_at)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    out = MeOut(
+        id=str(current_user.id),
+        email=current_user.email,
+        username=current_user.username,
+        role=UserRole(current_user.role).value,
+    )
+    return with_etag(ModelResponse(out), etag)
@@ -1,28 +1,38 @@
 # app/features/auth/service.py
 from __future__ import annotations
 
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime, timedelta
-from typing import Any, cast
+from typing import Annotated, Any
 import uuid
 
-from fastapi import HTTPException, Request, status
+from fastapi import Depends, HTTPException, Request, status
 import jwt
-from passlib.context import CryptContext
 
 from app.core.config import settings
-from app.core.security import hash_refresh_token
+from app.core.db_routing import read_db
+from app.core.security import (
+    hash_api_key,
+    hash_password,
+    hash_refresh_token,
+    password_needs_rehash,
+    verify_password,
+)
+from app.core.tasks import spawn
+from app.features.auth.apikeys import resolve_api_key
 from app.features.auth.repository import AuthRepository  # Tortoise 기반 레포
+from app.features.auth.revocation import revoked_jtis
 from app.features.auth.schemas import LoginIn, MeOut
 from app.features.auth.tokens import (
     create_access_token,
     create_refresh_token,
     decode_jwt,
+    forget_token,
     is_refresh,
 )
+from app.features.users.cache import cache_key, remember_user, user_cache
 from app.features.users.models import User  # Tortoise 모델
 
-pwd = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
 
 # ─────────────────────────────────────────────────────────
 # 공용 유틸
@@ -52,11 +62,8 @@ def _extract_bearer_token(request: Request) -> str:
 # 헬퍼: 액세스 토큰 디코드/기본 검증
 def _decode_access_token(token: str) -> dict[str, Any]:
     try:
-        payload: dict[str, Any] = cast(
-            dict[str, Any],
-            jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM]),
-        )
-        return payload  # ← Dict[str, Any] 보장
+        # 검증 캐시 경유(같은 토큰 재요청 시 디코드/HMAC 생략)
+        payload = decode_jwt(token, algorithms=[settings.JWT_ALGORITHM])
     except jwt.ExpiredSignatureError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Token expired"
@@ -65,6 +72,14 @@ def _decode_access_token(token: str) -> dict[str, Any]:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token"
         ) from None
+    ensure_not_revoked(payload)
+    return payload
+
+
+# 헬퍼: 로그아웃(세션 철회)된 토큰 차단 — 메모리 집합 조회만 수행
+def ensure_not_revoked(payload: dict[str, Any]) -> None:
+    if payload.get("jti") in revoked_jtis:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token revoked")
 
 
 # 헬퍼: sub → UUID 파싱 후 활성 유저 조회
@@ -76,11 +91,16 @@ async def _load_active_user_from_sub(sub: str) -> User:
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token subject"
         ) from None
 
-    # 1차: PK(UUID)로 조회
-    user = await User.get_or_none(id=u)
-    # 2차: 보조키(hex32)로 조회(필요 시)
-    if not user:
-        user = await User.get_or_none(id_bin_hex=u.hex)
+    # 0차: 프로세스 내 캐시(음성 캐시 포함)
+    hit, user = user_cache.lookup(cache_key(u))
+    if not hit:
+        # 1차: PK(UUID)로 조회(replica 라우팅)
+        db = read_db()
+        user = await User.get_or_none(id=u, using_db=db)
+        # 2차: 보조키(hex32)로 조회(필요 시)
+        if not user:
+            user = await User.get_or_none(id_bin_hex=u.hex, using_db=db)
+        remember_user(u, user)
 
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
@@ -110,6 +130,51 @@ async def get_current_user(request: Request) -> User:
     return await _load_active_user_from_sub(sub_val)
 
 
+# --------- 의존성: API 키(X-API-Key) 사용자 ---------
+async def get_api_key_user(request: Request) -> User:
+    """
+    X-API-Key 헤더로 서버 간 호출자를 인증한다.
+    - 키 해시 조회는 캐시 경유, last_used_at은 주기적으로 일괄 기록
+    - 키의 스코프는 request.state.api_key_scopes에 보관
+    """
+    raw = request.headers.get("x-api-key")
+    if not raw:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated")
+    principal = await resolve_api_key(hash_api_key(raw))
+    if not principal:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="invalid api key")
+    request.state.api_key_scopes = principal.scopes
+    return principal.user
+
+
+# --------- 의존성: JWT 또는 API 키 ---------
+async def get_current_user_or_api_key(request: Request) -> User:
+    """X-API-Key 헤더가 있으면 API 키로, 없으면 액세스 토큰으로 인증"""
+    if "x-api-key" in request.headers:
+        return await get_api_key_user(request)
+    return await get_current_user(request)
+
+
+# --------- 의존성 팩토리: API 키 스코프 확인 ---------
+def require_scope(scope: str) -> Callable[..., Awaitable[User]]:
+    """
+    JWT 또는 API 키로 인증하되, API 키 호출이면 해당 스코프가 있어야 통과(없으면 403).
+    JWT 사용자는 스코프 개념이 없으므로 라우트의 역할 검사만 적용된다.
+    """
+
+    async def dependency(
+        request: Request, user: Annotated[User, Depends(get_current_user_or_api_key)]
+    ) -> User:
+        scopes = getattr(request.state, "api_key_scopes", None)
+        if scopes is not None and scope not in scopes:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN, detail=f"API key lacks scope: {scope}"
+            )
+        return user
+
+    return dependency
+
+
 # ─────────────────────────────────────────────────────────
 # 인증 도메인 서비스
 class AuthService:
@@ -123,20 +188,30 @@ class AuthService:
         ip: str | None = None,
         ua: str | None = None,
     ) -> tuple[str, str, int]:
-        user = await User.filter(email=payload.username).first()
+        # 자격 증명은 복제 지연 없이 primary에서 확인
+        user = await User.filter(email=payload.username).using_db(read_db(primary=True)).first()
 
-        if not user or not pwd.verify(payload.password, user.password_hash):
+        # bcrypt 검증은 워커 풀에서 실행(이벤트 루프 블로킹 방지)
+        if not user or not await verify_password(payload.password, user.password_hash):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="없는 회원정보입니다.",
             )
 
+        # 현재 bcrypt 비용과 다른 해시는 응답과 별개로 백그라운드에서 재해시
+        if password_needs_rehash(user.password_hash):
+            spawn(
+                cls._rehash_password(user.id, payload.password, user.password_hash),
+                name="password-rehash",
+            )
+
         # 토큰 생성 (sub = UUID 문자열)
         u: uuid.UUID = user.id if isinstance(user.id, uuid.UUID) else uuid.UUID(str(user.id))
         sub = str(u)
 
         access, access_jti, access_ttl = create_access_token(username=sub)
-        refresh, refresh_jti, _ = create_refresh_token(username=sub)
+        family_id = uuid.uuid4()
+        refresh, refresh_jti, refresh_exp = create_refresh_token(username=sub, family_id=family_id)
 
         # 세션 기록(access jti 기준) 및 만료
         access_exp = _utcnow() + timedelta(minutes=settings.JWT_ACCESS_EXPIRES_MIN)
@@ -149,13 +224,6 @@ class AuthService:
         )
 
         # 리프레시 토큰 저장(해시 + family)
-        family_id = uuid.uuid4()
-        r_payload = decode_jwt(refresh)
-        r_exp = r_payload.get("exp")
-        if not isinstance(r_exp, int):
-            raise HTTPException(status_code=400, detail="invalid refresh token exp")
-        refresh_exp = datetime.fromtimestamp(r_exp, tz=UTC)
-
         await cls.repo_cls.create_refresh_token_row(
             user_uuid=sub,
             jti=refresh_jti,
@@ -168,51 +236,54 @@ class AuthService:
 
         return access, refresh, access_ttl
 
+    @classmethod
+    async def _rehash_password(cls, user_id: uuid.UUID, password: str, old_hash: str) -> None:
+        new_hash = await hash_password(password)
+        await cls.repo_cls().users.update_password_hash(user_id, old=old_hash, new=new_hash)
+
     # ---- 리프레시 토큰으로 액세스 재발급 (로테이션 + 재사용 탐지) ----
-    async def refresh(self, *, refresh_token: str) -> tuple[str, str, int]:
+    async def refresh(
+        self,
+        *,
+        refresh_token: str,
+        ip: str | None = None,
+        ua: str | None = None,
+    ) -> tuple[str, str, int]:
         payload = decode_jwt(refresh_token)
         if not is_refresh(payload):
             raise HTTPException(status_code=400, detail="not a refresh token")
 
-        # 서버 보관 해시와 대조
-        token_hash = hash_refresh_token(refresh_token)
-        rt = await self.repo_cls.get_refresh_by_hash(token_hash)
-        if not rt:
-            raise HTTPException(status_code=401, detail="invalid refresh token")
-
-        # 활성/유효 확인
-        if not await self.repo_cls.is_refresh_active_and_valid(rt):
-            # 재사용/만료 등 비정상 → 같은 family 전량 차단
-            await self.repo_cls.revoke_family(rt.family_id)
-            raise HTTPException(status_code=401, detail="reused or expired refresh token")
-
-        # 정상 사용 흔적
-        await self.repo_cls.mark_refresh_used(rt.id)
-        # 로테이션: 현 토큰 revoke
-        await self.repo_cls.revoke_refresh_by_id(rt.id)
-
         user_uuid = payload["sub"]
-        access, _, access_ttl = create_access_token(username=user_uuid)
-        new_refresh, new_refresh_jti, _ = create_refresh_token(username=user_uuid)
+        fam = payload.get("fam")
+        family_id = uuid.UUID(fam) if isinstance(fam, str) else None
 
-        # 새 리프레시 저장(같은 family 유지)
-        new_payload = decode_jwt(new_refresh)
-        new_exp_ts = new_payload.get("exp")
-        if not isinstance(new_exp_ts, int):
-            raise HTTPException(status_code=400, detail="invalid refresh token exp")
-        new_exp = datetime.fromtimestamp(new_exp_ts, tz=UTC)
+        access, _, access_ttl = create_access_token(username=user_uuid)
+        new_refresh, new_refresh_jti, new_exp = create_refresh_token(
+            username=user_uuid, family_id=family_id
+        )
 
-        await self.repo_cls.create_refresh_token_row(
+        # 서버 보관 해시와 대조 + 로테이션을 한 트랜잭션(CAS)으로 처리
+        token_hash = hash_refresh_token(refresh_token)
+        rotated = await self.repo_cls.rotate_refresh_token(
+            old_hash=token_hash,
             user_uuid=user_uuid,
+            family_id=family_id,
             jti=new_refresh_jti,
             token_hash=hash_refresh_token(new_refresh),
-            family_id=rt.family_id,
             expires_at=new_exp,
-            ip=rt.ip_address,
-            ua=rt.user_agent,
+            ip=ip,
+            ua=ua,
         )
+        if rotated:
+            return access, new_refresh, access_ttl
 
-        return access, new_refresh, access_ttl
+        # 실패 경로에서만 원인 판별
+        rt = await self.repo_cls.get_refresh_by_hash(token_hash)
+        if not rt:
+            raise HTTPException(status_code=401, detail="invalid refresh token")
+        # 재사용/만료 등 비정상 → 같은 family 전량 차단
+        await self.repo_cls.revoke_family(rt.family_id)
+        raise HTTPException(status_code=401, detail="reused or expired refresh token")
 
     # ---- 로그아웃(현재 세션 철회) ----
     async def logout(self, *, access_token: str) -> None:
@@ -220,12 +291,16 @@ class AuthService:
         jti = payload.get("jti")
         if jti:
             await self.repo_cls.revoke_session_by_jti(jti)
+            # 이 워커는 즉시 차단, 다른 워커는 revoked_at 동기화로 반영
+            revoked_jtis.add(jti, payload["exp"])
+        forget_token(access_token)
 
     # ---- API 키 해시로 사용자 확인(백오피스/게이트웨이) ----
     async def get_user_by_apikey_hash(self, *, key_hash: str) -> MeOut:
-        user = await self.repo_cls.get_apikey_owner(key_hash)
-        if not user:
+        principal = await resolve_api_key(key_hash)
+        if not principal:
             raise HTTPException(status_code=401, detail="invalid api key")
+        user = principal.user
         u: uuid.UUID = user.id if isinstance(user.id, uuid.UUID) else uuid.UUID(str(user.id))
         return MeOut(id=str(u), email=user.email, username=user.username, role=str(user.role.value))
 
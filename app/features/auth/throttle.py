@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from app.core.config import settings
+from app.core.ratelimit import (
+    THROTTLED,
+    InMemoryTokenBucket,
+    RateLimitBackend,
+    retry_after_seconds,
+)
+from app.shared.errors import too_many_requests
+
+# ─────────────────────────────────────────────────────────────
+# 로그인 스로틀링: IP별 + 사용자명별 토큰 버킷
+# - AuthService.login_password 이전에 실행 → 거부 시 DB/bcrypt를 전혀 건드리지 않음
+# ─────────────────────────────────────────────────────────────
+
+
+class LoginThrottle:
+    def __init__(self, backend: RateLimitBackend) -> None:
+        self.backend = backend
+
+    async def check(self, *, ip: str | None, username: str) -> None:
+        if not settings.LOGIN_THROTTLE_ENABLED:
+            return
+
+        # IP 버킷을 먼저 확인: 이미 막힌 IP가 다른 사람의 사용자명 버킷을 소진(잠금)하지 못하게 함
+        if ip:
+            self._reject_if_waiting(
+                await self.backend.consume(
+                    f"login:ip:{ip}",
+                    rate=settings.LOGIN_RATE_PER_IP_PER_MIN / 60,
+                    burst=settings.LOGIN_BURST_PER_IP,
+                )
+            )
+        self._reject_if_waiting(
+            await self.backend.consume(
+                f"login:user:{username.strip().lower()}",
+                rate=settings.LOGIN_RATE_PER_USER_PER_MIN / 60,
+                burst=settings.LOGIN_BURST_PER_USER,
+            )
+        )
+
+    @staticmethod
+    def _reject_if_waiting(wait: float) -> None:
+        if wait > 0:
+            THROTTLED.inc()
+            too_many_requests("too many login attempts", retry_after=retry_after_seconds(wait))
+
+
+login_throttle = LoginThrottle(InMemoryTokenBucket(max_keys=settings.LOGIN_THROTTLE_MAX_KEYS))
@@ -1,4 +1,6 @@
 from datetime import UTC, datetime, timedelta
+import hashlib
+import time
 from typing import Any
 import uuid
 
@@ -6,9 +8,19 @@ import jwt
 
 # settings.SECRET_KEY, ACCESS_TOKEN_EXPIRE_MINUTES 활용
 from app.core.config import settings
+from app.shared.utils.cache import TTLCache
 
 ALGO = "HS256"
 
+# 검증 완료 토큰 캐시: blake2b(token) → (허용 알고리즘, 클레임)
+# - 항목 TTL = 토큰 exp까지 남은 시간 → 만료 토큰은 캐시에서도 자연 소멸
+# - 원문 토큰 대신 다이제스트만 보관
+_verified: TTLCache[bytes, tuple[tuple[str, ...], dict[str, Any]]] = TTLCache(
+    maxsize=settings.TOKEN_CACHE_SIZE,
+    ttl=settings.JWT_ACCESS_EXPIRES_MIN * 60,
+    name="token_cache",
+)
+
 
 def _utcnow() -> datetime:
     return datetime.now(UTC)
@@ -20,8 +32,9 @@ def create_jwt(
     jti: str | None = None,
     minutes: int = 60,
     extra: dict[str, Any] | None = None,
+    now: datetime | None = None,
 ) -> str:
-    now = _utcnow()
+    now = now or _utcnow()
     payload = {
         "iss": "flueman",
         "sub": sub,
@@ -34,9 +47,34 @@ def create_jwt(
     return jwt.encode(payload, settings.JWT_SECRET, algorithm=ALGO)
 
 
-def decode_jwt(token: str):
+def _token_digest(token: str) -> bytes:
+    return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+
+def decode_jwt(token: str, *, algorithms: list[str] | None = None) -> dict[str, Any]:
+    """
+    서명/만료 검증 후 클레임 반환. 같은 토큰의 재검증은 캐시로 건너뛴다.
+    - 호출자가 수정해도 캐시가 오염되지 않도록 사본을 반환
+    """
+    algs = tuple(algorithms or (ALGO,))
+    key = _token_digest(token)
+    cached = _verified.get(key)
+    if cached is not None and cached[0] == algs:
+        return dict(cached[1])
+
     # 필요 시 audience/issuer 검증 옵션 추가
-    return jwt.decode(token, settings.JWT_SECRET, algorithms=[ALGO])
+    claims: dict[str, Any] = jwt.decode(token, settings.JWT_SECRET, algorithms=list(algs))
+
+    # 리프레시 토큰은 로테이션으로 1회만 쓰이므로 캐시하지 않음
+    exp = claims.get("exp")
+    if not is_refresh(claims) and isinstance(exp, int | float):
+        _verified.set(key, (algs, claims), ttl=exp - time.time())
+    return dict(claims)
+
+
+def forget_token(token: str) -> None:
+    """철회(로그아웃 등)된 토큰을 검증 캐시에서 제거"""
+    _verified.pop(_token_digest(token))
 
 
 def create_access_token(
@@ -56,11 +94,26 @@ def create_access_token(
     return token, jti, ttl * 60  # seconds
 
 
-def create_refresh_token(username: str, *, minutes: int = 60 * 24 * 14) -> tuple[str, str, int]:
-    # 기본 14일
+def create_refresh_token(
+    username: str,
+    *,
+    family_id: uuid.UUID | None = None,
+    minutes: int = 60 * 24 * 14,
+) -> tuple[str, str, datetime]:
+    """
+    리프레시 토큰 발급 → (토큰, jti, 만료 시각)
+    - 기본 14일
+    - fam 클레임에 family를 실어 로테이션 시 기존 행 재조회 없이 새 행을 만든다
+    - 만료 시각을 직접 반환(발급 직후 다시 디코드할 필요 없음)
+    """
+    now = _utcnow()
     jti = str(uuid.uuid4())
-    token = create_jwt(sub=username, jti=jti, minutes=minutes, extra={"typ": "refresh"})
-    return token, jti, minutes * 60
+    extra: dict[str, Any] = {"typ": "refresh"}
+    if family_id is not None:
+        extra["fam"] = str(family_id)
+    token = create_jwt(sub=username, jti=jti, minutes=minutes, extra=extra, now=now)
+    expires_at = datetime.fromtimestamp(int((now + timedelta(minutes=minutes)).timestamp()), UTC)
+    return token, jti, expires_at
 
 
 def is_refresh(payload: dict[str, Any]) -> bool:
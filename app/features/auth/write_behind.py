@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import time
+from typing import TypeVar
+import uuid
+
+from tortoise.exceptions import IntegrityError
+from tortoise.models import Model
+
+from app.core import metrics
+from app.core.config import settings
+from app.core.tasks import PeriodicTask
+from app.features.auth.models import RefreshToken, Session
+
+# ─────────────────────────────────────────────────────────────
+# 로그인 시 생성되는 Session / RefreshToken 행의 write-behind 버퍼
+# - 행은 메모리에 모았다가 크기/시간 임계치에서 bulk_create로 일괄 INSERT
+# - 조회(리프레시 검증 등)는 버퍼를 먼저 확인 → 아직 안 써진 행도 보임
+# - 갱신/철회가 필요한 행은 해당 연산 직전에 flush하여 DB에 먼저 반영
+# - 종료 시 lifespan에서 남은 행을 모두 flush
+# - bulk INSERT가 실패하면 행 단위로 재시도: 제약 위반(중복 jti 등) 행은 로그 후 폐기,
+#   그 외 오류(DB 장애 등)는 남은 행을 버퍼에 두고 다음 flush에서 재시도
+# - 버퍼는 프로세스 메모리 → 워커 1개일 때만 사용(다른 워커는 기록 전 행을 못 봄)
+# ─────────────────────────────────────────────────────────────
+FLUSHED_ROWS = metrics.counter("auth_write_behind_rows_flushed_total", "Rows written by flushes")
+FLUSH_DURATION = metrics.summary("auth_write_behind_flush_seconds", "Duration of a flush")
+FLUSH_ERRORS = metrics.counter("auth_write_behind_flush_errors_total", "Failed flushes")
+DROPPED_ROWS = metrics.counter("auth_write_behind_rows_dropped_total", "Rows dropped as invalid")
+
+M = TypeVar("M", bound=Model)
+
+
+class AuthWriteBehind:
+    def __init__(self, *, max_rows: int, interval: float) -> None:
+        self.max_rows = max_rows
+        self.interval = interval
+        self._sessions: dict[str, Session] = {}  # jti → 행
+        self._refresh: dict[str, RefreshToken] = {}  # token_hash → 행
+        self._lock = asyncio.Lock()
+        self._flusher = PeriodicTask("auth-write-behind", interval=interval, fn=self.flush)
+
+    @property
+    def pending(self) -> int:
+        return len(self._sessions) + len(self._refresh)
+
+    # ---------- 적재 ----------
+    async def add_session(self, row: Session) -> None:
+        self._sessions[row.jti] = row
+        await self._after_add()
+
+    async def add_refresh(self, row: RefreshToken) -> None:
+        self._refresh[row.token_hash] = row
+        await self._after_add()
+
+    async def _after_add(self) -> None:
+        if self.pending < self.max_rows:
+            return
+        if self._flusher.running:
+            self._flusher.trigger()
+        else:
+            # 백그라운드 flusher가 없으면(테스트/스크립트) 호출 측에서 바로 기록
+            await self.flush()
+
+    # ---------- 조회 ----------
+    def get_refresh(self, token_hash: str) -> RefreshToken | None:
+        return self._refresh.get(token_hash)
+
+    def has_session(self, jti: str) -> bool:
+        return jti in self._sessions
+
+    def has_family(self, family_id: uuid.UUID) -> bool:
+        return any(rt.family_id == family_id for rt in self._refresh.values())
+
+    # ---------- 기록 ----------
+    async def flush(self) -> int:
+        async with self._lock:
+            sessions = list(self._sessions.values())
+            refresh = list(self._refresh.values())
+            if not sessions and not refresh:
+                return 0
+            started = time.perf_counter()
+            written = 0
+            try:
+                # 테이블별로 기록 직후 버퍼에서 제거(부분 실패 시 중복 INSERT 방지,
+                # flush 중 새로 들어온 행은 유지)
+                if sessions:
+                    written += await _write(Session, sessions, self._sessions, lambda s: s.jti)
+                if refresh:
+                    written += await _write(
+                        RefreshToken, refresh, self._refresh, lambda rt: rt.token_hash
+                    )
+            except Exception:
+                FLUSH_ERRORS.inc()
+                raise
+            finally:
+                FLUSHED_ROWS.inc(written)
+                FLUSH_DURATION.observe(time.perf_counter() - started)
+            return written
+
+    # ---------- 수명주기 ----------
+    def start(self) -> None:
+        self._flusher.start()
+
+    async def stop(self) -> None:
+        await self._flusher.stop()
+        await self.flush()
+
+
+async def _write(
+    model: type[M], rows: list[M], buffer: dict[str, M], key: Callable[[M], str]
+) -> int:
+    """rows를 INSERT하고 버퍼에서 제거, 기록한 행 수 반환"""
+    try:
+        await model.bulk_create(rows)
+    except IntegrityError:
+        # 한 행의 제약 위반이 버퍼 전체를 막지 않도록 행 단위로 재시도
+        FLUSH_ERRORS.inc()
+    else:
+        for row in rows:
+            buffer.pop(key(row), None)
+        return len(rows)
+
+    written = 0
+    for row in rows:
+        try:
+            await row.save(force_create=True)
+        except IntegrityError as e:
+            DROPPED_ROWS.inc()
+            print(f"⚠️ write-behind 행 폐기({model.__name__} {key(row)}): {e!r}")
+        else:
+            written += 1
+        buffer.pop(key(row), None)
+    return written
+
+
+write_behind = AuthWriteBehind(
+    max_rows=settings.AUTH_WRITE_BEHIND_MAX_ROWS,
+    interval=settings.AUTH_WRITE_BEHIND_INTERVAL_SEC,
+)
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import time
+from typing import Any
+
+from app.core.config import settings
+from app.core.db import pool_stats
+from app.core.startup import startup
+from app.core.tasks import all_tasks
+
+# ─────────────────────────────────────────────────────────────
+# 준비 상태(readiness) 점검
+# - 기동 완료, DB 연결(SELECT 1), 풀 포화, 백그라운드 작업 상태
+# - 결과를 READINESS_CACHE_TTL_SEC 동안 재사용하고, 만료 시점에 동시에 들어온
+#   프로브는 진행 중인 점검 하나를 함께 기다림 → 프로브 빈도와 무관하게 DB 핑은 주기당 1회
+# ─────────────────────────────────────────────────────────────
+Check = tuple[bool, dict[str, Any]]
+
+
+async def _ping_db() -> None:
+    from tortoise import connections
+
+    await asyncio.gather(*(conn.execute_query("SELECT 1") for conn in connections.all()))
+
+
+async def check_db() -> Check:
+    if not startup.db_ready:
+        return False, {"error": "not initialized"}
+    started = time.perf_counter()
+    try:
+        await asyncio.wait_for(_ping_db(), timeout=settings.READINESS_DB_TIMEOUT_SEC)
+    except Exception as e:
+        return False, {"error": repr(e)}
+    return True, {"latency_ms": round((time.perf_counter() - started) * 1000, 1)}
+
+
+def check_pool() -> Check:
+    # 모든 연결이 사용 중이고 대기자까지 있으면 포화(새 트래픽을 받지 않도록)
+    pools = pool_stats()["pools"]
+    saturated = [
+        name for name, p in pools.items() if p["in_use"] >= p["max_size"] and p["waiting"] > 0
+    ]
+    return not saturated, {"saturated": saturated}
+
+
+def check_tasks() -> Check:
+    failing = {
+        t.name: t.last_error or "stopped"
+        for t in all_tasks()
+        if t.crashed or t.consecutive_failures >= settings.READINESS_MAX_TASK_FAILURES
+    }
+    return not failing, {"failing": failing}
+
+
+async def run_checks() -> dict[str, Any]:
+    db_ok, db = await check_db()
+    pool_ok, pool = check_pool()
+    tasks_ok, tasks = check_tasks()
+    checks = {
+        "startup": {"ok": startup.completed},
+        "db": {"ok": db_ok, **db},
+        "pool": {"ok": pool_ok, **pool},
+        "tasks": {"ok": tasks_ok, **tasks},
+    }
+    ready = all(c["ok"] for c in checks.values())
+    return {"status": "ok" if ready else "unavailable", "checks": checks}
+
+
+class ReadinessProbe:
+    def __init__(
+        self,
+        *,
+        ttl: float,
+        check: Callable[[], Awaitable[dict[str, Any]]] = run_checks,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self._check = check
+        self._clock = clock
+        self._result: dict[str, Any] | None = None
+        self._expires_at = 0.0
+        self._inflight: asyncio.Future[dict[str, Any]] | None = None
+
+    async def get(self) -> dict[str, Any]:
+        if self._result is not None and self._clock() < self._expires_at:
+            return self._result
+        if self._inflight is None:
+            self._inflight = asyncio.ensure_future(self._refresh())
+        # shield: 기다리던 프로브 하나가 끊겨도 다른 프로브가 공유하는 점검은 계속
+        return await asyncio.shield(self._inflight)
+
+    async def _refresh(self) -> dict[str, Any]:
+        try:
+            result = await self._check()
+            self._result = result
+            self._expires_at = self._clock() + self.ttl
+            return result
+        finally:
+            self._inflight = None
+
+    def invalidate(self) -> None:
+        self._result = None
+
+
+readiness = ReadinessProbe(ttl=settings.READINESS_CACHE_TTL_SEC)
@@ -1,4 +1,10 @@
-from fastapi import APIRouter
+from typing import Any
+
+from fastapi import APIRouter, status
+
+from app.core.db import pool_stats
+from app.features.health.readiness import readiness
+from app.shared.responses import FastJSONResponse
 
 router = APIRouter(prefix="/health", tags=["health"])
 
@@ -6,3 +12,23 @@ router = APIRouter(prefix="/health", tags=["health"])
 @router.get("", summary="Health check")
 def health():
     return {"status": "ok"}
+
+
+@router.get("/live", summary="Liveness probe")
+def live():
+    # 프로세스/이벤트 루프만 확인(의존성 장애로 재시작되지 않도록 DB는 보지 않음)
+    return {"status": "ok"}
+
+
+@router.get("/ready", summary="Readiness probe")
+async def ready() -> FastJSONResponse:
+    # DB/풀/백그라운드 작업 점검, 결과는 READINESS_CACHE_TTL_SEC 동안 공유
+    result = await readiness.get()
+    code = status.HTTP_200_OK if result["status"] == "ok" else status.HTTP_503_SERVICE_UNAVAILABLE
+    return FastJSONResponse(result, status_code=code)
+
+
+@router.get("/pool", summary="DB connection pool statistics")
+def pool() -> dict[str, Any]:
+    # 사용 중/유휴/대기 연결 수, 획득 대기 시간, 획득 타임아웃 횟수(오토스케일링 지표)
+    return pool_stats()
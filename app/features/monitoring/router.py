@@ -0,0 +1,14 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.metrics import PROMETHEUS_CONTENT_TYPE
+from app.core.metrics_multiproc import render_all
+
+router = APIRouter(tags=["monitoring"])
+
+
+@router.get("/metrics", summary="Prometheus metrics", include_in_schema=False)
+async def prometheus_metrics() -> PlainTextResponse:
+    # async: 기록과 같은 이벤트 루프 스레드에서 읽음(히스토그램은 락 없음)
+    # 멀티 워커(METRICS_MULTIPROC_DIR)면 어느 워커가 받아도 전체 워커 합계
+    return PlainTextResponse(render_all(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+import uuid
+
+from app.core.config import settings
+from app.features.users.models import User
+from app.shared.utils.cache import TTLCache
+from app.shared.utils.counts import CountCache, RowCounter
+
+# ─────────────────────────────────────────────────────────────
+# 인증 사용자 캐시: sub(UUID) → User | None(음성 캐시)
+# - 프로세스 단위 캐시이므로 다른 워커의 변경은 TTL 이내에 반영됨
+# - 같은 프로세스의 변경은 UsersRepository가 즉시 무효화
+# - 사용자를 함께 들고 있는 다른 캐시(API 키 등)는 on_invalidate로 훅 등록
+# ─────────────────────────────────────────────────────────────
+user_cache: TTLCache[str, User | None] = TTLCache(
+    maxsize=settings.USER_CACHE_SIZE,
+    ttl=settings.USER_CACHE_TTL_SEC,
+    name="user_cache",
+)
+
+
+def cache_key(user_id: uuid.UUID | str) -> str:
+    # 하이픈 포함/미포함 표기를 모두 같은 키로 정규화
+    if isinstance(user_id, uuid.UUID):
+        return user_id.hex
+    return uuid.UUID(str(user_id)).hex
+
+
+def remember_user(user_id: uuid.UUID | str, user: User | None) -> None:
+    if user is None:
+        user_cache.set(cache_key(user_id), None, ttl=settings.USER_CACHE_NEGATIVE_TTL_SEC)
+    else:
+        user_cache.set(cache_key(user_id), user)
+
+
+_invalidation_hooks: list[Callable[[str], None]] = []
+
+
+def on_invalidate(hook: Callable[[str], None]) -> None:
+    """invalidate_user 시 cache_key(user_id)로 호출될 훅 등록"""
+    _invalidation_hooks.append(hook)
+
+
+def invalidate_user(*user_ids: uuid.UUID | str) -> None:
+    for user_id in user_ids:
+        key = cache_key(user_id)
+        user_cache.pop(key)
+        for hook in _invalidation_hooks:
+            hook(key)
+
+
+# ─────────────────────────────────────────────────────────────
+# 목록 total
+# - users_total: 전체 사용자 수(이 프로세스의 가입 +1 / 삭제 -1, 주기적 COUNT(*) 보정)
+# - count_cache: 검색 등 필터가 있는 목록의 COUNT를 쿼리 형태별로 TTL 캐시
+# ─────────────────────────────────────────────────────────────
+users_total = RowCounter(User, resync=settings.USER_COUNT_RESYNC_SEC)
+count_cache = CountCache(
+    maxsize=settings.COUNT_CACHE_SIZE,
+    ttl=settings.COUNT_CACHE_TTL_SEC,
+    name="count_cache",
+)
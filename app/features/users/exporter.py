@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+import csv
+import io
+import json
+from typing import Literal
+
+from app.core.config import settings
+from app.features.users.models import User, UserRole
+from app.features.users.repository import UsersRepository
+
+ExportFormat = Literal["csv", "ndjson"]
+
+# ─────────────────────────────────────────────────────────────
+# 사용자 내보내기(스트리밍)
+# - 키셋 청크를 읽는 즉시 직렬화해 StreamingResponse로 흘려보냄 → 메모리 일정
+# - password_hash는 조회/출력하지 않음
+# ─────────────────────────────────────────────────────────────
+EXPORT_FIELDS = (
+    "id",
+    "username",
+    "email",
+    "phone_number",
+    "role",
+    "is_active",
+    "created_at",
+    "updated_at",
+)
+MEDIA_TYPES: dict[ExportFormat, str] = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def _row(u: User) -> dict[str, object]:
+    return {
+        "id": str(u.id),
+        "username": u.username,
+        "email": u.email,
+        "phone_number": u.phone_number,
+        "role": UserRole(u.role).value,
+        "is_active": bool(u.is_active),
+        "created_at": u.created_at.isoformat(),
+        "updated_at": u.updated_at.isoformat(),
+    }
+
+
+def _ndjson_chunk(users: list[User]) -> bytes:
+    return "".join(json.dumps(_row(u), ensure_ascii=False) + "\n" for u in users).encode()
+
+
+def _csv_chunk(users: list[User], *, header: bool) -> bytes:
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=EXPORT_FIELDS, lineterminator="\n")
+    if header:
+        writer.writeheader()
+    writer.writerows(_row(u) for u in users)
+    return buf.getvalue().encode()
+
+
+async def export_users(
+    fmt: ExportFormat, repo: UsersRepository | None = None
+) -> AsyncIterator[bytes]:
+    repo = repo or UsersRepository()
+    header = fmt == "csv"
+    async for users in repo.iter_chunks(
+        chunk_size=settings.USER_EXPORT_CHUNK_SIZE, fields=EXPORT_FIELDS
+    ):
+        if fmt == "ndjson":
+            yield _ndjson_chunk(users)
+        else:
+            yield _csv_chunk(users, header=header)
+            header = False
+    if header:  # 사용자가 0명이어도 CSV 헤더는 출력
+        yield _csv_chunk([], header=True)
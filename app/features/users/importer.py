@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+import codecs
+from collections.abc import AsyncIterable, AsyncIterator
+import csv
+import json
+from typing import Any, Literal
+import uuid
+
+from pydantic import ValidationError
+from tortoise.exceptions import IntegrityError
+from tortoise.transactions import in_transaction
+
+from app.core.config import settings
+from app.core.db_routing import PRIMARY, mark_write
+from app.core.security import hash_passwords
+from app.features.users.cache import users_total
+from app.features.users.models import User
+from app.features.users.schemas import ImportRowError, UserCreate, UsersImportReport
+from app.features.users.search import index_new_users
+
+ImportFormat = Literal["csv", "ndjson"]
+
+# ─────────────────────────────────────────────────────────────
+# 사용자 일괄 가입(스트리밍)
+# - 요청 본문을 줄 단위로 읽으며 USER_IMPORT_CHUNK_SIZE 행씩 처리 → 메모리 일정
+# - 청크마다: UserCreate 검증 → username/email IN 조회로 중복 검사
+#            → 프로세스 풀 병렬 해시 → bulk_create(트랜잭션)
+# - CSV는 첫 줄이 헤더, 필드 안 줄바꿈(따옴표 안 개행)은 지원하지 않음
+# ─────────────────────────────────────────────────────────────
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[str]:
+    """바이트 스트림 → UTF-8 줄(개행 제거). 청크 경계에 걸친 멀티바이트 문자도 안전."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    buf = ""
+    async for chunk in chunks:
+        buf += decoder.decode(chunk)
+        *lines, buf = buf.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    buf += decoder.decode(b"", final=True)
+    if buf:
+        yield buf.rstrip("\r")
+
+
+class _Report:
+    def __init__(self) -> None:
+        self.out = UsersImportReport()
+
+    def fail(self, line: int, username: str | None, *errors: str) -> None:
+        self.out.failed += 1
+        if len(self.out.errors) < settings.USER_IMPORT_MAX_ERRORS:
+            self.out.errors.append(
+                ImportRowError(line=line, username=username, errors=list(errors))
+            )
+        else:
+            self.out.errors_truncated = True
+
+
+def _validation_messages(e: ValidationError) -> list[str]:
+    return [f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}" for err in e.errors()]
+
+
+async def _parse_rows(
+    lines: AsyncIterable[str], fmt: ImportFormat, report: _Report
+) -> AsyncIterator[tuple[int, dict[str, Any]]]:
+    """(줄 번호, 원시 행) — 파싱 불가한 줄은 보고서에 기록하고 건너뜀"""
+    header: list[str] | None = None
+    lineno = 0
+    async for line in lines:
+        lineno += 1
+        if not line.strip():
+            continue
+
+        if fmt == "ndjson":
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                report.fail(lineno, None, f"invalid JSON: {e}")
+                continue
+            if not isinstance(row, dict):
+                report.fail(lineno, None, "each line must be a JSON object")
+                continue
+            yield lineno, row
+            continue
+
+        values = next(csv.reader([line]))
+        if header is None:
+            header = [h.strip() for h in values]
+            continue
+        if len(values) != len(header):
+            report.fail(lineno, None, f"expected {len(header)} columns, got {len(values)}")
+            continue
+        # 빈 칸은 생략 → 스키마 기본값(role, is_active) 적용
+        yield lineno, {k: v for k, v in zip(header, values, strict=True) if v != ""}
+
+
+async def _drop_duplicates(
+    rows: list[tuple[int, UserCreate]], report: _Report
+) -> list[tuple[int, UserCreate]]:
+    """청크 내 중복 + DB 중복을 IN 조회 2회로 검사해 통과한 행만 반환"""
+    taken_usernames: set[str] = {
+        str(v)
+        for v in await User.filter(username__in={u.username for _, u in rows}).values_list(
+            "username", flat=True
+        )
+    }
+    taken_emails: set[str] = {
+        str(v)
+        for v in await User.filter(email__in={u.email for _, u in rows}).values_list(
+            "email", flat=True
+        )
+    }
+
+    accepted: list[tuple[int, UserCreate]] = []
+    for lineno, u in rows:
+        errors = []
+        if u.username in taken_usernames:
+            errors.append("username: 이미 가입된 유저 아이디입니다.")
+        if u.email in taken_emails:
+            errors.append("email: 이미 가입된 email 입니다.")
+        if errors:
+            report.fail(lineno, u.username, *errors)
+            continue
+        taken_usernames.add(u.username)
+        taken_emails.add(u.email)
+        accepted.append((lineno, u))
+    return accepted
+
+
+async def _insert_chunk(rows: list[tuple[int, UserCreate]], report: _Report) -> None:
+    accepted = await _drop_duplicates(rows, report)
+    if not accepted:
+        return
+
+    # ── (2) 비밀번호 해시: 프로세스 풀 병렬 ───────────────────────
+    hashes = await hash_passwords([u.password for _, u in accepted])
+
+    users = []
+    for (_, u), password_hash in zip(accepted, hashes, strict=True):
+        uid = uuid.uuid4()
+        users.append(
+            User(
+                id=uid,
+                id_bin_hex=uid.hex,
+                email=u.email,
+                username=u.username,
+                phone_number=u.phone_number,
+                password_hash=password_hash,
+                role=u.role,
+                is_active=u.is_active,
+            )
+        )
+
+    mark_write()
+    # ── (3) 청크 단위 INSERT, 동시 가입과 경합하면 행 단위로 재시도해 원인 보고 ──
+    # (사용자 행과 검색 색인은 같은 트랜잭션)
+    try:
+        async with in_transaction(PRIMARY):
+            await User.bulk_create(users)
+            await index_new_users(users)
+        created = users
+    except IntegrityError:
+        created = []
+        for (lineno, u), user in zip(accepted, users, strict=True):
+            try:
+                async with in_transaction(PRIMARY):
+                    await user.save(force_create=True)
+                    await index_new_users([user])
+            except IntegrityError:
+                report.fail(lineno, u.username, "username/email: 이미 가입된 사용자입니다.")
+            else:
+                created.append(user)
+
+    users_total.add(len(created))
+    report.out.created += len(created)
+
+
+async def import_users(lines: AsyncIterable[str], fmt: ImportFormat) -> UsersImportReport:
+    report = _Report()
+    chunk: list[tuple[int, UserCreate]] = []
+
+    async for lineno, row in _parse_rows(lines, fmt, report):
+        try:
+            chunk.append((lineno, UserCreate.model_validate(row)))
+        except ValidationError as e:
+            username = row.get("username")
+            report.fail(
+                lineno, username if isinstance(username, str) else None, *_validation_messages(e)
+            )
+            continue
+        if len(chunk) >= settings.USER_IMPORT_CHUNK_SIZE:
+            await _insert_chunk(chunk, report)
+            chunk = []
+
+    if chunk:
+        await _insert_chunk(chunk, report)
+    return report.out
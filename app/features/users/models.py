@@ -16,7 +16,8 @@ class UserRole(str, Enum):
 class User(Model):
     class Meta:
         table = "users"
-        indexes = ("created_at",)  # idx_유저_created
+        # idx_유저_created_id: 키셋 페이지네이션 (created_at DESC, id DESC)
+        indexes = (("created_at", "id"),)
 
     # PK: UUID 문자열(CHAR(36))
     # 예: "xxxxxxxx-....-xxxx"
@@ -25,9 +26,11 @@ class User(Model):
     # 예: "f47ac10b58cc4372a5670e02b2c3d479"
     id_bin_hex = fields.CharField(max_length=32, null=False, unique=True)
 
-    username = fields.CharField(max_length=50, null=False)
-    email = fields.CharField(max_length=255, null=False)
-    phone_number = fields.CharField(max_length=20, null=False)
+    # 가입/로그인 조회 키: UNIQUE 인덱스(가입 시 사전검사와 동일한 제약)
+    username = fields.CharField(max_length=50, null=False, unique=True)
+    email = fields.CharField(max_length=255, null=False, unique=True)
+    # 보조 인덱스(중복 허용)
+    phone_number = fields.CharField(max_length=20, null=False, db_index=True)
     password_hash = fields.CharField(max_length=255, null=False)
 
     role = fields.CharEnumField(UserRole, null=False, default=UserRole.user.value)
@@ -55,3 +58,21 @@ class User(Model):
     @staticmethod
     def bytes_to_hex(b: bytes) -> str:
         return b.hex()  # 32자리 소문자
+
+
+class UserSearchToken(Model):
+    """
+    사용자 검색용 n-gram 역색인(username/email/phone_number의 소문자 3-gram).
+    - (token, user_id) UNIQUE 인덱스로 키워드 → 사용자 후보를 인덱스 조회
+    - 사용자 생성/수정 시 app.features.users.search.index_user로 동기화
+    """
+
+    class Meta:
+        table = "user_search_tokens"
+        unique_together = (("token", "user"),)
+
+    id = fields.BigIntField(pk=True)
+    user: fields.ForeignKeyRelation[User] = fields.ForeignKeyField(
+        "models.User", related_name="search_tokens", on_delete=fields.CASCADE
+    )
+    token = fields.CharField(max_length=3, null=False)
@@ -1,50 +1,97 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from typing import TypedDict, Unpack
 import uuid
 
-from tortoise.expressions import Q
+from tortoise.transactions import in_transaction
 
+from app.core.db_routing import PRIMARY, mark_write, read_db
+from app.features.users.cache import count_cache, invalidate_user, users_total
 from app.features.users.models import User
+from app.features.users.search import filter_by_keyword, index_user, unindex_user
+from app.shared.utils.keyset import keyset_page
 
 
 class UsersRepository:
     # ---------- 조회 ----------
-    async def get(self, user_uuid: str) -> User | None:
+    # 조회는 read_db()로 라우팅(replica 우선, 같은 요청의 쓰기 이후/primary=True면 primary)
+    async def get(self, user_uuid: str, *, primary: bool = False) -> User | None:
         """PK(문자열 UUID)로 조회"""
-        return await User.get_or_none(id=user_uuid)
+        return await User.get_or_none(id=user_uuid, using_db=read_db(primary=primary))
 
-    async def get_by_id_hex(self, id_hex32: str) -> User | None:
+    async def get_by_id_hex(self, id_hex32: str, *, primary: bool = False) -> User | None:
         """32자리 HEX로 직접 조회 (가장 빠름: UNIQUE 인덱스)"""
-        return await User.get_or_none(id_bin_hex=id_hex32.lower())
-
-    async def get_by_username(self, username: str) -> User | None:
-        return await User.get_or_none(username=username)
-
-    async def get_by_email(self, email: str) -> User | None:
-        return await User.get_or_none(email=email)
-
-    async def get_by_phone(self, phone: str) -> User | None:
-        return await User.get_or_none(phone_number=phone)
-
-    async def list_users(self, page: int, page_size: int) -> tuple[list[User], int]:
-        qs = User.all().order_by("-created_at")
-        total = await qs.count()
+        return await User.get_or_none(
+            id_bin_hex=id_hex32.lower(), using_db=read_db(primary=primary)
+        )
+
+    async def get_by_username(self, username: str, *, primary: bool = False) -> User | None:
+        return await User.get_or_none(username=username, using_db=read_db(primary=primary))
+
+    async def get_by_email(self, email: str, *, primary: bool = False) -> User | None:
+        return await User.get_or_none(email=email, using_db=read_db(primary=primary))
+
+    async def get_by_phone(self, phone: str, *, primary: bool = False) -> User | None:
+        return await User.get_or_none(phone_number=phone, using_db=read_db(primary=primary))
+
+    async def list_users(
+        self, page: int, page_size: int, *, primary: bool = False
+    ) -> tuple[list[User], int, bool]:
+        """(items, total, total 정확 여부)"""
+        qs = User.all().using_db(read_db(primary=primary)).order_by("-created_at", "-id")
+        # 전체 수는 증감으로 유지되는 카운터(매 요청 COUNT(*) 없음)
+        total, exact = await users_total.get()
         items = await qs.offset((page - 1) * page_size).limit(page_size)
         # items는 이미 list[User]로 materialize됨
-        return list(items), total
+        return list(items), total, exact
+
+    async def list_users_keyset(
+        self,
+        *,
+        cursor: str | None,
+        limit: int,
+        with_total: bool = False,
+        primary: bool = False,
+    ) -> tuple[list[User], str | None, int | None, bool]:
+        """
+        커서 모드: OFFSET/COUNT 없이 (created_at, id) 인덱스 범위 조회.
+        total은 요청 시에만 채움(+ 정확 여부). 잘못된 커서는 ValueError.
+        """
+        qs = User.all().using_db(read_db(primary=primary))
+        items, next_cursor = await keyset_page(qs, cursor=cursor, limit=limit)
+        if not with_total:
+            return items, next_cursor, None, False
+        total, exact = await users_total.get()
+        return items, next_cursor, total, exact
+
+    async def iter_chunks(
+        self, *, chunk_size: int, fields: tuple[str, ...]
+    ) -> AsyncIterator[list[User]]:
+        """
+        전체 사용자를 키셋 청크로 순회(내보내기용).
+        청크마다 독립 쿼리(autocommit) → 긴 트랜잭션/스냅샷을 붙잡지 않음.
+        """
+        cursor: str | None = None
+        qs = User.all().using_db(read_db()).only("id", "created_at", *fields)
+        while True:
+            items, cursor = await keyset_page(qs, cursor=cursor, limit=chunk_size)
+            if items:
+                yield items
+            if cursor is None:
+                return
 
     async def search(
-        self, *, keyword: str, page: int = 1, page_size: int = 20
-    ) -> tuple[list[User], int]:
-        qs = User.filter(
-            Q(username__icontains=keyword)
-            | Q(email__icontains=keyword)
-            | Q(phone_number__icontains=keyword)
-        ).order_by("-created_at")
-        total = await qs.count()
+        self, *, keyword: str, page: int = 1, page_size: int = 20, primary: bool = False
+    ) -> tuple[list[User], int, bool]:
+        """(items, total, total 정확 여부) — total은 키워드별 COUNT 캐시를 거침"""
+        # n-gram 역색인으로 후보를 추린 뒤 페이지 조회(전체 테이블 LIKE 스캔 없음)
+        qs = (await filter_by_keyword(keyword, using_db=read_db(primary=primary))).order_by(
+            "-created_at", "-id"
+        )
+        total, exact = await count_cache.count(f"users:search:{keyword.strip().lower()}", qs)
         items = await qs.offset((page - 1) * page_size).limit(page_size)
-        return list(items), total
+        return list(items), total, exact
 
     # ---------- 부분 업데이트 ----------
     class UserUpdateFields(TypedDict, total=False):
@@ -59,12 +106,31 @@ class UsersRepository:
         id / id_bin / id_bin_hex는 불변 권장.
         (동기화 이슈 방지를 위해 별도 메서드로 처리)
         """
+        changed: list[str] = []
         for k, v in fields.items():
             if v is not None:
                 setattr(user, k, v)
-        await user.save()
+                changed.append(k)
+        mark_write()
+        async with in_transaction(PRIMARY):
+            # 바뀐 컬럼만 UPDATE(다른 요청이 바꾼 role/is_active 등을 덮어쓰지 않도록)
+            await user.save(update_fields=[*changed, "updated_at"])
+            # 검색 대상 필드가 바뀌면 같은 트랜잭션에서 n-gram 색인 갱신
+            if "username" in fields or "phone_number" in fields:
+                await index_user(user)
+        # 비활성화/권한 변경이 인증 캐시에 즉시 반영되도록 무효화
+        invalidate_user(user.id)
         return user
 
+    async def update_password_hash(self, user_id: uuid.UUID, *, old: str, new: str) -> bool:
+        """
+        비밀번호 해시 교체(재해시용). 그사이 비밀번호가 바뀌었으면 덮어쓰지 않는다.
+        """
+        mark_write()
+        updated = await User.filter(id=user_id, password_hash=old).update(password_hash=new)
+        invalidate_user(user_id)
+        return updated > 0
+
     # ---------- ID 교체(필요할 때만) ----------
     async def replace_id(
         self,
@@ -86,11 +152,22 @@ class UsersRepository:
         else:
             raise ValueError("새 ID가 필요합니다(new_uuid | new_hex32 중 하나).")
 
-        user.id = u
-        user.id_bin_hex = new_hex32
-        await user.save()
+        old_id = user.id
+        mark_write()
+        # 검색 토큰이 이전 PK를 참조하므로 먼저 제거 후 새 PK로 재색인(한 트랜잭션)
+        async with in_transaction(PRIMARY):
+            await unindex_user(old_id)
+            user.id = u
+            user.id_bin_hex = new_hex32
+            await user.save()
+            await index_user(user)
+        # 이전 ID 캐시와 새 ID의 음성 캐시를 모두 제거
+        invalidate_user(old_id, u)
         return user
 
     # ---------- 삭제 ----------
     async def delete(self, user: User) -> None:
+        mark_write()
         await user.delete()
+        invalidate_user(user.id)
+        users_total.add(-1)
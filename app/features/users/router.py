@@ -1,24 +1,34 @@
 from __future__ import annotations
 
-from typing import Annotated
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
-from app.features.auth.service import get_current_user
+from app.features.auth.apikeys import SCOPE_USERS_ADMIN, SCOPE_USERS_READ, SCOPE_USERS_WRITE
+from app.features.auth.service import require_scope
+from app.features.users.exporter import MEDIA_TYPES, ExportFormat, export_users
+from app.features.users.importer import ImportFormat, import_users, iter_lines
 from app.features.users.models import User as UserModel
 from app.features.users.models import UserRole
 from app.features.users.schemas import (
     UserCreate,
     UserResponse,
+    UsersImportReport,
     UsersListResponse,
     UserUpdate,
 )
 from app.features.users.service import UsersService
+from app.shared.errors import bad_request
+from app.shared.etag import etag_matches, make_etag, not_modified, with_etag
+from app.shared.responses import ModelResponse
 
 router = APIRouter(prefix="/user", tags=["user"])
 
-# 의존성 타입 별칭(선택)
-CurUser = Annotated[UserModel, Depends(get_current_user)]
+# 의존성 타입 별칭(선택) — 액세스 토큰 또는 서버 간 X-API-Key(키는 스코프 필요)
+ReadUser = Annotated[UserModel, Depends(require_scope(SCOPE_USERS_READ))]
+WriteUser = Annotated[UserModel, Depends(require_scope(SCOPE_USERS_WRITE))]
+AdminUser = Annotated[UserModel, Depends(require_scope(SCOPE_USERS_ADMIN))]
 
 
 def _require_admin(user: UserModel) -> None:
@@ -47,31 +57,89 @@ async def create_user(
     return await UsersService.create_user(user)
 
 
+@router.post("/import", response_model=UsersImportReport)
+async def import_users_bulk(
+    request: Request,
+    current_user: AdminUser,
+    fmt: Annotated[
+        ImportFormat | None, Query(alias="format", description="미지정 시 Content-Type")
+    ] = None,
+) -> UsersImportReport:
+    """
+    admin 전용 일괄 가입. 본문은 CSV(text/csv, 첫 줄 헤더) 또는 NDJSON(application/x-ndjson).
+    본문을 스트리밍으로 처리하며 행별 오류 보고서를 반환.
+    """
+    _require_admin(current_user)
+
+    if fmt is None:
+        content_type = request.headers.get("content-type", "")
+        if "csv" in content_type:
+            fmt = "csv"
+        elif "ndjson" in content_type or "jsonl" in content_type:
+            fmt = "ndjson"
+        else:
+            bad_request("format=csv|ndjson 또는 Content-Type(text/csv, application/x-ndjson) 필요")
+
+    return await import_users(iter_lines(request.stream()), fmt)
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_users_stream(
+    current_user: AdminUser,
+    fmt: Annotated[ExportFormat, Query(alias="format")] = "ndjson",
+) -> StreamingResponse:
+    """
+    admin 전용 전체 사용자 내보내기(NDJSON/CSV 스트리밍, password_hash 제외)
+    """
+    _require_admin(current_user)
+    return StreamingResponse(
+        export_users(fmt),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="users.{fmt}"'},
+    )
+
+
 @router.get("/", response_model=UsersListResponse)
 async def list_users(
-    current_user: CurUser,
+    current_user: AdminUser,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=200),
-) -> UsersListResponse:
+    mode: Literal["page", "cursor"] = Query("page"),
+    cursor: str | None = Query(None, description="이전 응답의 next_cursor (지정 시 cursor 모드)"),
+    with_total: bool = Query(False, description="cursor 모드에서 전체 사용자 수(total) 포함 여부"),
+) -> ModelResponse:
     """
     admin만 전체 목록 조회 가능
+    - page 모드(기본): page/page_size + total(카운터 값이면 total_exact=False)
+    - cursor 모드: next_cursor로 이어서 조회, 깊은 페이지도 일정 비용
     """
     _require_admin(current_user)
 
     svc = UsersService()
-    items, total = await svc.list_users(page, page_size)
-    return UsersListResponse(items=items, total=total)
+    if mode == "cursor" or cursor is not None:
+        items, next_cursor, total, exact = await svc.list_users_cursor(
+            cursor, page_size, with_total=with_total
+        )
+        return ModelResponse(
+            UsersListResponse(items=items, total=total, total_exact=exact, next_cursor=next_cursor)
+        )
+
+    items, total, exact = await svc.list_users(page, page_size)
+    # 서비스에서 한 번 검증한 모델을 그대로 직렬화(response_model 재검증 생략)
+    return ModelResponse(UsersListResponse(items=items, total=total, total_exact=exact))
 
 
 @router.get("/{username}", response_model=UserResponse)
 async def get_user(
     username: str,
-    current_user: CurUser,
-) -> UserResponse:
+    current_user: ReadUser,
+    request: Request,
+) -> Response:
     """
     - admin: 아무나 조회 가능
     - manager: 아무나 '단일' 조회 가능(목록 X)
     - user: 자기 자신만 조회 가능
+    - If-None-Match가 대상의 현재 버전과 같으면 직렬화 없이 304
     """
     svc = UsersService()
     role = str(current_user.role)
@@ -79,19 +147,24 @@ async def get_user(
     if role == UserRole.user and current_user.username != username:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
 
-    u = await svc.get_user(user_uuid=str(current_user.id))
-    if not u:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="해당 유저의 검색 결과가 없습니다."
-        )
-    return u
+    # 본인 조회는 인증 단계에서 로드된 행 재사용(추가 쿼리 없음, 지연 상한 USER_CACHE_TTL_SEC)
+    # 다른 사용자 조회(admin/manager)만 대상 행을 읽음 → 비교/응답 모두 그 행 하나의 ETag
+    target: UserModel | UserResponse
+    if current_user.username == username:
+        target = current_user
+    else:
+        target = await svc.get_user_by_username(username)
+    etag = make_etag(target.id, target.updated_at)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    return with_etag(ModelResponse(UserResponse.model_validate(target)), etag)
 
 
 @router.patch("/{username}", response_model=UserResponse)
 async def update_user(
     username: str,
     user: UserUpdate,
-    current_user: CurUser,
+    current_user: WriteUser,
 ) -> UserResponse:
     """
     - admin: 아무나 수정 가능
@@ -1,6 +1,7 @@
 from datetime import datetime
+import uuid
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 from app.features.users.models import UserRole
 
@@ -21,16 +22,35 @@ class UserUpdate(BaseModel):
 
 
 class UserResponse(BaseModel):
-    id: str
+    # Tortoise User에서 직접 검증(from_attributes), JSON 출력은 UUID 문자열
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
     username: str
     created_at: datetime
     updated_at: datetime
     is_active: bool
 
-    class Config:
-        orm_mode = True
-
 
 class UsersListResponse(BaseModel):
     items: list[UserResponse]
-    total: int
+    # cursor 모드에서 with_total을 요청하지 않으면 None
+    total: int | None
+    # False면 total은 추정치: 프로세스별 사용자 카운터(다른 워커의 가입/삭제는
+    # USER_COUNT_RESYNC_SEC 이내 반영) 또는 캐시된 COUNT
+    total_exact: bool = True
+    next_cursor: str | None = None
+
+
+class ImportRowError(BaseModel):
+    line: int  # 입력 파일 기준 줄 번호(1부터, CSV 헤더 포함)
+    username: str | None = None
+    errors: list[str]
+
+
+class UsersImportReport(BaseModel):
+    created: int = 0
+    failed: int = 0
+    errors: list[ImportRowError] = []
+    # USER_IMPORT_MAX_ERRORS를 넘어 생략된 오류가 있으면 True
+    errors_truncated: bool = False
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import uuid
+
+from tortoise.backends.base.client import BaseDBAsyncClient
+from tortoise.expressions import Q
+from tortoise.queryset import QuerySet
+
+from app.features.users.models import User, UserSearchToken
+
+# ─────────────────────────────────────────────────────────────
+# 사용자 키워드 검색(n-gram 역색인)
+# - 색인: username/email/phone_number 소문자 3-gram → user_search_tokens
+# - 검색: 선택도 높은 3-gram의 사용자 목록 교집합으로 후보를 추린 뒤,
+#         후보에 대해서만 부분 일치(icontains)로 오탐 제거
+# - 3자 미만 키워드는 n-gram이 없으므로 기존과 같은 부분 일치(icontains) 스캔
+# - 색인은 사용자 INSERT/UPDATE와 같은 트랜잭션에서 기록(호출 측이 트랜잭션을 엶)
+# ─────────────────────────────────────────────────────────────
+NGRAM = 3
+# 토큰 1개당 읽을 최대 후보 수(이보다 흔한 토큰은 교집합에서 제외)
+CANDIDATE_CAP = 2000
+
+
+def search_tokens(*values: str) -> set[str]:
+    tokens: set[str] = set()
+    for value in values:
+        v = value.lower()
+        tokens.update(v[i : i + NGRAM] for i in range(len(v) - NGRAM + 1))
+    return tokens
+
+
+def _user_tokens(user: User) -> set[str]:
+    return search_tokens(user.username, user.email, user.phone_number)
+
+
+async def index_user(user: User) -> None:
+    """사용자 1명의 검색 토큰을 현재 값으로 교체"""
+    await UserSearchToken.filter(user_id=user.id).delete()
+    await UserSearchToken.bulk_create(
+        [UserSearchToken(user_id=user.id, token=t) for t in _user_tokens(user)]
+    )
+
+
+async def index_new_users(users: list[User]) -> None:
+    """새로 만든 사용자들(기존 토큰 없음)을 한 번에 색인"""
+    await UserSearchToken.bulk_create(
+        [UserSearchToken(user_id=u.id, token=t) for u in users for t in _user_tokens(u)],
+        batch_size=5000,
+    )
+
+
+async def unindex_user(user_id: uuid.UUID) -> None:
+    await UserSearchToken.filter(user_id=user_id).delete()
+
+
+async def rebuild_search_index(*, batch_size: int = 1000) -> int:
+    """
+    전체 재색인(배포 후 1회 backfill 용). PK 순 배치로 처리하고 색인한 사용자 수 반환.
+    """
+    done = 0
+    last_id: uuid.UUID | None = None
+    while True:
+        qs = User.all().order_by("id").limit(batch_size)
+        if last_id is not None:
+            qs = qs.filter(id__gt=last_id)
+        users = list(await qs)
+        if not users:
+            return done
+
+        ids = [u.id for u in users]
+        await UserSearchToken.filter(user_id__in=ids).delete()
+        await index_new_users(users)
+        done += len(users)
+        last_id = ids[-1]
+
+
+async def _candidate_ids(
+    tokens: set[str], using_db: BaseDBAsyncClient | None
+) -> set[uuid.UUID] | None:
+    """
+    토큰별 사용자 목록을 (token, user_id) 인덱스 범위로 최대 CANDIDATE_CAP+1개만 읽어
+    선택도가 높은 토큰끼리 교집합. 모든 토큰이 흔하면 None(후보 축소 불가).
+    """
+    postings: list[set[uuid.UUID]] = []
+    for token in tokens:
+        ids = await (
+            UserSearchToken.filter(token=token)
+            .using_db(using_db)
+            .limit(CANDIDATE_CAP + 1)
+            .values_list("user_id", flat=True)
+        )
+        if not ids:
+            return set()
+        if len(ids) <= CANDIDATE_CAP:
+            postings.append({uuid.UUID(str(i)) for i in ids})
+
+    if not postings:
+        return None
+    postings.sort(key=len)
+    candidates = postings[0]
+    for p in postings[1:]:
+        candidates &= p
+        if not candidates:
+            break
+    return candidates
+
+
+async def filter_by_keyword(
+    keyword: str, *, using_db: BaseDBAsyncClient | None = None
+) -> QuerySet[User]:
+    """키워드 검색 조건이 적용된 User 쿼리셋(정렬/페이지네이션은 호출 측)"""
+    kw = keyword.strip().lower()
+    qs = User.filter(
+        Q(username__icontains=kw) | Q(email__icontains=kw) | Q(phone_number__icontains=kw)
+    ).using_db(using_db)
+    if len(kw) < NGRAM:
+        # n-gram이 없는 짧은 키워드: 색인 없이 부분 일치
+        return qs
+
+    candidates = await _candidate_ids(search_tokens(kw), using_db)
+    if candidates is None:
+        # 흔한 토큰뿐인 키워드: 색인으로 좁힐 수 없으므로 부분 일치 스캔
+        return qs
+    return qs.filter(id__in=list(candidates))
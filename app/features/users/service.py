@@ -2,28 +2,28 @@ from __future__ import annotations
 
 import uuid
 
-from passlib.context import CryptContext
+from pydantic import TypeAdapter
+from tortoise.transactions import in_transaction
 
+from app.core.db_routing import PRIMARY, mark_write
+from app.core.security import hash_password
+from app.features.users.cache import users_total
 from app.features.users.models import User as UserModel
 from app.features.users.repository import UsersRepository
 from app.features.users.schemas import UserCreate, UserResponse, UserUpdate
-from app.shared.errors import not_found
+from app.features.users.search import index_new_users
+from app.shared.errors import bad_request, not_found
 
-pwd = CryptContext(schemes=["bcrypt"], deprecated="auto")
+JSONScalar = str | int | float | bool | None
 
 
-JSONScalar = str | int | float | bool | None
+# 목록은 행별 생성자 호출 대신 리스트 전체를 한 번에 검증(pydantic-core)
+_user_list_adapter = TypeAdapter(list[UserResponse])
 
 
 def _to_user_out(u: UserModel) -> UserResponse:
-    # Tortoise 모델 → Pydantic 응답 스키마
-    return UserResponse(
-        id=str(u.id),
-        username=u.username,
-        created_at=u.created_at,
-        updated_at=u.updated_at,
-        is_active=bool(u.is_active),
-    )
+    # Tortoise 모델 → Pydantic 응답 스키마(from_attributes)
+    return UserResponse.model_validate(u)
 
 
 class UsersService:
@@ -34,13 +34,25 @@ class UsersService:
         # repo를 직접 주입하지 않으면 repo_cls로 생성
         self.repo = repo or self.repo_cls()
 
-    async def list_users(self, page: int, page_size: int) -> tuple[list[UserResponse], int]:
+    async def list_users(self, page: int, page_size: int) -> tuple[list[UserResponse], int, bool]:
         """
-        User 목록과 total 반환. 이 메서드에서는 바로 Pydantic 스키마로 변환해 반환.
+        User 목록과 total(+ 정확 여부) 반환. 이 메서드에서는 바로 Pydantic 스키마로 변환해 반환.
         (원한다면 라우터에서 변환하도록 변경해도 됨)
         """
-        items, total = await self.repo.list_users(page, page_size)
-        return ([_to_user_out(u) for u in items], total)
+        items, total, exact = await self.repo.list_users(page, page_size)
+        return (_user_list_adapter.validate_python(items), total, exact)
+
+    async def list_users_cursor(
+        self, cursor: str | None, limit: int, *, with_total: bool = False
+    ) -> tuple[list[UserResponse], str | None, int | None, bool]:
+        """커서 모드 목록: (items, next_cursor, 전체 사용자 수 또는 None, 정확 여부)"""
+        try:
+            items, next_cursor, total, exact = await self.repo.list_users_keyset(
+                cursor=cursor, limit=limit, with_total=with_total
+            )
+        except ValueError:
+            bad_request("invalid cursor")
+        return (_user_list_adapter.validate_python(items), next_cursor, total, exact)
 
     async def get_user(self, user_uuid: str) -> UserResponse:
         user = await self.repo.get(user_uuid)
@@ -50,6 +62,13 @@ class UsersService:
         assert user is not None
         return _to_user_out(user)
 
+    async def get_user_by_username(self, username: str) -> UserResponse:
+        user = await self.repo.get_by_username(username)
+        if not user:
+            not_found("해당 유저의 검색 결과가 없습니다.")
+        assert user is not None
+        return _to_user_out(user)
+
     # ─────────────────────────────────────────────────────────
     # Sign up
     # ─────────────────────────────────────────────────────────
@@ -66,21 +85,31 @@ class UsersService:
         id_uuid = str(u)
         id_hex32 = u.hex.lower()
 
-        new_user = await UserModel.create(
-            id=id_uuid,
-            id_bin_hex=id_hex32,
-            email=user.email,
-            username=user.username,
-            phone_number=user.phone_number,
-            password_hash=pwd.hash(user.password),
-            role=user.role,
-            is_active=user.is_active,
-        )
+        # bcrypt 해시는 워커 풀에서 계산(이벤트 루프 블로킹 방지)
+        password_hash = await hash_password(user.password)
+
+        mark_write()
+
+        # 사용자 행과 키워드 검색용 n-gram 색인을 한 트랜잭션으로 기록
+        async with in_transaction(PRIMARY):
+            new_user = await UserModel.create(
+                id=id_uuid,
+                id_bin_hex=id_hex32,
+                email=user.email,
+                username=user.username,
+                phone_number=user.phone_number,
+                password_hash=password_hash,
+                role=user.role,
+                is_active=user.is_active,
+            )
+            await index_new_users([new_user])
+        users_total.add(1)
 
         return _to_user_out(new_user)
 
     async def update_user(self, user_uuid: str, user: UserUpdate) -> UserResponse:
-        db_user = await self.repo.get(user_uuid)
+        # 읽은 뒤 쓰는 경로는 primary에서 읽음(replica의 지연된 행을 기준으로 수정하지 않도록)
+        db_user = await self.repo.get(user_uuid, primary=True)
         if not db_user:
             not_found("user not found")
         assert db_user is not None
@@ -98,7 +127,7 @@ class UsersService:
         # if user.username is not None:
         #     fields["username"] = user.username
         # if user.password is not None:
-        #     fields["password_hash"] = pwd.hash(user.password)
+        #     fields["password_hash"] = await hash_password(user.password)
 
         if fields:
             await self.repo.update_partial(db_user, **fields)
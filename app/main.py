@@ -6,13 +6,25 @@ import os
 from typing import TYPE_CHECKING, Any, Protocol
 
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
 
+from app.core import metrics_multiproc
 from app.core.config import TORTOISE_ORM, settings
+from app.core.db import dispose_engine, warm_up_pools
+from app.core.hashing import bulk_pool, hash_pool
+from app.core.http_metrics import MetricsMiddleware
+from app.core.security import configure_password_hashing
+from app.core.startup import backoff_delay, startup
+from app.core.tasks import drain_spawned, spawn
+from app.features.auth.apikeys import apikey_touch_flush, flush_last_used
+from app.features.auth.purge import auth_purge
+from app.features.auth.revocation import revocation_sync
+from app.features.auth.write_behind import write_behind
+from app.shared.responses import FastJSONResponse
 
 from .features.auth.router import router as auth_router
 from .features.health.router import router as health_router
+from .features.monitoring.router import router as monitoring_router
 from .features.users.router import router as user_router
 from .middleware import setup_middlewares
 
@@ -31,34 +43,88 @@ else:
 
 
 # ─────────────────────────────────────────────────────────────
-# Lifespan: 앱 시작/종료 훅 (필요하면 DB 헬스체크 로직 추가 가능)
+# DB 연결: 지수 백오프 + jitter 재시도, 스키마 생성은 명시적으로 켰을 때만
 # ─────────────────────────────────────────────────────────────
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    attempts = int(os.getenv("DB_CONNECT_RETRY", "10"))
-    delay = float(os.getenv("DB_CONNECT_DELAY", "1.0"))
-    generate_schemas = os.getenv("DB_GENERATE_SCHEMAS", "true").lower() == "true"
-
+async def connect_db() -> bool:
+    attempts = settings.DB_CONNECT_RETRY
     for i in range(1, attempts + 1):
         try:
-            await Tortoise.init(config=dict(TORTOISE_ORM))
-            if generate_schemas:
-                await Tortoise.generate_schemas()
+            with startup.phase("db_init"):
+                await Tortoise.init(config=dict(TORTOISE_ORM))
+            if settings.DB_GENERATE_SCHEMAS:
+                with startup.phase("generate_schemas"):
+                    await Tortoise.generate_schemas()
+            # 준비 완료 전에 풀 연결을 미리 열어 첫 요청의 연결 비용 제거
+            with startup.phase("pool_warmup"):
+                await warm_up_pools()
             print("✅ DB 연결 및 초기화 성공")
-
-            break
-        except Exception:
+            return True
+        except Exception as e:
             if i == attempts:
-                print(f"❌ DB 연결 실패: {attempts}회 시도 후 중단")
-                break
-            print(f"⏳ DB 연결 재시도 {i}/{attempts}…")
+                print(f"❌ DB 연결 실패: {attempts}회 시도 후 중단 ({e!r})")
+                return False
+            delay = backoff_delay(
+                i,
+                base=settings.DB_CONNECT_BACKOFF_BASE_SEC,
+                cap=settings.DB_CONNECT_BACKOFF_MAX_SEC,
+            )
+            print(f"⏳ DB 연결 재시도 {i}/{attempts} ({delay:.1f}s 후)…")
             await asyncio.sleep(delay)
+    return False
+
+
+# ─────────────────────────────────────────────────────────────
+# Lifespan: 앱 시작/종료 훅
+# ─────────────────────────────────────────────────────────────
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    startup.db_ready = await connect_db()
+
+    # bcrypt 비용 보정(워커 풀에서 실행, 완료 전까지는 기본 비용 사용)
+    spawn(configure_password_hashing(), name="bcrypt-calibration")
+
+    if settings.AUTH_WRITE_BEHIND:
+        write_behind.start()
+
+    # 철회 JTI 초기 로드 후 주기 동기화
+    with startup.phase("revocation_sync"):
+        await revocation_sync.run_once()
+    revocation_sync.start()
+    apikey_touch_flush.start()
+    # 만료 세션/리프레시 토큰 소배치 정리
+    if settings.PURGE_ENABLED:
+        auth_purge.start()
+
+    # 멀티 워커면 이 워커의 메트릭을 주기적으로 파일에 기록(/metrics 합산용)
+    metrics_multiproc.start()
 
+    startup.completed = True
+    print(f"🚀 기동 완료: {startup.summary()}")
     yield
 
+    await auth_purge.stop()
+    await drain_spawned()
+    await revocation_sync.stop()
+    await apikey_touch_flush.stop()
+    try:
+        await flush_last_used()
+    except Exception as e:
+        print(f"❌ API 키 last_used_at 최종 기록 실패: {e!r}")
+
+    # 버퍼에 남은 세션/리프레시 행을 연결 종료 전에 기록
+    try:
+        await write_behind.stop()
+    except Exception as e:
+        print(f"❌ write-behind 최종 flush 실패: {e!r}")
+
     await Tortoise.close_connections()
+    await dispose_engine()  # SQLAlchemy 엔진은 생성된 경우에만
     print("👋 DB 연결 종료")
 
+    hash_pool.shutdown()
+    bulk_pool.shutdown()
+    await metrics_multiproc.stop()
+
 
 # ─────────────────────────────────────────────────────────────
 # OpenAPI 스키마 커스터마이즈 (Bearer + Cookie 보안 스키마)
@@ -108,27 +174,19 @@ def create_app() -> FastAPI:
         version="1.0.0",
         debug=settings.APP_DEBUG,
         lifespan=lifespan,
+        # orjson 설치 시 기본 JSON 인코딩 고속화
+        default_response_class=FastJSONResponse,
         swagger_ui_parameters={"persistAuthorization": True},
     )
 
-    # 공통 미들웨어
+    # 공통 미들웨어(CORS 포함)
     setup_middlewares(app)
-
-    # CORS: settings.CORS_ORIGINS + 환경변수 병합
-    extra_origins_env = os.getenv("CORS_ORIGINS", "")
-    extra_origins: list[str] = [o.strip() for o in extra_origins_env.split(",") if o.strip()]
-    allow_origins: list[str] = [*settings.CORS_ORIGINS, *extra_origins]
-
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=allow_origins,
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    # 요청 지연/DB 쿼리 메트릭(마지막 등록 = 가장 바깥 → 모든 요청 집계)
+    app.add_middleware(MetricsMiddleware)
 
     # 라우터 등록
     app.include_router(health_router)
+    app.include_router(monitoring_router)
     app.include_router(auth_router)
     app.include_router(user_router)
 
@@ -147,7 +205,7 @@ def read_root() -> dict[str, str]:
     return {"message": "Flueman API 서버가 동작 중입니다."}
 
 
-# 로컬 실행 (uvicorn app.main:app --reload)
+# 로컬 실행 (RELOAD=true면 코드 변경 시 재시작, 운영은 python -m app.server)
 if __name__ == "__main__":
     import uvicorn
 
@@ -155,5 +213,5 @@ if __name__ == "__main__":
         "app.main:app",
         host=os.getenv("HOST", "0.0.0.0"),
         port=int(os.getenv("PORT", "8000")),
-        reload=os.getenv("RELOAD", "true").lower() == "true",
+        reload=os.getenv("RELOAD", "false").lower() == "true",
     )
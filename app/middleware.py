@@ -1,18 +1,25 @@
 from fastapi import FastAPI, Request, Response
 from fastapi.responses import JSONResponse
-from starlette.middleware.cors import CORSMiddleware
 
+from app.core.compression import CompressionMiddleware
 from app.core.config import settings
+from app.core.cors import CORSMiddleware
 
 
 def setup_middlewares(app: FastAPI) -> None:
-    origins = settings.CORS_ORIGINS
+    # 응답 압축(먼저 등록 = 안쪽, 스트리밍 응답은 청크 단위)
+    if settings.COMPRESSION_ENABLED:
+        app.add_middleware(
+            CompressionMiddleware,
+            min_size=settings.COMPRESSION_MIN_SIZE,
+            gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+            zstd_level=settings.COMPRESSION_ZSTD_LEVEL,
+        )
+    # CORS 단일 계층: settings.CORS_ORIGINS(환경변수 CORS_ORIGINS 포함)만 사용
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=origins if isinstance(origins, list) else origins,
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_origins=settings.CORS_ORIGINS,
+        max_age=settings.CORS_MAX_AGE_SEC,
     )
 
     @app.exception_handler(Exception)
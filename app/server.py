@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import math
+import os
+from pathlib import Path
+import random
+import shutil
+import socket
+import tempfile
+
+import uvicorn
+from uvicorn.supervisors import Multiprocess
+
+from app.core import metrics_multiproc
+from app.core.config import settings
+
+# ─────────────────────────────────────────────────────────────
+# 프로덕션 서버 런처 (python -m app.server)
+# - 워커 수: SERVER_WORKERS, 0이면 컨테이너 CPU 할당량(cgroup) 기준 자동
+# - uvloop + httptools, keep-alive/backlog/동시 연결 상한 고정
+# - 워커마다 SERVER_MAX_REQUESTS(+jitter)건 처리 후 교체 → 메모리 증가 상한
+#   (jitter로 워커들이 동시에 재시작되어 처리량이 한꺼번에 빠지는 것을 방지)
+# - SIGTERM: 새 연결 수락 중단 후 진행 중 요청을 SERVER_GRACEFUL_TIMEOUT_SEC까지 대기
+# - 메트릭: 워커별 값을 공유 디렉터리에 기록 → /metrics는 전체 워커 합계
+# ─────────────────────────────────────────────────────────────
+_CGROUP_V2_CPU_MAX = Path("/sys/fs/cgroup/cpu.max")
+_CGROUP_V1_QUOTA = Path("/sys/fs/cgroup/cpu/cpu.cfs_quota_us")
+_CGROUP_V1_PERIOD = Path("/sys/fs/cgroup/cpu/cpu.cfs_period_us")
+
+
+def _cgroup_cpu_limit() -> float | None:
+    """컨테이너 CPU 할당량(코어 수), 제한이 없거나 읽을 수 없으면 None"""
+    try:
+        if _CGROUP_V2_CPU_MAX.exists():
+            quota, period = _CGROUP_V2_CPU_MAX.read_text().split()[:2]
+            if quota == "max":
+                return None
+            return int(quota) / int(period)
+        if _CGROUP_V1_QUOTA.exists():
+            quota_us = int(_CGROUP_V1_QUOTA.read_text())
+            if quota_us <= 0:
+                return None
+            return quota_us / int(_CGROUP_V1_PERIOD.read_text())
+    except (OSError, ValueError):
+        return None
+    return None
+
+
+def available_cpus() -> int:
+    # 프로세스에 허용된 CPU(affinity) ∩ cgroup 할당량(소수점은 올림)
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+    cpus = cpus or 1
+    limit = _cgroup_cpu_limit()
+    if limit is not None:
+        cpus = min(cpus, max(1, math.ceil(limit)))
+    return cpus
+
+
+def worker_count() -> int:
+    # 비동기 워커는 코어당 1개면 충분(bcrypt는 워커 내부 스레드 풀에서 처리)
+    return settings.SERVER_WORKERS or available_cpus()
+
+
+class RecyclingServer(uvicorn.Server):
+    """워커 프로세스 안에서 max requests에 jitter를 더한 뒤 실행"""
+
+    def run(self, sockets: list[socket.socket] | None = None) -> None:
+        limit = self.config.limit_max_requests
+        if limit:
+            self.config.limit_max_requests = limit + random.randint(
+                0, settings.SERVER_MAX_REQUESTS_JITTER
+            )
+        super().run(sockets=sockets)
+
+
+def build_config(workers: int) -> uvicorn.Config:
+    return uvicorn.Config(
+        "app.main:app",
+        host=settings.APP_HOST,
+        port=settings.APP_PORT,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        backlog=settings.SERVER_BACKLOG,
+        timeout_keep_alive=settings.SERVER_KEEPALIVE_SEC,
+        limit_concurrency=settings.SERVER_LIMIT_CONCURRENCY or None,
+        limit_max_requests=settings.SERVER_MAX_REQUESTS or None,
+        timeout_graceful_shutdown=settings.SERVER_GRACEFUL_TIMEOUT_SEC,
+        proxy_headers=True,
+        forwarded_allow_ips=settings.SERVER_FORWARDED_ALLOW_IPS,
+        access_log=settings.SERVER_ACCESS_LOG,
+    )
+
+
+def prepare_metrics_dir() -> str:
+    """
+    워커들이 메트릭 값을 기록할 디렉터리(/metrics가 워커 합계를 내도록).
+    워커 1개여도 사용: 요청 상한으로 교체된 워커의 누적 값이 사라지지 않게 함
+    """
+    directory = settings.METRICS_MULTIPROC_DIR or tempfile.mkdtemp(prefix="flueman-metrics-")
+    metrics_multiproc.reset_directory(directory)
+    # 워커는 spawn으로 새로 임포트되므로 환경변수로 전달
+    os.environ["METRICS_MULTIPROC_DIR"] = directory
+    return directory
+
+
+def main() -> None:
+    workers = worker_count()
+    if settings.AUTH_WRITE_BEHIND and workers > 1:
+        # write-behind 버퍼는 워커별 메모리 → 다른 워커에서 리프레시가 실패함
+        raise SystemExit("AUTH_WRITE_BEHIND는 SERVER_WORKERS=1에서만 사용할 수 있습니다")
+    metrics_dir = prepare_metrics_dir()
+    config = build_config(workers)
+    server = RecyclingServer(config)
+    print(f"🚀 {workers} workers on {config.host}:{config.port} (pid {os.getpid()})")
+    # 워커 1개여도 감독 프로세스 유지: 요청 상한으로 종료된 워커를 새로 띄우고, SIGTERM은 워커에 전달
+    sock = config.bind_socket()
+    try:
+        Multiprocess(config, target=server.run, sockets=[sock]).run()
+    finally:
+        if not settings.METRICS_MULTIPROC_DIR:
+            shutil.rmtree(metrics_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -13,3 +13,23 @@ def conflict(detail: str = "Conflict") -> NoReturn:  # (권장) 같이 명시
 
 def forbidden(detail: str = "Forbidden") -> NoReturn:  # (권장) 같이 명시
     raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
+
+
+def service_unavailable(detail: str = "Service unavailable", retry_after: int = 1) -> NoReturn:
+    raise HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=detail,
+        headers={"Retry-After": str(retry_after)},
+    )
+
+
+def too_many_requests(detail: str = "Too many requests", retry_after: int = 1) -> NoReturn:
+    raise HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail=detail,
+        headers={"Retry-After": str(retry_after)},
+    )
+
+
+def bad_request(detail: str = "Bad request") -> NoReturn:
+    raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from datetime import datetime
+import hashlib
+import uuid
+
+from fastapi import Request, Response, status
+
+# ─────────────────────────────────────────────────────────────
+# ETag / 조건부 GET (If-None-Match → 304)
+# - 엔티티 버전(id + updated_at 등)으로 강한 ETag 생성: 본문 직렬화 없이 계산
+# - 라우터는 응답할 행 하나로 만든 ETag로 비교·응답(본인 조회는 인증 단계 사용자 재사용, 일치하면 304)
+# - If-None-Match는 약한 비교(RFC 9110): 압축 미들웨어가 붙인 W/ 접두사도 일치로 처리
+# - 사용자별 데이터이므로 공유 캐시 금지 + 매번 재검증(private, no-cache)
+# ─────────────────────────────────────────────────────────────
+CACHE_CONTROL = "private, no-cache"
+
+
+def _part(value: object) -> str:
+    if isinstance(value, datetime):
+        # 마이크로초까지 반영(같은 초 안의 연속 수정 구분)
+        return f"{value.timestamp():.6f}"
+    if isinstance(value, uuid.UUID):
+        return value.hex
+    return str(value)
+
+
+def make_etag(*parts: object) -> str:
+    """엔티티 버전 요소들로 강한 ETag(따옴표 포함) 생성"""
+    raw = "\x1f".join(_part(p) for p in parts).encode("utf-8")
+    return '"' + hashlib.blake2b(raw, digest_size=12).hexdigest() + '"'
+
+
+def _opaque(tag: str) -> str:
+    tag = tag.strip()
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    target = _opaque(etag)
+    return any(_opaque(t) == target for t in header.split(","))
+
+
+def not_modified(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+    )
+
+
+def with_etag(response: Response, etag: str) -> Response:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    return response
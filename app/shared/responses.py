@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+
+from fastapi.responses import JSONResponse
+import orjson
+from pydantic import BaseModel
+from starlette.background import BackgroundTask
+
+
+# ─────────────────────────────────────────────────────────────
+# 응답 직렬화 고속 경로
+# - FastJSONResponse: 앱 기본 응답 클래스. orjson으로 인코딩
+# - ModelResponse: 이미 검증된 Pydantic 모델을 pydantic-core(Rust)로 바로 JSON 인코딩.
+#   라우트가 Response를 반환하면 FastAPI의 response_model 재검증/jsonable_encoder를 건너뜀
+#   (response_model은 OpenAPI 문서용으로만 유지)
+# ─────────────────────────────────────────────────────────────
+class FastJSONResponse(JSONResponse):
+    def render(self, content: object) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+class ModelResponse(JSONResponse):
+    def __init__(
+        self,
+        content: BaseModel,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        background: BackgroundTask | None = None,
+    ) -> None:
+        super().__init__(content, status_code=status_code, headers=headers, background=background)
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.__pydantic_serializer__.to_json(content)
@@ -1,3 +1,6 @@
+import base64
+from datetime import datetime
+import json
 from typing import Generic, TypeVar
 
 from pydantic import BaseModel, Field
@@ -10,3 +13,21 @@ class Page(BaseModel, Generic[T]):
     page: int = 1
     page_size: int = 20
     total: int = 0
+
+
+# ─────────────────────────────────────────────────────────────
+# 불투명 커서: (정렬 기준 시각, PK)를 URL-safe base64(JSON)로 인코딩
+# ─────────────────────────────────────────────────────────────
+def encode_cursor(created_at: datetime, pk: object) -> str:
+    raw = json.dumps([created_at.isoformat(), str(pk)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """잘못된 커서는 ValueError"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, pk = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(created_at), str(pk)
+    except (ValueError, TypeError, UnicodeError) as e:
+        raise ValueError("invalid cursor") from e
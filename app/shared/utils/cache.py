@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Callable
+import time
+from typing import Generic, TypeVar
+
+from app.core import metrics
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    프로세스 내 LRU + TTL 캐시(이벤트 루프 단일 스레드 사용 전제)
+    - maxsize 초과 시 가장 오래 사용하지 않은 항목부터 제거
+    - 항목별 TTL 지정 가능(음성 캐시/토큰 만료 등)
+    - name을 주면 {name}_hits_total / {name}_misses_total 카운터를 메트릭에 등록
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int,
+        ttl: float,
+        name: str | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        prefix = name or f"cache_{id(self):x}"
+        self._hits = metrics.counter(f"{prefix}_hits_total", "Cache hits")
+        self._misses = metrics.counter(f"{prefix}_misses_total", "Cache misses")
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def hits(self) -> int:
+        return int(self._hits.value)
+
+    @property
+    def misses(self) -> int:
+        return int(self._misses.value)
+
+    def lookup(self, key: K) -> tuple[bool, V | None]:
+        """(적중 여부, 값) — 값으로 None을 저장하는 음성 캐시와 미스를 구분"""
+        entry = self._data.get(key)
+        if entry is None:
+            self._misses.inc()
+            return False, None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._data[key]
+            self._misses.inc()
+            return False, None
+        self._data.move_to_end(key)
+        self._hits.inc()
+        return True, value
+
+    def get(self, key: K) -> V | None:
+        return self.lookup(key)[1]
+
+    def set(self, key: K, value: V, *, ttl: float | None = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        self._data[key] = (self._clock() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: K) -> None:
+        self._data.pop(key, None)
+
+    def pop_where(self, predicate: Callable[[V], bool]) -> int:
+        """값이 조건에 맞는 항목을 모두 제거(전체 순회 — 드문 무효화 용도)"""
+        keys = [k for k, (_, v) in self._data.items() if predicate(v)]
+        for k in keys:
+            del self._data[k]
+        return len(keys)
+
+    def clear(self) -> None:
+        self._data.clear()
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+import time
+from typing import TypeVar
+
+from tortoise.models import Model
+from tortoise.queryset import QuerySet
+
+from app.shared.utils.cache import TTLCache
+
+M = TypeVar("M", bound=Model)
+
+# ─────────────────────────────────────────────────────────────
+# 페이지 목록 total 비용 절감
+# - CountCache: 쿼리 형태(shape) 키 → COUNT 결과를 TTL 동안 재사용(캐시 값은 추정치)
+# - RowCounter: 필터 없는 테이블 전체 행 수를 이 프로세스의 증감으로 유지,
+#   다른 워커의 변경은 resync 주기마다 COUNT(*)로 보정(그사이 값은 추정치)
+# ─────────────────────────────────────────────────────────────
+
+
+class CountCache:
+    def __init__(self, *, maxsize: int, ttl: float, name: str) -> None:
+        self._cache: TTLCache[str, int] = TTLCache(maxsize=maxsize, ttl=ttl, name=name)
+
+    async def count(self, shape: str, qs: QuerySet[M]) -> tuple[int, bool]:
+        """(행 수, 정확 여부) — 방금 센 값이면 정확, 캐시 적중이면 추정"""
+        hit, cached = self._cache.lookup(shape)
+        if hit and cached is not None:
+            return cached, False
+        total = await qs.count()
+        self._cache.set(shape, total)
+        return total, True
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+class RowCounter:
+    def __init__(
+        self,
+        model: type[Model],
+        *,
+        resync: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._model = model
+        self.resync = resync
+        self._clock = clock
+        self._value: int | None = None
+        self._loaded_at = 0.0
+
+    async def get(self) -> tuple[int, bool]:
+        """(행 수, 정확 여부) — 방금 COUNT(*)로 셌으면 정확, 증감으로 유지한 값이면 추정"""
+        if self._value is None or self._clock() - self._loaded_at >= self.resync:
+            self._value = await self._model.all().count()
+            self._loaded_at = self._clock()
+            return self._value, True
+        return self._value, False
+
+    def add(self, n: int) -> None:
+        # 아직 로드 전이면 다음 get()의 COUNT(*)가 반영하므로 무시
+        if self._value is not None:
+            self._value = max(0, self._value + n)
+
+    def invalidate(self) -> None:
+        self._value = None
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from typing import TypeVar
+
+from tortoise.expressions import Q
+from tortoise.models import Model
+from tortoise.queryset import QuerySet
+
+from app.shared.schemas.pagination import decode_cursor, encode_cursor
+
+M = TypeVar("M", bound=Model)
+
+# ─────────────────────────────────────────────────────────────
+# 키셋(커서) 페이지네이션 — (created_at DESC, id DESC)
+# - 이전 페이지 마지막 행 이후만 인덱스 범위로 읽음 → 깊은 페이지도 일정 비용
+# - (created_at, id) 복합 인덱스 전제
+# ─────────────────────────────────────────────────────────────
+
+
+async def keyset_page(
+    qs: QuerySet[M],
+    *,
+    cursor: str | None,
+    limit: int,
+) -> tuple[list[M], str | None]:
+    """
+    qs(필터만 적용된 쿼리셋)에서 cursor 이후 limit개와 다음 커서를 반환.
+    잘못된 커서는 ValueError.
+    """
+    if cursor:
+        created_at, pk = decode_cursor(cursor)
+        qs = qs.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk))
+
+    # 1개 더 읽어 다음 페이지 존재 여부 판단(COUNT 불필요)
+    rows = list(await qs.order_by("-created_at", "-id").limit(limit + 1))
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(last.created_at, last.pk)  # type: ignore[attr-defined]
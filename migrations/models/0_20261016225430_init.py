@@ -0,0 +1,87 @@
+from tortoise import BaseDBAsyncClient
+
+
+async def upgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        CREATE TABLE IF NOT EXISTS `users` (
+    `id` CHAR(36) NOT NULL PRIMARY KEY,
+    `id_bin_hex` VARCHAR(32) NOT NULL UNIQUE,
+    `username` VARCHAR(50) NOT NULL UNIQUE,
+    `email` VARCHAR(255) NOT NULL UNIQUE,
+    `phone_number` VARCHAR(20) NOT NULL,
+    `password_hash` VARCHAR(255) NOT NULL,
+    `role` VARCHAR(7) NOT NULL COMMENT 'admin: admin\nmanager: manager\nuser: user' DEFAULT 'user',
+    `is_active` BOOL NOT NULL DEFAULT 1,
+    `created_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+    `updated_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
+    KEY `idx_users_phone_n_9f5149` (`phone_number`),
+    KEY `idx_users_created_eeb5e9` (`created_at`, `id`)
+) CHARACTER SET utf8mb4;
+CREATE TABLE IF NOT EXISTS `api_keys` (
+    `id` CHAR(36) NOT NULL PRIMARY KEY,
+    `key_hash` VARCHAR(64) NOT NULL UNIQUE,
+    `scopes` JSON NOT NULL,
+    `expires_at` DATETIME(6),
+    `is_revoked` BOOL NOT NULL DEFAULT 0,
+    `last_used_at` DATETIME(6),
+    `created_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+    `updated_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
+    `user_id` CHAR(36) NOT NULL,
+    CONSTRAINT `fk_api_keys_users_14eca04b` FOREIGN KEY (`user_id`) REFERENCES `users` (`id`) ON DELETE CASCADE,
+    KEY `idx_api_keys_user_id_cb93a3` (`user_id`, `is_revoked`)
+) CHARACTER SET utf8mb4 COMMENT='API 키 보관(해시 저장)';
+CREATE TABLE IF NOT EXISTS `refresh_tokens` (
+    `id` CHAR(36) NOT NULL PRIMARY KEY,
+    `family_id` CHAR(36) NOT NULL,
+    `jti` VARCHAR(36) NOT NULL UNIQUE,
+    `token_hash` VARCHAR(64) NOT NULL UNIQUE,
+    `is_active` BOOL NOT NULL DEFAULT 1,
+    `expires_at` DATETIME(6) NOT NULL,
+    `revoked_at` DATETIME(6),
+    `last_used_at` DATETIME(6),
+    `ip_address` VARCHAR(45),
+    `user_agent` VARCHAR(255),
+    `created_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+    `updated_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
+    `user_id` CHAR(36) NOT NULL,
+    CONSTRAINT `fk_refresh__users_1c3fe0a4` FOREIGN KEY (`user_id`) REFERENCES `users` (`id`) ON DELETE CASCADE,
+    KEY `idx_refresh_tok_family__59d0e5` (`family_id`),
+    KEY `idx_refresh_tok_user_id_77f92c` (`user_id`, `is_active`),
+    KEY `idx_refresh_tok_family__62cb4d` (`family_id`, `is_active`),
+    KEY `idx_refresh_tok_expires_310999` (`expires_at`),
+    KEY `idx_refresh_tok_revoked_235ebd` (`revoked_at`)
+) CHARACTER SET utf8mb4 COMMENT='리프레시 토큰 저장(해시만 저장) + 로테이션/재사용 탐지용';
+CREATE TABLE IF NOT EXISTS `session` (
+    `id` CHAR(36) NOT NULL PRIMARY KEY,
+    `jti` VARCHAR(36) NOT NULL,
+    `ip_address` VARCHAR(45),
+    `user_agent` VARCHAR(255),
+    `expires_at` DATETIME(6) NOT NULL,
+    `revoked_at` DATETIME(6),
+    `is_active` BOOL NOT NULL DEFAULT 1,
+    `created_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6),
+    `updated_at` DATETIME(6) NOT NULL DEFAULT CURRENT_TIMESTAMP(6) ON UPDATE CURRENT_TIMESTAMP(6),
+    `user_id` CHAR(36) NOT NULL,
+    UNIQUE KEY `uid_session_jti_3b04c5` (`jti`),
+    CONSTRAINT `fk_session_users_ea0ed1b3` FOREIGN KEY (`user_id`) REFERENCES `users` (`id`) ON DELETE CASCADE,
+    KEY `idx_session_revoked_4ec8f5` (`revoked_at`),
+    KEY `idx_session_expires_823c67` (`expires_at`)
+) CHARACTER SET utf8mb4 COMMENT='액세스 세션(JWT jti 기준 추적)';
+CREATE TABLE IF NOT EXISTS `user_search_tokens` (
+    `id` BIGINT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+    `token` VARCHAR(3) NOT NULL,
+    `user_id` CHAR(36) NOT NULL,
+    UNIQUE KEY `uid_user_search_token_80fd16` (`token`, `user_id`),
+    CONSTRAINT `fk_user_sea_users_e212ebc9` FOREIGN KEY (`user_id`) REFERENCES `users` (`id`) ON DELETE CASCADE
+) CHARACTER SET utf8mb4 COMMENT='사용자 검색용 n-gram 역색인(username/email/phone_number의 소문자 3-gram).';
+CREATE TABLE IF NOT EXISTS `aerich` (
+    `id` INT NOT NULL PRIMARY KEY AUTO_INCREMENT,
+    `version` VARCHAR(255) NOT NULL,
+    `app` VARCHAR(100) NOT NULL,
+    `content` JSON NOT NULL
+) CHARACTER SET utf8mb4;"""
+
+
+async def downgrade(db: BaseDBAsyncClient) -> str:
+    return """
+        """
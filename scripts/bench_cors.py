@@ -0,0 +1,88 @@
+"""
+CORS 미들웨어 마이크로 벤치마크 (기존 Starlette CORSMiddleware 2중 vs 단일 계층)
+
+- 최소 ASGI 앱을 직접 호출해 CORS 계층 자체 비용만 측정
+- 요청 종류: Origin 없음 / 교차 출처 GET / 프리플라이트(OPTIONS)
+
+실행(레포 루트, .env 필요):
+    uv run python -m scripts.bench_cors [반복 횟수=100000]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from typing import Any
+
+from starlette.middleware.cors import CORSMiddleware as StarletteCORS
+
+from app.core.cors import CORSMiddleware
+from app.core.http_metrics import ASGIApp, Message, Receive, Scope, Send
+
+ORIGINS = ["http://localhost:3000", "https://app.example.com", "https://admin.example.com"]
+ORIGIN = b"https://app.example.com"
+
+REQUESTS: dict[str, dict[str, Any]] = {
+    "no-origin": {"method": "GET", "headers": [(b"accept", b"application/json")]},
+    "cors GET": {"method": "GET", "headers": [(b"origin", ORIGIN)]},
+    "preflight": {
+        "method": "OPTIONS",
+        "headers": [
+            (b"origin", ORIGIN),
+            (b"access-control-request-method", b"POST"),
+            (b"access-control-request-headers", b"authorization, content-type"),
+        ],
+    },
+}
+
+
+async def _app(scope: Scope, receive: Receive, send: Send) -> None:
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+async def _receive() -> Message:
+    return {"type": "http.request", "body": b""}
+
+
+async def _send(message: Message) -> None:
+    return None
+
+
+def _old_stack() -> ASGIApp:
+    # 기존: setup_middlewares + create_app에서 각각 추가
+    def layer(app: ASGIApp) -> ASGIApp:
+        return StarletteCORS(
+            app,
+            allow_origins=ORIGINS,
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
+
+    return layer(layer(_app))
+
+
+async def _measure(app: ASGIApp, req: dict[str, Any], n: int) -> float:
+    base = {"type": "http", "path": "/user/", "query_string": b"", **req}
+    start = time.perf_counter()
+    for _ in range(n):
+        await app(dict(base), _receive, _send)
+    return time.perf_counter() - start
+
+
+def main(n: int = 100_000) -> None:
+    old = _old_stack()
+    new = CORSMiddleware(_app, allow_origins=ORIGINS, max_age=86_400)
+    for name, req in REQUESTS.items():
+        t_old = asyncio.run(_measure(old, req, n))
+        t_new = asyncio.run(_measure(new, req, n))
+        print(
+            f"{name:<10} old {t_old / n * 1e6:6.2f} µs  new {t_new / n * 1e6:6.2f} µs"
+            f"  ({t_old / t_new:4.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,64 @@
+"""
+메트릭 미들웨어 오버헤드 마이크로 벤치마크 (요청당 추가 비용)
+
+- 최소 ASGI 앱을 직접 호출: 미들웨어 없음 vs MetricsMiddleware 경유
+- 네트워크/프레임워크 비용을 빼고 미들웨어 자체 비용만 측정
+
+실행(레포 루트):
+    uv run python -m scripts.bench_http_metrics [반복 횟수=200000]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+
+from app.core.http_metrics import (
+    ASGIApp,
+    Message,
+    MetricsMiddleware,
+    Receive,
+    Scope,
+    Send,
+    record_db_query,
+)
+
+
+class _Route:
+    path = "/user/{username}"
+
+
+async def _app(scope: Scope, receive: Receive, send: Send) -> None:
+    scope["route"] = _Route
+    record_db_query(0.0005)
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+async def _receive() -> Message:
+    return {"type": "http.request", "body": b""}
+
+
+async def _send(message: Message) -> None:
+    return None
+
+
+async def _measure(app: ASGIApp, n: int) -> float:
+    scope = {"type": "http", "method": "GET", "path": "/user/alice"}
+    start = time.perf_counter()
+    for _ in range(n):
+        await app(dict(scope), _receive, _send)
+    return time.perf_counter() - start
+
+
+def main(n: int = 200_000) -> None:
+    bare = asyncio.run(_measure(_app, n))
+    wrapped = asyncio.run(_measure(MetricsMiddleware(_app), n))
+    print(f"bare       {bare / n * 1e6:6.2f} µs/req")
+    print(f"metrics    {wrapped / n * 1e6:6.2f} µs/req")
+    print(f"overhead   {(wrapped - bare) / n * 1e6:6.2f} µs/req")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,106 @@
+"""
+목록 응답 직렬화 벤치마크 (이전 경로 vs 고속 경로, DB 제외)
+
+- before: 행마다 UserResponse(...) 생성 → response_model 재검증 → jsonable_encoder + json.dumps
+- after : TypeAdapter로 목록 1회 검증 → ModelResponse(pydantic-core JSON 인코딩)
+- 같은 프로세스에서 ASGI 앱을 httpx로 직접 호출해 초당 요청 수를 비교
+
+실행(레포 루트, .env 필요):
+    uv run python -m scripts.bench_serialization [요청 수=2000] [페이지 크기=200]
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+import sys
+import time
+from types import SimpleNamespace
+import uuid
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+import httpx
+from pydantic import BaseModel
+
+from app.features.users.schemas import UserResponse, UsersListResponse
+from app.features.users.service import _user_list_adapter
+from app.shared.responses import FastJSONResponse, ModelResponse
+
+
+class _LegacyUserResponse(BaseModel):
+    # 변경 전 스키마(문자열 id, 생성자 기반 변환)
+    id: str
+    username: str
+    created_at: datetime
+    updated_at: datetime
+    is_active: bool
+
+
+class _LegacyListResponse(BaseModel):
+    items: list[_LegacyUserResponse]
+    total: int
+
+
+def _rows(n: int) -> list[SimpleNamespace]:
+    now = datetime.now(UTC)
+    return [
+        SimpleNamespace(
+            id=uuid.uuid4(), username=f"user{i}", created_at=now, updated_at=now, is_active=True
+        )
+        for i in range(n)
+    ]
+
+
+def _build_apps(rows: list[SimpleNamespace]) -> tuple[FastAPI, FastAPI]:
+    before = FastAPI(default_response_class=JSONResponse)
+    after = FastAPI(default_response_class=FastJSONResponse)
+
+    @before.get("/user/", response_model=_LegacyListResponse)
+    async def list_before() -> _LegacyListResponse:
+        items = [
+            _LegacyUserResponse(
+                id=str(u.id),
+                username=u.username,
+                created_at=u.created_at,
+                updated_at=u.updated_at,
+                is_active=bool(u.is_active),
+            )
+            for u in rows
+        ]
+        return _LegacyListResponse(items=items, total=len(rows))
+
+    @after.get("/user/", response_model=UsersListResponse)
+    async def list_after() -> ModelResponse:
+        items: list[UserResponse] = _user_list_adapter.validate_python(rows)
+        return ModelResponse(UsersListResponse(items=items, total=len(rows)))
+
+    return before, after
+
+
+async def _rps(app: FastAPI, requests: int) -> float:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(20):  # 워밍업
+            await client.get("/user/")
+        started = time.perf_counter()
+        for _ in range(requests):
+            r = await client.get("/user/")
+            r.raise_for_status()
+        return requests / (time.perf_counter() - started)
+
+
+async def main(requests: int, page_size: int) -> None:
+    before, after = _build_apps(_rows(page_size))
+    rps_before = await _rps(before, requests)
+    rps_after = await _rps(after, requests)
+    print(f"page_size={page_size}")
+    print(f"before  {rps_before:>10,.0f} req/s")
+    print(f"after   {rps_after:>10,.0f} req/s")
+    print(f"speedup {rps_after / rps_before:>10.2f}x")
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    asyncio.run(main(n, size))
@@ -0,0 +1,68 @@
+"""
+HTTP 처리량 벤치마크 (실행 중인 서버에 동시 요청, 요청/초·지연 분위수)
+
+- 대상 서버를 먼저 띄운 뒤 실행: 운영 런처(python -m app.server)와
+  단일 uvicorn(uvicorn app.main:app) 결과를 같은 장비에서 비교
+- 기본 경로는 /health/live(DB 미사용 → 서버/이벤트 루프 자체 비용)
+
+실행(레포 루트):
+    uv run python -m scripts.bench_server [URL=http://127.0.0.1:8000/health/live] [요청 수=20000] [동시성=64]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+
+import httpx
+
+
+async def _worker(client: httpx.AsyncClient, url: str, n: int, latencies: list[float]) -> int:
+    errors = 0
+    for _ in range(n):
+        started = time.perf_counter()
+        try:
+            resp = await client.get(url)
+            if resp.status_code >= 500:
+                errors += 1
+        except httpx.HTTPError:
+            errors += 1
+        latencies.append(time.perf_counter() - started)
+    return errors
+
+
+async def run(url: str, total: int, concurrency: int) -> None:
+    latencies: list[float] = []
+    per_worker = max(1, total // concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+        await client.get(url)  # 워밍업(연결/임포트)
+        started = time.perf_counter()
+        errors = await asyncio.gather(
+            *(_worker(client, url, per_worker, latencies) for _ in range(concurrency))
+        )
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    n = len(latencies)
+
+    def pct(p: float) -> float:
+        return latencies[min(n - 1, int(n * p))] * 1000
+
+    print(f"requests   {n:>10,}  (errors {sum(errors)})")
+    print(f"throughput {n / elapsed:>10,.0f} req/s")
+    print(
+        f"latency    p50 {pct(0.50):.2f} ms  p99 {pct(0.99):.2f} ms  max {latencies[-1] * 1000:.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    asyncio.run(
+        run(
+            args[0] if len(args) > 0 else "http://127.0.0.1:8000/health/live",
+            int(args[1]) if len(args) > 1 else 20_000,
+            int(args[2]) if len(args) > 2 else 64,
+        )
+    )
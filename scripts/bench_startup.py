@@ -0,0 +1,89 @@
+"""
+기동 시간 벤치마크 (모듈 임포트 + DB 초기화 단계별 소요 시간)
+
+- 임포트: 모듈마다 새 인터프리터에서 측정(캐시 없는 콜드 임포트, 반복 중 최솟값)
+- 초기화: Tortoise.init → generate_schemas → 풀 워밍업을 startup.phase로 측정
+- BENCH_DSN 미지정 시 임시 SQLite 파일 사용(MySQL은 mysql://... 지정)
+- BENCH_OUT 지정 시 결과를 JSON 한 줄로 추가 기록(회귀 추적용)
+
+실행(레포 루트, .env 필요):
+    uv run python -m scripts.bench_startup [반복 횟수=5]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import time
+
+from tortoise import Tortoise
+
+from app.core.db import warm_up_pools
+from app.core.startup import startup
+
+BENCH_DSN = os.getenv("BENCH_DSN", "sqlite:///tmp/bench_startup.sqlite3")
+BENCH_OUT = os.getenv("BENCH_OUT", "")
+
+# 앞쪽 모듈은 뒤쪽 모듈의 일부 → 차이로 무게 파악
+IMPORT_TARGETS = (
+    "app.core.config",
+    "tortoise",
+    "app.core.security",
+    "app.features.auth.service",
+    "app.main",
+)
+
+
+def _cold_import_seconds(module: str, repeat: int) -> float:
+    code = f"import time; s = time.perf_counter(); import {module}; print(time.perf_counter() - s)"
+    runs = []
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", code], check=True, capture_output=True, text=True
+        ).stdout
+        runs.append(float(out.strip().splitlines()[-1]))
+    return min(runs)
+
+
+async def _init_phases() -> dict[str, float]:
+    config = {
+        "connections": {"default": BENCH_DSN},
+        "apps": {
+            "models": {
+                "models": ["app.features.auth.models", "app.features.users.models"],
+                "default_connection": "default",
+            },
+        },
+    }
+    with startup.phase("db_init"):
+        await Tortoise.init(config=config)
+    try:
+        with startup.phase("generate_schemas"):
+            await Tortoise.generate_schemas(safe=True)
+        with startup.phase("pool_warmup"):
+            await warm_up_pools()
+    finally:
+        await Tortoise.close_connections()
+    return dict(startup.phases)
+
+
+def main(repeat: int = 5) -> None:
+    imports = {m: _cold_import_seconds(m, repeat) for m in IMPORT_TARGETS}
+    phases = asyncio.run(_init_phases())
+
+    for name, sec in imports.items():
+        print(f"import  {name:<28} {sec * 1000:8.1f} ms")
+    for name, sec in phases.items():
+        print(f"phase   {name:<28} {sec * 1000:8.1f} ms")
+
+    if BENCH_OUT:
+        record = {"ts": time.time(), "imports": imports, "phases": phases}
+        with open(BENCH_OUT, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,45 @@
+"""
+JWT 검증 캐시 마이크로 벤치마크 (캐시 적중 vs 매번 디코드+HMAC)
+
+실행(레포 루트, .env 필요):
+    uv run python -m scripts.bench_token_cache [반복 횟수]
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+
+import jwt
+
+from app.core.config import settings
+from app.features.auth.tokens import ALGO, create_access_token, decode_jwt, forget_token
+
+
+def _rate(n: int, elapsed: float) -> str:
+    return f"{n / elapsed:>12,.0f} ops/s  ({elapsed / n * 1e6:6.2f} µs/op)"
+
+
+def main(n: int = 200_000) -> None:
+    token, _, _ = create_access_token("00000000-0000-0000-0000-000000000000")
+
+    # 기준선: 캐시 없이 PyJWT 직접 검증
+    start = time.perf_counter()
+    for _ in range(n):
+        jwt.decode(token, settings.JWT_SECRET, algorithms=[ALGO])
+    uncached = time.perf_counter() - start
+
+    # 캐시 경유(첫 호출만 실제 검증)
+    forget_token(token)
+    start = time.perf_counter()
+    for _ in range(n):
+        decode_jwt(token)
+    cached = time.perf_counter() - start
+
+    print(f"uncached  {_rate(n, uncached)}")
+    print(f"cached    {_rate(n, cached)}")
+    print(f"speedup   {uncached / cached:>12.1f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,101 @@
+"""
+사용자 조회/검색 벤치마크 (인덱스 조회 vs 기존 icontains OR 전체 스캔)
+
+- users 테이블에 N명을 시드하고 n-gram 검색 색인을 재구성한 뒤 측정
+- BENCH_DSN 미지정 시 임시 SQLite 파일 사용(MySQL은 mysql://... 지정, 빈 DB 권장)
+
+실행(레포 루트, .env 필요):
+    uv run python -m scripts.bench_user_search [행 수=1000000] [반복 횟수=50]
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import os
+import random
+import sys
+import time
+import uuid
+
+from tortoise import Tortoise
+from tortoise.expressions import Q
+
+from app.features.users.models import User
+from app.features.users.repository import UsersRepository
+from app.features.users.search import rebuild_search_index
+
+BENCH_DSN = os.getenv("BENCH_DSN", "sqlite:///tmp/bench_users.sqlite3")
+SEED_BATCH = 5000
+
+
+async def _seed(n: int) -> None:
+    existing = await User.all().count()
+    for start in range(existing, n, SEED_BATCH):
+        rows = []
+        for i in range(start, min(start + SEED_BATCH, n)):
+            u = uuid.uuid4()
+            rows.append(
+                User(
+                    id=u,
+                    id_bin_hex=u.hex,
+                    username=f"user{i:07d}",
+                    email=f"user{i:07d}@example.com",
+                    phone_number=f"010{i:08d}",
+                    password_hash="x",
+                )
+            )
+        await User.bulk_create(rows)
+    if existing < n:
+        started = time.perf_counter()
+        await rebuild_search_index(batch_size=5000)
+        print(f"seeded {n - existing:,} rows, indexed in {time.perf_counter() - started:.1f}s")
+
+
+async def _time(label: str, runs: int, fn: Callable[[], Awaitable[object]]) -> None:
+    started = time.perf_counter()
+    for _ in range(runs):
+        await fn()
+    elapsed = time.perf_counter() - started
+    print(f"{label:<28} {elapsed / runs * 1e3:9.2f} ms/op")
+
+
+async def _legacy_search(keyword: str) -> None:
+    qs = User.filter(
+        Q(username__icontains=keyword)
+        | Q(email__icontains=keyword)
+        | Q(phone_number__icontains=keyword)
+    ).order_by("-created_at")
+    await qs.count()
+    await qs.limit(20)
+
+
+async def main(n: int, runs: int) -> None:
+    await Tortoise.init(
+        db_url=BENCH_DSN,
+        modules={"models": ["app.features.auth.models", "app.features.users.models"]},
+    )
+    try:
+        await Tortoise.generate_schemas(safe=True)
+        await _seed(n)
+
+        repo = UsersRepository()
+        pick = random.Random(0)
+
+        def name() -> str:
+            return f"user{pick.randrange(n):07d}"
+
+        await _time("get_by_username (unique)", runs, lambda: repo.get_by_username(name()))
+        await _time(
+            "get_by_email (unique)", runs, lambda: repo.get_by_email(f"{name()}@example.com")
+        )
+        await _time("search (n-gram index)", runs, lambda: repo.search(keyword=name()))
+        await _time("search (icontains scan)", max(1, runs // 10), lambda: _legacy_search(name()))
+    finally:
+        await Tortoise.close_connections()
+
+
+if __name__ == "__main__":
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    asyncio.run(main(rows, runs))
@@ -0,0 +1,24 @@
+"""
+이 장비에서 목표 검증 시간에 맞는 bcrypt rounds 산출
+
+실행(레포 루트, .env 필요):
+    uv run python -m scripts.calibrate_bcrypt [목표 ms]
+
+출력된 값을 PASSWORD_BCRYPT_ROUNDS로 고정하면 시작 시 보정을 건너뛴다.
+"""
+
+from __future__ import annotations
+
+import sys
+
+from app.core.config import settings
+from app.core.security import calibrate_bcrypt_rounds
+
+
+def main(target_ms: float) -> None:
+    rounds = calibrate_bcrypt_rounds(target_ms)
+    print(f"target {target_ms:.0f} ms → PASSWORD_BCRYPT_ROUNDS={rounds}")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else settings.PASSWORD_HASH_TARGET_MS)
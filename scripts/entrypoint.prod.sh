@@ -0,0 +1,9 @@
+#!/bin/sh
+set -e
+
+# 스키마 마이그레이션(커밋된 migrations/ 적용, 이미 적용된 버전은 건너뜀)
+# 워커가 뜨기 전에 단일 프로세스로 한 번만 실행
+uv run --no-sync aerich upgrade
+
+# 런처 실행(exec: SIGTERM이 런처로 직접 전달되어 graceful shutdown)
+exec uv run --no-sync python -m app.server
@@ -1,3 +1,8 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from fastapi import Request
 from fastapi.testclient import TestClient
 import pytest
 
@@ -7,8 +12,53 @@ try:
 except Exception:
     pytest.skip("app.main.app import failed", allow_module_level=True)
 
+from tortoise import Tortoise
+
+T = TypeVar("T")
+RunDB = Callable[[Callable[[], Awaitable[T]]], T]
+
+# 리포지토리 테스트용 인메모리 SQLite (aerich 모델 제외)
+TEST_TORTOISE_ORM = {
+    "connections": {"default": "sqlite://:memory:"},
+    "apps": {
+        "models": {
+            "models": ["app.features.auth.models", "app.features.users.models"],
+            "default_connection": "default",
+        },
+    },
+}
+
 
 @pytest.fixture(scope="session")
 def client() -> TestClient:
     # CI에서 DB 연결이 없어도 /health는 통과하도록 구성
     return TestClient(app)
+
+
+@pytest.fixture
+def run_db() -> RunDB:
+    """스키마가 생성된 빈 SQLite DB 위에서 코루틴을 실행"""
+
+    def runner(scenario: Callable[[], Awaitable[T]]) -> T:
+        async def main() -> T:
+            await Tortoise.init(config=TEST_TORTOISE_ORM)
+            await Tortoise.generate_schemas()
+            try:
+                return await scenario()
+            finally:
+                await Tortoise.close_connections()
+
+        return asyncio.run(main())
+
+    return runner
+
+
+@pytest.fixture
+def get_request() -> Callable[..., Request]:
+    """If-None-Match(선택)만 담은 GET 요청(라우터/헬퍼 직접 호출용)"""
+
+    def make(if_none_match: str | None = None) -> Request:
+        headers = [] if if_none_match is None else [(b"if-none-match", if_none_match.encode())]
+        return Request({"type": "http", "method": "GET", "headers": headers})
+
+    return make
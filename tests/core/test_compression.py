@@ -0,0 +1,91 @@
+import asyncio
+import gzip
+import zlib
+
+import zstandard
+
+from app.core.compression import CompressionMiddleware
+from app.core.http_metrics import ASGIApp, Message, Receive, Scope, Send
+
+GZIP = [(b"accept-encoding", b"gzip")]
+
+
+def _call(app: ASGIApp, headers: list[tuple[bytes, bytes]]) -> list[Message]:
+    sent: list[Message] = []
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b""}
+
+    async def send(message: Message) -> None:
+        sent.append(message)
+
+    mw = CompressionMiddleware(app, min_size=100, gzip_level=6, zstd_level=3)
+    asyncio.run(mw({"type": "http", "method": "GET", "headers": headers}, receive, send))
+    return sent
+
+
+def _single(body: bytes, content_type: bytes = b"application/json") -> ASGIApp:
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        headers = [
+            (b"content-type", content_type),
+            (b"content-length", str(len(body)).encode()),
+            (b"etag", b'"v1"'),
+        ]
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+    return app
+
+
+def test_large_body_is_gzipped_with_updated_headers():
+    body = b'{"items": []}' * 100
+    start, msg = _call(_single(body), GZIP)
+    headers = dict(start["headers"])
+    assert headers[b"content-encoding"] == b"gzip"
+    assert headers[b"vary"] == b"Accept-Encoding"
+    assert headers[b"etag"] == b'W/"v1"'
+    assert int(headers[b"content-length"]) == len(msg["body"])
+    assert gzip.decompress(msg["body"]) == body
+
+
+def test_zstd_is_preferred_when_accepted():
+    body = b'{"items": []}' * 100
+    start, msg = _call(_single(body), [(b"accept-encoding", b"gzip, zstd")])
+    assert dict(start["headers"])[b"content-encoding"] == b"zstd"
+    assert zstandard.ZstdDecompressor().decompressobj().decompress(msg["body"]) == body
+
+
+def test_small_body_and_missing_accept_encoding_pass_through():
+    start, msg = _call(_single(b"{}"), GZIP)
+    assert b"content-encoding" not in dict(start["headers"])
+    assert msg["body"] == b"{}"
+
+    start, msg = _call(_single(b"x" * 1000), [])
+    assert b"content-encoding" not in dict(start["headers"])
+
+
+def test_already_compressed_content_is_skipped():
+    start, _ = _call(_single(b"\x89PNG" * 100, b"image/png"), GZIP)
+    assert b"content-encoding" not in dict(start["headers"])
+
+
+def test_streaming_body_is_flushed_per_chunk():
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        headers = [(b"content-type", b"text/event-stream")]
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        for i in range(3):
+            chunk = b"data: %d\n\n" % i
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+
+    start, *chunks = _call(app, GZIP)
+    assert dict(start["headers"])[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in dict(start["headers"])
+
+    # 각 청크는 받자마자 그 자체로 해제 가능(다음 청크를 기다리지 않음)
+    d = zlib.decompressobj(31)
+    events = [d.decompress(c["body"]) for c in chunks[:3]]
+    assert events == [b"data: 0\n\n", b"data: 1\n\n", b"data: 2\n\n"]
+    assert chunks[-1]["more_body"] is False
+    d.decompress(chunks[-1]["body"])
+    assert d.eof
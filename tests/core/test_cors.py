@@ -0,0 +1,75 @@
+import asyncio
+
+from app.core.cors import CORSMiddleware
+from app.core.http_metrics import Message, Receive, Scope, Send
+
+ORIGIN = b"https://app.example.com"
+
+
+def _call(headers: list[tuple[bytes, bytes]], method: str = "GET") -> tuple[list[Message], bool]:
+    sent: list[Message] = []
+    reached = False
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        nonlocal reached
+        reached = True
+        await send(
+            {"type": "http.response.start", "status": 200, "headers": [(b"vary", b"Accept")]}
+        )
+        await send({"type": "http.response.body", "body": b"{}"})
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b""}
+
+    async def send(message: Message) -> None:
+        sent.append(message)
+
+    mw = CORSMiddleware(app, allow_origins=["https://app.example.com/"], max_age=600)
+    scope = {"type": "http", "method": method, "headers": headers}
+    asyncio.run(mw(scope, receive, send))
+    return sent, reached
+
+
+def test_request_without_origin_is_untouched():
+    sent, reached = _call([(b"accept", b"*/*")])
+    assert reached
+    assert sent[0]["headers"] == [(b"vary", b"Accept")]
+
+
+def test_allowed_origin_is_echoed_with_credentials():
+    sent, _ = _call([(b"origin", ORIGIN)])
+    headers = dict(sent[0]["headers"])
+    assert headers[b"access-control-allow-origin"] == ORIGIN
+    assert headers[b"access-control-allow-credentials"] == b"true"
+    assert headers[b"vary"] == b"Accept, Origin"
+
+
+def test_disallowed_origin_gets_no_cors_headers():
+    sent, reached = _call([(b"origin", b"https://evil.example.com")])
+    assert reached
+    assert b"access-control-allow-origin" not in dict(sent[0]["headers"])
+
+
+def test_preflight_is_answered_with_max_age():
+    sent, reached = _call(
+        [
+            (b"origin", ORIGIN),
+            (b"access-control-request-method", b"POST"),
+            (b"access-control-request-headers", b"authorization"),
+        ],
+        method="OPTIONS",
+    )
+    assert not reached
+    assert sent[0]["status"] == 200
+    headers = dict(sent[0]["headers"])
+    assert headers[b"access-control-max-age"] == b"600"
+    assert headers[b"access-control-allow-headers"] == b"authorization"
+
+
+def test_preflight_from_disallowed_origin_is_rejected():
+    sent, reached = _call(
+        [(b"origin", b"https://evil.example.com"), (b"access-control-request-method", b"GET")],
+        method="OPTIONS",
+    )
+    assert not reached
+    assert sent[0]["status"] == 400
@@ -0,0 +1,71 @@
+import asyncio
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from app.core import db
+from app.core.config import tortoise_connection
+from app.features.auth.models import ApiKey, RefreshToken, Session
+from app.features.users.models import User, UserSearchToken
+
+
+class FakeDriverPool:
+    maxsize = 2
+
+    def __init__(self) -> None:
+        self.free = ["c1", "c2"]
+        self.size = 2
+
+    @property
+    def freesize(self) -> int:
+        return len(self.free)
+
+    async def acquire(self) -> str:
+        while not self.free:
+            await asyncio.sleep(0.01)
+        return self.free.pop()
+
+    def release(self, conn: str) -> None:
+        self.free.append(conn)
+
+
+def test_instrumented_pool_reports_usage_and_timeouts():
+    pool = db.InstrumentedPool("test", FakeDriverPool(), acquire_timeout=0.05)
+    timeouts = db.POOL_ACQUIRE_TIMEOUTS.value
+
+    async def scenario() -> None:
+        a = await pool.acquire()
+        await pool.acquire()
+        assert pool.stats() == {"size": 2, "in_use": 2, "idle": 0, "max_size": 2, "waiting": 0}
+
+        with pytest.raises(TimeoutError):
+            await pool.acquire()
+        pool.release(a)  # 나머지 속성은 드라이버 풀로 위임
+        assert await pool.acquire() == a
+
+    asyncio.run(scenario())
+    assert db.POOL_ACQUIRE_TIMEOUTS.value == timeouts + 1
+    assert db.pool_stats()["pools"]["test"]["in_use"] == 2
+
+
+def test_tortoise_connection_applies_pool_settings_to_mysql_only():
+    conn = tortoise_connection("mysql://u:p@db:3306/app")
+    assert isinstance(conn, dict)
+    assert conn["engine"] == "app.core.db_backend"
+    assert {"minsize", "maxsize", "pool_recycle", "connect_timeout"} <= conn["credentials"].keys()
+    assert tortoise_connection("sqlite://:memory:") == "sqlite://:memory:"
+
+
+def test_committed_migrations_create_every_model_table():
+    # 운영 이미지는 generate_schemas 없이 aerich upgrade만 실행 → 모델 추가 시 마이그레이션 누락 방지
+    sql = ""
+    for path in sorted(Path("migrations/models").glob("*.py")):
+        spec = importlib.util.spec_from_file_location(path.stem, path)
+        assert spec is not None and spec.loader is not None
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        sql += asyncio.run(module.upgrade(None))
+
+    for model in (User, UserSearchToken, ApiKey, RefreshToken, Session):
+        assert f"CREATE TABLE IF NOT EXISTS `{model._meta.db_table}`" in sql
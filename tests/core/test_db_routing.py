@@ -0,0 +1,108 @@
+import asyncio
+from pathlib import Path
+import uuid
+
+from tortoise import Tortoise, connections
+from tortoise.transactions import in_transaction
+from tortoise.utils import get_schema_sql
+
+from app.core.db_routing import force_primary, mark_write
+from app.features.users.models import User
+from app.features.users.repository import UsersRepository
+from app.features.users.schemas import UserUpdate
+from app.features.users.service import UsersService
+
+
+async def _add_user(username: str, db: str, uid: uuid.UUID | None = None) -> None:
+    u = uid or uuid.uuid4()
+    await User.create(
+        id=u,
+        id_bin_hex=u.hex,
+        username=username,
+        email=f"{username}@example.com",
+        phone_number="010",
+        password_hash="x",
+        using_db=Tortoise.get_connection(db),
+    )
+
+
+async def _init_primary_and_replica(tmp_path: Path) -> None:
+    await Tortoise.init(
+        config={
+            "connections": {
+                "default": f"sqlite://{tmp_path / 'primary.sqlite3'}",
+                "replica": f"sqlite://{tmp_path / 'replica.sqlite3'}",
+            },
+            "apps": {
+                "models": {
+                    "models": ["app.features.auth.models", "app.features.users.models"],
+                    "default_connection": "default",
+                }
+            },
+        }
+    )
+    await Tortoise.generate_schemas()
+    schema = get_schema_sql(Tortoise.get_connection("default"), safe=True)
+    await Tortoise.get_connection("replica").execute_script(schema)
+
+
+async def _close() -> None:
+    await Tortoise.close_connections()
+    # Tortoise는 init 간 연결 설정을 병합하므로 다른 테스트로 replica가 새지 않게 제거
+    connections.db_config.pop("replica", None)
+
+
+def test_reads_go_to_replica_until_the_request_writes(tmp_path: Path):
+    async def request_without_write(repo: UsersRepository) -> tuple[bool, bool, bool]:
+        on_replica = await repo.get_by_username("replica-only") is not None
+        forced = await repo.get_by_username("replica-only", primary=True) is not None
+        with force_primary():
+            block = await repo.get_by_username("replica-only") is not None
+        return on_replica, forced, block
+
+    async def request_with_write(repo: UsersRepository) -> bool:
+        mark_write()
+        return await repo.get_by_username("replica-only") is not None
+
+    async def scenario() -> None:
+        await _init_primary_and_replica(tmp_path)
+        try:
+            # 복제 지연을 흉내: 같은 사용자가 replica에만 존재
+            await _add_user("replica-only", "replica")
+
+            repo = UsersRepository()
+            # 요청마다 별도 태스크(컨텍스트)
+            assert await asyncio.create_task(request_without_write(repo)) == (True, False, False)
+            assert await asyncio.create_task(request_with_write(repo)) is False
+            # 쓰기 표시는 다른 요청으로 새지 않음
+            assert (await asyncio.create_task(request_without_write(repo)))[0] is True
+
+            async with in_transaction("default"):
+                assert await repo.get_by_username("replica-only") is None
+        finally:
+            await _close()
+
+    asyncio.run(scenario())
+
+
+def test_patch_does_not_write_back_stale_replica_fields(tmp_path: Path):
+    async def scenario() -> None:
+        await _init_primary_and_replica(tmp_path)
+        try:
+            uid = uuid.uuid4()
+            await _add_user("target", "default", uid)
+            await _add_user("target", "replica", uid)
+            # primary에서만 비활성화/강등됨(replica는 아직 이전 값)
+            await User.filter(id=uid).update(is_active=False, role="manager")
+
+            out = await asyncio.create_task(
+                UsersService().update_user(str(uid), UserUpdate(phone_number="011"))
+            )
+            assert out.is_active is False
+
+            row = await User.get(id=uid, using_db=Tortoise.get_connection("default"))
+            assert (row.phone_number, row.is_active, row.role) == ("011", False, "manager")
+        finally:
+            await _close()
+
+    asyncio.run(scenario())
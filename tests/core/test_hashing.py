@@ -0,0 +1,36 @@
+import asyncio
+import threading
+
+from fastapi import HTTPException
+import pytest
+
+from app.core.hashing import PasswordHashPool
+
+
+def test_hash_pool_runs_off_loop():
+    pool = PasswordHashPool(workers=2, max_queue=0)
+    loop_thread = threading.get_ident()
+
+    result = asyncio.run(pool.run(threading.get_ident))
+
+    assert result != loop_thread
+    assert pool.pending == 0
+    pool.shutdown()
+
+
+def test_hash_pool_rejects_when_saturated():
+    pool = PasswordHashPool(workers=1, max_queue=0)
+    gate = threading.Event()
+
+    async def scenario() -> None:
+        blocked = asyncio.create_task(pool.run(gate.wait))
+        await asyncio.sleep(0)
+        with pytest.raises(HTTPException) as exc:
+            await pool.run(str, "x")
+        assert exc.value.status_code == 503
+        assert exc.value.headers == {"Retry-After": "1"}
+        gate.set()
+        await blocked
+
+    asyncio.run(scenario())
+    pool.shutdown()
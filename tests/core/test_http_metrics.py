@@ -0,0 +1,91 @@
+import asyncio
+
+from fastapi.testclient import TestClient
+
+from app.core import metrics
+from app.core.http_metrics import (
+    Message,
+    MetricsMiddleware,
+    Receive,
+    Scope,
+    Send,
+    record_db_query,
+)
+
+
+def test_histogram_renders_cumulative_buckets():
+    h = metrics.Histogram("test_latency_seconds", "test", labelnames=("route",), buckets=(0.1, 1))
+    for v in (0.05, 0.5, 0.5, 3.0):
+        h.observe(v, ("/a",))
+
+    metrics._registry[h.name] = h
+    try:
+        text = metrics.render_prometheus()
+    finally:
+        del metrics._registry[h.name]
+
+    assert 'test_latency_seconds_bucket{route="/a",le="0.1"} 1' in text
+    assert 'test_latency_seconds_bucket{route="/a",le="1"} 3' in text
+    assert 'test_latency_seconds_bucket{route="/a",le="+Inf"} 4' in text
+    assert 'test_latency_seconds_count{route="/a"} 4' in text
+    assert 'test_latency_seconds_sum{route="/a"} 4.05' in text
+
+
+def test_summary_max_is_published_as_separate_gauge():
+    s = metrics.Summary("test_flush_seconds", "test")
+    s.observe(0.25)
+
+    metrics._registry[s.name] = s
+    try:
+        text = metrics.render_prometheus()
+    finally:
+        del metrics._registry[s.name]
+
+    # summary 계열에는 _count/_sum만, 최댓값은 자체 TYPE을 가진 gauge
+    assert (
+        "# TYPE test_flush_seconds summary\n"
+        "test_flush_seconds_count 1\n"
+        "test_flush_seconds_sum 0.25\n"
+        "# HELP test_flush_seconds_max Maximum observed value of test_flush_seconds\n"
+        "# TYPE test_flush_seconds_max gauge\n"
+        "test_flush_seconds_max 0.25\n"
+    ) in text
+
+
+def test_middleware_records_route_template_status_and_db_queries():
+    class Route:
+        path = "/test/{item}"
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        scope["route"] = Route
+        record_db_query(0.002)
+        record_db_query(0.003)
+        await send({"type": "http.response.start", "status": 404, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b""}
+
+    async def send(message: Message) -> None:
+        return None
+
+    mw = MetricsMiddleware(app)
+    scope = {"type": "http", "method": "GET", "path": "/test/1"}
+    asyncio.run(mw(scope, receive, send))
+
+    latency = metrics.histogram("http_request_duration_seconds").series()
+    assert sum(latency[("GET", "/test/{item}", "404")][0]) == 1
+    queries = metrics.counter_vec("http_request_db_queries_total", labelnames=()).series()
+    assert queries[("GET", "/test/{item}")] == 2
+    assert mw.in_flight == 0
+
+
+def test_metrics_endpoint_serves_prometheus_text(client: TestClient):
+    client.get("/health/live")
+    resp = client.get("/metrics")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/plain")
+    assert (
+        'http_request_duration_seconds_count{method="GET",route="/health/live",status="200"}'
+        in (resp.text)
+    )
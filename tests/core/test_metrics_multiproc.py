@@ -0,0 +1,53 @@
+import os
+from pathlib import Path
+import subprocess
+import sys
+
+from app.core import metrics, metrics_multiproc
+
+WORKER = """
+import sys
+from app.core import metrics, metrics_multiproc
+
+directory, requests, clean_exit = sys.argv[1], int(sys.argv[2]), sys.argv[3] == "1"
+metrics.counter("test_mp_requests_total", "test").inc(requests)
+metrics.gauge("test_mp_in_flight", "test").inc(1)
+metrics.histogram("test_mp_latency_seconds", "test", buckets=(0.1,)).observe(0.05)
+metrics_multiproc.write_process_file(directory, alive=not clean_exit)
+"""
+
+
+def _worker(directory: Path, requests: int, *, clean_exit: bool = False) -> None:
+    # 워커 = 별도 프로세스(자기 레지스트리), 실행이 끝나면 교체된 워커와 같음
+    args = [sys.executable, "-c", WORKER, str(directory), str(requests), str(int(clean_exit))]
+    subprocess.run(args, check=True, env={**os.environ, "PYTHONPATH": os.getcwd()})
+
+
+def _value(text: str, sample: str) -> float:
+    for line in text.splitlines():
+        if line.startswith(sample + " "):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"{sample} not in output")
+
+
+def test_counters_stay_monotonic_across_two_workers_and_recycling(tmp_path: Path):
+    metrics_multiproc.reset_directory(str(tmp_path))
+    # 스크레이프를 받는 이 프로세스(살아 있는 워커)
+    metrics.gauge("test_mp_in_flight", "test").inc(2)
+    try:
+        _worker(tmp_path, 3)
+        _worker(tmp_path, 5, clean_exit=True)
+        first = metrics_multiproc.render(str(tmp_path))
+        assert _value(first, "test_mp_requests_total") == 8
+        assert _value(first, 'test_mp_latency_seconds_bucket{le="0.1"}') == 2
+        # 종료된 워커의 게이지는 제외, 살아 있는 워커 것만 합산
+        assert _value(first, "test_mp_in_flight") == 2
+
+        # 요청 상한으로 교체된 새 워커는 0부터 시작해도 합계는 줄지 않음
+        _worker(tmp_path, 1)
+        second = metrics_multiproc.render(str(tmp_path))
+        assert _value(second, "test_mp_requests_total") == 9
+        assert _value(second, "test_mp_latency_seconds_count") == 3
+        assert len(list(tmp_path.glob("*.json"))) == 4
+    finally:
+        metrics._registry.pop("test_mp_in_flight")
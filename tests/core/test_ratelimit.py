@@ -0,0 +1,39 @@
+import asyncio
+
+from app.core.ratelimit import InMemoryTokenBucket, retry_after_seconds
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_token_bucket_allows_burst_then_refills():
+    clock = FakeClock()
+    bucket = InMemoryTokenBucket(max_keys=10, clock=clock)
+
+    async def consume() -> float:
+        return await bucket.consume("k", rate=0.5, burst=2)
+
+    assert asyncio.run(consume()) == 0
+    assert asyncio.run(consume()) == 0
+    wait = asyncio.run(consume())
+    assert wait == 2.0
+    assert retry_after_seconds(wait) == 2
+
+    clock.now = 2.0
+    assert asyncio.run(consume()) == 0
+
+
+def test_token_bucket_is_bounded():
+    bucket = InMemoryTokenBucket(max_keys=2)
+
+    async def scenario() -> None:
+        for key in ("a", "b", "c"):
+            await bucket.consume(key, rate=1, burst=1)
+
+    asyncio.run(scenario())
+    assert len(bucket) == 2
@@ -0,0 +1,25 @@
+import pytest
+
+from app.core.startup import StartupState, backoff_delay
+
+
+def test_backoff_grows_exponentially_up_to_cap():
+    delays = [backoff_delay(n, base=0.5, cap=4.0, rng=lambda: 1.0) for n in range(1, 7)]
+    assert delays == [0.5, 1.0, 2.0, 4.0, 4.0, 4.0]
+
+
+def test_backoff_applies_full_jitter():
+    assert backoff_delay(3, base=0.5, cap=4.0, rng=lambda: 0.25) == 0.5
+    assert backoff_delay(3, base=0.5, cap=4.0, rng=lambda: 0.0) == 0.0
+
+
+def test_startup_phase_accumulates_on_retry():
+    state = StartupState()
+    with state.phase("db_init"):
+        pass
+    with pytest.raises(RuntimeError), state.phase("db_init"):
+        raise RuntimeError("connection refused")
+
+    assert list(state.phases) == ["db_init"]
+    assert state.phases["db_init"] >= 0
+    assert "db_init" in state.summary()
@@ -0,0 +1,293 @@
+import asyncio
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from typing import Any
+import uuid
+
+from fastapi import HTTPException
+import pytest
+
+from app.core import security
+from app.core.config import settings
+from app.core.ratelimit import InMemoryTokenBucket
+from app.core.security import hash_api_key, hash_refresh_token
+from app.core.tasks import drain_spawned
+from app.features.auth import apikeys, tokens
+from app.features.auth.models import ApiKey, RefreshToken, Session
+from app.features.auth.purge import purge_expired_auth_rows
+from app.features.auth.revocation import RevokedJtiSet
+from app.features.auth.schemas import LoginIn
+from app.features.auth.service import AuthService, require_scope
+from app.features.auth.throttle import LoginThrottle
+from app.features.auth.write_behind import write_behind
+from app.features.users.models import User
+from app.features.users.repository import UsersRepository
+
+
+def test_decode_jwt_caches_access_tokens_until_forgotten():
+    token, _, _ = tokens.create_access_token("user-1")
+    key = tokens._token_digest(token)
+
+    claims = tokens.decode_jwt(token)
+    claims["sub"] = "tampered"  # 반환값 수정이 캐시를 오염시키지 않아야 함
+
+    assert tokens.decode_jwt(token)["sub"] == "user-1"
+    assert tokens._verified.get(key) is not None
+
+    tokens.forget_token(token)
+    assert tokens._verified.get(key) is None
+
+
+def test_decode_jwt_skips_cache_for_refresh_tokens():
+    token, _, _ = tokens.create_refresh_token("user-1")
+
+    assert tokens.is_refresh(tokens.decode_jwt(token))
+    assert tokens._verified.get(tokens._token_digest(token)) is None
+
+
+async def _create_user(username: str) -> uuid.UUID:
+    u = uuid.uuid4()
+    await User.create(
+        id=u,
+        id_bin_hex=u.hex,
+        username=username,
+        email=f"{username}@example.com",
+        phone_number="010",
+        password_hash="x",
+    )
+    return u
+
+
+def test_refresh_rotation_allows_single_winner(run_db: Callable[..., Any]):
+    async def scenario() -> None:
+        u = await _create_user("rot")
+        family_id = uuid.uuid4()
+        token, jti, exp = tokens.create_refresh_token(str(u), family_id=family_id)
+        await AuthService.repo_cls.create_refresh_token_row(
+            user_uuid=str(u),
+            jti=jti,
+            token_hash=hash_refresh_token(token),
+            family_id=family_id,
+            expires_at=exp,
+            ip=None,
+            ua=None,
+        )
+
+        svc = AuthService()
+        results = await asyncio.gather(
+            svc.refresh(refresh_token=token),
+            svc.refresh(refresh_token=token),
+            return_exceptions=True,
+        )
+
+        winners = [r for r in results if isinstance(r, tuple)]
+        losers = [r for r in results if isinstance(r, HTTPException)]
+        assert len(winners) == 1 and len(losers) == 1
+        # 재사용 탐지 → family 전체가 철회됨
+        assert not await RefreshToken.filter(family_id=family_id, is_active=True).exists()
+
+    run_db(scenario)
+
+
+def test_write_behind_rows_are_visible_before_flush(
+    run_db: Callable[..., Any], monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(settings, "AUTH_WRITE_BEHIND", True)
+
+    async def scenario() -> None:
+        u = await _create_user("wb")
+        family_id = uuid.uuid4()
+        token, jti, exp = tokens.create_refresh_token(str(u), family_id=family_id)
+        token_hash = hash_refresh_token(token)
+        repo = AuthService.repo_cls
+        await repo.create_session(user_uuid=str(u), jti="s-1", expires_at=exp, ip=None, ua=None)
+        await repo.create_refresh_token_row(
+            user_uuid=str(u),
+            jti=jti,
+            token_hash=token_hash,
+            family_id=family_id,
+            expires_at=exp,
+            ip=None,
+            ua=None,
+        )
+
+        assert write_behind.pending == 2
+        assert not await RefreshToken.exists(token_hash=token_hash)
+        assert await repo.get_refresh_by_hash(token_hash) is not None
+
+        # 로테이션은 버퍼의 행을 먼저 기록한 뒤 CAS 수행
+        await AuthService().refresh(refresh_token=token)
+        assert write_behind.pending == 0
+        assert await Session.exists(jti="s-1")
+        assert await RefreshToken.filter(family_id=family_id).count() == 2
+
+    run_db(scenario)
+
+
+def test_write_behind_drops_only_rows_that_violate_constraints(
+    run_db: Callable[..., Any], monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(settings, "AUTH_WRITE_BEHIND", True)
+
+    async def scenario() -> None:
+        u = await _create_user("wb-dup")
+        exp = datetime.now(UTC) + timedelta(hours=1)
+        repo = AuthService.repo_cls
+        await repo.create_session(user_uuid=str(u), jti="dup", expires_at=exp, ip=None, ua=None)
+        await write_behind.flush()
+        # 이미 기록된 jti와 충돌하는 행 + 정상 행
+        await repo.create_session(user_uuid=str(u), jti="dup", expires_at=exp, ip=None, ua=None)
+        await repo.create_session(user_uuid=str(u), jti="ok", expires_at=exp, ip=None, ua=None)
+
+        assert await write_behind.flush() == 1
+        assert write_behind.pending == 0
+        assert await Session.exists(jti="ok")
+        assert await Session.filter(jti="dup").count() == 1
+
+    run_db(scenario)
+
+
+def test_revoked_jti_set_syncs_live_revocations(run_db: Callable[..., Any]):
+    async def scenario() -> None:
+        u = await _create_user("rev")
+        now = datetime.now(UTC)
+        for jti, expires_at, revoked_at in (
+            ("live", now + timedelta(minutes=5), now),
+            ("expired", now - timedelta(minutes=1), now - timedelta(minutes=2)),
+            ("active", now + timedelta(minutes=5), None),
+        ):
+            await Session.create(user_id=u, jti=jti, expires_at=expires_at, revoked_at=revoked_at)
+
+        revoked = RevokedJtiSet()
+        assert await revoked.sync() == 1
+        assert "live" in revoked
+        assert "expired" not in revoked and "active" not in revoked
+
+        # 이후 철회는 워터마크 기반 증분 동기화로 반영
+        await AuthService.repo_cls.revoke_session_by_jti("active")
+        await revoked.sync()
+        assert "active" in revoked
+
+    run_db(scenario)
+
+
+def test_api_key_lookup_is_cached_and_last_used_is_batched(run_db: Callable[..., Any]):
+    async def scenario() -> None:
+        u = await _create_user("svc")
+        key_hash = hash_api_key("raw-key")
+        api = await ApiKey.create(user_id=u, key_hash=key_hash, scopes=["users:read"])
+
+        first = await apikeys.resolve_api_key(key_hash)
+        second = await apikeys.resolve_api_key(key_hash)
+        assert first is second and first is not None
+        assert first.scopes == ("users:read",)
+
+        # 요청마다 쓰지 않고 flush 시점에 한 번만 기록
+        assert (await ApiKey.get(id=api.id)).last_used_at is None
+        assert await apikeys.flush_last_used() == 1
+        assert (await ApiKey.get(id=api.id)).last_used_at is not None
+
+        assert await apikeys.revoke_api_key(key_hash)
+        assert await apikeys.resolve_api_key(key_hash) is None
+
+    run_db(scenario)
+
+
+def test_api_key_scopes_and_owner_invalidation(run_db: Callable[..., Any]):
+    async def scenario() -> None:
+        u = await _create_user("svc-owner")
+        key_hash = hash_api_key("scoped-key")
+        await ApiKey.create(user_id=u, key_hash=key_hash, scopes=[apikeys.SCOPE_USERS_READ])
+        principal = await apikeys.resolve_api_key(key_hash)
+        assert principal is not None
+
+        request = SimpleNamespace(state=SimpleNamespace(api_key_scopes=principal.scopes))
+        owner = principal.user
+        assert await require_scope(apikeys.SCOPE_USERS_READ)(request, owner) is owner
+        with pytest.raises(HTTPException) as exc:
+            await require_scope(apikeys.SCOPE_USERS_ADMIN)(request, owner)
+        assert exc.value.status_code == 403
+        # JWT 요청(스코프 없음)은 역할 검사에 맡김
+        jwt_request = SimpleNamespace(state=SimpleNamespace())
+        assert await require_scope(apikeys.SCOPE_USERS_ADMIN)(jwt_request, owner) is owner
+
+        # 소유자 비활성화 → 캐시된 키도 즉시 무효
+        await UsersRepository().update_partial(owner, is_active=False)
+        assert await apikeys.resolve_api_key(key_hash) is None
+
+    run_db(scenario)
+
+
+def test_purge_deletes_expired_rows_in_batches(
+    run_db: Callable[..., Any], monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(settings, "PURGE_BATCH_SIZE", 2)
+    monkeypatch.setattr(settings, "PURGE_BATCH_PAUSE_SEC", 0)
+
+    async def scenario() -> None:
+        u = await _create_user("purge")
+        now = datetime.now(UTC)
+        past, future = now - timedelta(minutes=1), now + timedelta(days=1)
+        for i in range(5):
+            await Session.create(user_id=u, jti=f"old-{i}", expires_at=past)
+        # 철회됐지만 미만료 세션은 철회 JTI 동기화용으로 유지
+        await Session.create(user_id=u, jti="revoked-live", expires_at=future, revoked_at=now)
+        for i, (expires_at, revoked_at) in enumerate(
+            ((past, None), (future, now - timedelta(days=30)), (future, None))
+        ):
+            await RefreshToken.create(
+                user_id=u,
+                family_id=uuid.uuid4(),
+                jti=f"r-{i}",
+                token_hash=f"{i:064d}",
+                expires_at=expires_at,
+                revoked_at=revoked_at,
+            )
+
+        assert await purge_expired_auth_rows() == (5, 2)
+        assert await Session.all().values_list("jti", flat=True) == ["revoked-live"]
+        assert await RefreshToken.all().values_list("jti", flat=True) == ["r-2"]
+
+    run_db(scenario)
+
+
+def test_login_rehashes_password_when_cost_changes(
+    run_db: Callable[..., Any], monkeypatch: pytest.MonkeyPatch
+):
+    ctx = security.get_pwd_context().copy()
+    monkeypatch.setattr(security, "get_pwd_context", lambda: ctx)
+
+    async def scenario() -> str:
+        security.apply_bcrypt_rounds(4)
+        u = await _create_user("rehash")
+        await User.filter(id=u).update(password_hash=await security.hash_password("password1"))
+
+        security.apply_bcrypt_rounds(6)
+        await AuthService.login_password(
+            LoginIn(username="rehash@example.com", password="password1")
+        )
+        await drain_spawned()
+        return (await User.get(id=u)).password_hash
+
+    assert run_db(scenario).startswith("$2b$06$")
+
+
+def test_throttled_ip_cannot_drain_another_users_bucket(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(settings, "LOGIN_BURST_PER_IP", 1)
+    monkeypatch.setattr(settings, "LOGIN_BURST_PER_USER", 2)
+    throttle = LoginThrottle(InMemoryTokenBucket(max_keys=100))
+
+    async def scenario() -> None:
+        await throttle.check(ip="6.6.6.6", username="someone")
+        for _ in range(5):
+            with pytest.raises(HTTPException) as exc:
+                await throttle.check(ip="6.6.6.6", username="victim")
+            assert exc.value.status_code == 429
+        # 막힌 IP의 시도는 victim 버킷을 소비하지 않음
+        await throttle.check(ip="1.1.1.1", username="victim")
+        await throttle.check(ip="2.2.2.2", username="victim")
+        with pytest.raises(HTTPException):
+            await throttle.check(ip="3.3.3.3", username="victim")
+
+    asyncio.run(scenario())
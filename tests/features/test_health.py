@@ -1,4 +1,14 @@
+import asyncio
+from typing import Any
+
 from fastapi.testclient import TestClient
+import pytest
+
+from app.core import tasks
+from app.core.config import settings
+from app.core.tasks import PeriodicTask
+from app.features.health import readiness as readiness_module
+from app.features.health.readiness import ReadinessProbe
 
 
 def test_health_endpoint(client: TestClient):
@@ -7,3 +17,54 @@ def test_health_endpoint(client: TestClient):
     assert resp.status_code == 200
     # 선택: body 구조가 있다면 키 체크
     # assert resp.json().get("status") == "ok"
+
+
+def test_liveness_endpoint(client: TestClient):
+    assert client.get("/health/live").json() == {"status": "ok"}
+
+
+def test_readiness_reports_unavailable_before_startup(client: TestClient):
+    # 세션 클라이언트는 lifespan을 실행하지 않으므로 기동 미완료/DB 미초기화
+    resp = client.get("/health/ready")
+    assert resp.status_code == 503
+    checks = resp.json()["checks"]
+    assert checks["startup"]["ok"] is False
+    assert checks["db"]["ok"] is False
+
+
+def test_readiness_probe_caches_and_coalesces():
+    calls = 0
+    now = [0.0]
+
+    async def check() -> dict[str, Any]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return {"status": "ok", "checks": {}}
+
+    probe = ReadinessProbe(ttl=2.0, check=check, clock=lambda: now[0])
+
+    async def scenario() -> None:
+        await asyncio.gather(*(probe.get() for _ in range(20)))
+        assert calls == 1
+        now[0] = 1.0
+        await probe.get()
+        assert calls == 1
+        now[0] = 3.0
+        await probe.get()
+        assert calls == 2
+
+    asyncio.run(scenario())
+
+
+def test_readiness_flags_crashed_and_failing_tasks(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(tasks, "_registry", {})
+    task = PeriodicTask("test-readiness-task", interval=60, fn=lambda: asyncio.sleep(0))
+    monkeypatch.setattr(readiness_module, "all_tasks", lambda: [task])
+
+    assert readiness_module.check_tasks()[0] is True
+    task.consecutive_failures = settings.READINESS_MAX_TASK_FAILURES
+    task.last_error = "OperationalError()"
+    ok, detail = readiness_module.check_tasks()
+    assert ok is False
+    assert detail["failing"] == {"test-readiness-task": "OperationalError()"}
@@ -0,0 +1,254 @@
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from datetime import UTC, datetime, timedelta
+import json
+from typing import Any
+import uuid
+
+from fastapi import HTTPException, Request
+import pytest
+
+from app.core.config import settings
+from app.core.security import apply_bcrypt_rounds, verify_password
+from app.features.auth import router as auth_router
+from app.features.users import router as users_router
+from app.features.users.cache import count_cache, users_total
+from app.features.users.exporter import export_users
+from app.features.users.importer import import_users, iter_lines
+from app.features.users.models import User, UserRole
+from app.features.users.repository import UsersRepository
+from app.features.users.search import rebuild_search_index
+from app.shared.etag import make_etag
+from app.shared.schemas.pagination import decode_cursor, encode_cursor
+
+
+@pytest.fixture(autouse=True)
+def _reset_counts() -> None:
+    # 모듈 전역 카운터/캐시가 테스트마다 새 DB를 보도록 초기화
+    users_total.invalidate()
+    count_cache.clear()
+
+
+async def _seed_users(n: int) -> list[str]:
+    # 동일 created_at 묶음을 섞어 (created_at, id) 타이브레이크까지 검증
+    base = datetime(2024, 1, 1, tzinfo=UTC)
+    ids: list[str] = []
+    for i in range(n):
+        u = uuid.uuid4()
+        user = await User.create(
+            id=u,
+            id_bin_hex=u.hex,
+            username=f"user{i}",
+            email=f"user{i}@example.com",
+            phone_number="010",
+            password_hash="x",
+        )
+        await User.filter(id=u).update(created_at=base + timedelta(minutes=i // 3))
+        ids.append(str(user.id))
+    return ids
+
+
+def test_cursor_roundtrip_and_rejects_garbage():
+    ts = datetime(2024, 1, 1, 12, 0, tzinfo=UTC)
+    assert decode_cursor(encode_cursor(ts, "abc")) == (ts, "abc")
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+def test_keyset_pages_cover_all_users_once_in_order(run_db: Callable[..., Any]):
+    async def scenario() -> None:
+        ids = await _seed_users(10)
+        repo = UsersRepository()
+
+        seen: list[str] = []
+        cursor: str | None = None
+        while True:
+            items, cursor, total, _ = await repo.list_users_keyset(cursor=cursor, limit=4)
+            assert total is None
+            seen.extend(str(u.id) for u in items)
+            if cursor is None:
+                break
+
+        assert sorted(seen) == sorted(ids)
+        rows = await User.all()
+        expected = sorted(rows, key=lambda u: (u.created_at, str(u.id)), reverse=True)
+        assert seen == [str(u.id) for u in expected]
+
+        _, _, total, exact = await repo.list_users_keyset(cursor=None, limit=1, with_total=True)
+        assert (total, exact) == (10, True)
+
+    run_db(scenario)
+
+
+def test_search_uses_ngram_index_and_stays_in_sync(run_db: Callable[..., Any]):
+    async def scenario() -> None:
+        await _seed_users(3)
+        assert await rebuild_search_index(batch_size=2) == 3
+        repo = UsersRepository()
+
+        items, total, _ = await repo.search(keyword="USER1@exa")
+        assert total == 1 and items[0].username == "user1"
+
+        # 3-gram은 모두 있지만 연속 부분 문자열이 아니면 제외
+        _, total, _ = await repo.search(keyword="user2@example.co1")
+        assert total == 0
+
+        user = await User.get(username="user2")
+        await repo.update_partial(user, username="zeta")
+        assert (await repo.search(keyword="zeta"))[1] == 1
+        # 짧은 키워드(n-gram 없음)는 부분 일치: "et"는 zeta 중간에 있음
+        assert (await repo.search(keyword="ze"))[1] == 1
+        assert (await repo.search(keyword="et"))[1] == 1
+        assert (await repo.search(keyword="1@"))[1] == 1
+
+    run_db(scenario)
+
+
+def test_list_totals_come_from_counter_and_count_cache(run_db: Callable[..., Any]):
+    async def scenario() -> None:
+        await _seed_users(3)
+        await rebuild_search_index()
+        repo = UsersRepository()
+
+        assert (await repo.list_users(1, 2))[1:] == (3, True)  # 첫 조회는 COUNT(*)
+        await repo.delete(await User.get(username="user0"))
+        # COUNT(*) 없이 감소 반영, 다른 워커 변경은 빠질 수 있어 추정치로 표시
+        assert (await repo.list_users(1, 2))[1:] == (2, False)
+
+        assert (await repo.search(keyword="user"))[1:] == (2, True)
+        await User.filter(username="user1").delete()
+        # 같은 쿼리 형태는 TTL 동안 캐시된 추정치
+        assert (await repo.search(keyword="user"))[1:] == (2, False)
+
+    run_db(scenario)
+
+
+async def _aiter(items: list[bytes]) -> AsyncIterator[bytes]:
+    for item in items:
+        yield item
+
+
+def test_iter_lines_handles_split_multibyte_and_crlf():
+    async def collect() -> list[str]:
+        data = "이름,a\r\nb\n끝".encode()
+        return [line async for line in iter_lines(_aiter([data[:2], data[2:7], data[7:]]))]
+
+    assert asyncio.run(collect()) == ["이름,a", "b", "끝"]
+
+
+def test_bulk_import_reports_per_row_errors(run_db: Callable[..., Any]):
+    csv_lines = [
+        "username,email,password,phone_number,role",
+        "alice,alice@example.com,password123,010,",
+        "bob,not-an-email,password123,010,",
+        "alice,alice2@example.com,password123,010,",  # 파일 내 중복
+        "carol,carol@example.com,short,010,",
+        "dave,dave@example.com,password123,010,manager",
+        "broken,row",
+    ]
+
+    async def lines(items: list[str]) -> AsyncIterator[str]:
+        for item in items:
+            yield item
+
+    async def scenario() -> None:
+        await _seed_users(1)  # user0 선점
+        report = await import_users(lines(csv_lines), "csv")
+        assert report.created == 2
+        assert {e.line for e in report.errors} == {3, 4, 5, 7}
+
+        ndjson = [
+            '{"username": "user0", "email": "x@example.com", "password": "password123",'
+            ' "phone_number": "010"}',
+            "[]",
+            '{"username": "erin", "email": "erin@example.com", "password": "password123",'
+            ' "phone_number": "010"}',
+        ]
+        report = await import_users(lines(ndjson), "ndjson")
+        assert (report.created, report.failed) == (1, 2)
+
+        dave = await User.get(username="dave")
+        assert dave.role == "manager" and await verify_password("password123", dave.password_hash)
+        assert (await UsersRepository().search(keyword="erin"))[1] == 1
+        assert (await UsersRepository().list_users(1, 1))[1] == 4
+
+    apply_bcrypt_rounds(4)
+    try:
+        run_db(scenario)
+    finally:
+        apply_bcrypt_rounds(12)
+
+
+def test_export_streams_every_user_in_keyset_chunks(
+    run_db: Callable[..., Any], monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(settings, "USER_EXPORT_CHUNK_SIZE", 2)
+
+    async def scenario() -> None:
+        ids = await _seed_users(5)
+        chunks = [c async for c in export_users("ndjson")]
+        assert len(chunks) == 3
+        rows = [json.loads(line) for c in chunks for line in c.decode().splitlines()]
+        assert sorted(r["id"] for r in rows) == sorted(ids)
+        assert "password_hash" not in rows[0]
+
+        csv_text = b"".join([c async for c in export_users("csv")]).decode()
+        assert csv_text.splitlines()[0].startswith("id,username,email")
+        assert len(csv_text.splitlines()) == 6
+
+    run_db(scenario)
+
+
+def test_get_user_etag_comes_from_the_target_row(
+    run_db: Callable[..., Any], get_request: Callable[..., Request]
+):
+    async def scenario() -> None:
+        await _seed_users(2)
+        admin = await User.get(username="user0")
+        admin.role = UserRole.admin
+        target = await User.get(username="user1")
+
+        # 다른 사용자를 조회하면 요청자가 아니라 대상의 본문/ETag
+        resp = await users_router.get_user("user1", admin, get_request())
+        assert json.loads(bytes(resp.body))["username"] == "user1"
+        etag = make_etag(target.id, target.updated_at)
+        assert resp.headers["etag"] == etag
+        resp = await users_router.get_user("user1", admin, get_request(etag))
+        assert resp.status_code == 304
+
+        with pytest.raises(HTTPException) as exc:
+            await users_router.get_user("ghost", admin, get_request())
+        assert exc.value.status_code == 404
+
+    run_db(scenario)
+
+
+def test_self_lookups_reuse_the_authenticated_user(get_request: Callable[..., Request]):
+    ts = datetime(2024, 1, 1, tzinfo=UTC)
+    u = uuid.uuid4()
+    me = User(
+        id=u,
+        id_bin_hex=u.hex,
+        username="me",
+        email="me@example.com",
+        phone_number="010",
+        role=UserRole.user,
+        is_active=True,
+        created_at=ts,
+        updated_at=ts,
+    )
+    etag = make_etag(u, ts)
+
+    async def scenario() -> None:
+        # DB 초기화 없이 호출 → 인증 단계에서 로드된 사용자만으로 응답(추가 쿼리 없음)
+        resp = await auth_router.me(me, get_request())
+        assert resp.headers["etag"] == etag
+        assert json.loads(bytes(resp.body))["username"] == "me"
+        assert (await auth_router.me(me, get_request(etag))).status_code == 304
+
+        resp = await users_router.get_user("me", me, get_request())
+        assert resp.headers["etag"] == etag
+        assert json.loads(bytes(resp.body))["id"] == str(u)
+        assert (await users_router.get_user("me", me, get_request(etag))).status_code == 304
+
+    asyncio.run(scenario())
@@ -0,0 +1,37 @@
+from app.shared.utils.cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_ttl_cache_expires_and_counts():
+    clock = FakeClock()
+    cache: TTLCache[str, int | None] = TTLCache(maxsize=10, ttl=5, clock=clock)
+
+    cache.set("a", 1)
+    cache.set("missing", None, ttl=1)  # 음성 캐시
+
+    assert cache.lookup("a") == (True, 1)
+    assert cache.lookup("missing") == (True, None)
+    clock.now = 2
+    assert cache.lookup("missing") == (False, None)
+    clock.now = 6
+    assert cache.lookup("a") == (False, None)
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert len(cache) == 2
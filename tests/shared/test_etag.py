@@ -0,0 +1,36 @@
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+import uuid
+
+from fastapi import Request
+
+from app.shared.etag import etag_matches, make_etag, not_modified
+
+
+def test_etag_tracks_entity_version():
+    uid = uuid.uuid4()
+    ts = datetime(2024, 1, 1, tzinfo=UTC)
+    etag = make_etag(uid, ts)
+    assert etag.startswith('"') and etag.endswith('"')
+    assert make_etag(uid, ts) == etag
+    assert make_etag(uid, ts + timedelta(microseconds=1)) != etag
+    assert make_etag(uuid.uuid4(), ts) != etag
+
+
+def test_if_none_match_uses_weak_comparison(get_request: Callable[..., Request]):
+    etag = make_etag("id", 1)
+    assert etag_matches(get_request(etag), etag)
+    # 압축 미들웨어가 약한 ETag로 바꿔 보낸 값도 일치
+    assert etag_matches(get_request(f'"other", W/{etag}'), etag)
+    assert etag_matches(get_request("*"), etag)
+    assert not etag_matches(get_request('"other"'), etag)
+    assert not etag_matches(get_request(None), etag)
+
+
+def test_not_modified_has_no_body_and_keeps_validator():
+    etag = make_etag("id", 1)
+    resp = not_modified(etag)
+    assert resp.status_code == 304
+    assert resp.body == b""
+    assert resp.headers["etag"] == etag
+    assert resp.headers["cache-control"] == "private, no-cache"
@@ -0,0 +1,29 @@
+from datetime import UTC, datetime
+import json
+from types import SimpleNamespace
+import uuid
+
+from app.features.users.schemas import UserResponse, UsersListResponse
+from app.features.users.service import _user_list_adapter
+from app.shared.responses import FastJSONResponse, ModelResponse
+
+
+def test_model_response_serializes_validated_models_once():
+    now = datetime(2024, 1, 1, tzinfo=UTC)
+    rows = [
+        SimpleNamespace(
+            id=uuid.UUID(int=i), username=f"u{i}", created_at=now, updated_at=now, is_active=1
+        )
+        for i in range(2)
+    ]
+    items = _user_list_adapter.validate_python(rows)
+    assert all(isinstance(u, UserResponse) for u in items)
+
+    body = json.loads(ModelResponse(UsersListResponse(items=items, total=2)).body)
+    assert body["items"][1]["id"] == str(uuid.UUID(int=1))
+    assert body["items"][0]["is_active"] is True
+    assert body["total_exact"] is True
+
+
+def test_fast_json_response_matches_stdlib_shape():
+    assert json.loads(FastJSONResponse({"a": [1, "두"]}).body) == {"a": [1, "두"]}